@@ -7,12 +7,14 @@ test selection and regression prevention.
 """
 
 import argparse
+import concurrent.futures
 import json
 import os
 import sys
 import subprocess
 import tempfile
 import shutil
+import threading
 import time
 from datetime import datetime
 from typing import Any, List, Dict, Optional
@@ -206,6 +208,8 @@ class GraphRAGCodeSWEAgent:
         self.predictions_dir.mkdir(exist_ok=True)
         self.pred_timestamp: Optional[str] = None
         self.pred_file: Optional[Path] = None
+        self._pred_writer: Optional[jsonlines.Writer] = None
+        self._pred_lock = threading.Lock()
 
     def setup_repository(self, instance: Dict) -> Optional[str]:
         """Set up a repository for testing."""
@@ -239,29 +243,23 @@ class GraphRAGCodeSWEAgent:
                 print(f"Failed to clone repository: {result.stderr}")
                 return None
 
-            # Checkout base commit
-            os.chdir(temp_dir)
+            # Checkout base commit. Run with cwd= instead of os.chdir: the
+            # process working directory is shared across worker threads.
             result = subprocess.run(
                 ["git", "checkout", base_commit],
                 capture_output=True,
-                text=True
+                text=True,
+                cwd=str(temp_dir)
             )
 
             if result.returncode != 0:
                 print(f"Failed to checkout commit: {result.stderr}")
-                os.chdir(str(original_dir))  # Return to original directory
                 return None
 
-            os.chdir(str(original_dir))  # Return to original directory
             return str(temp_dir)
 
         except Exception as e:
             print(f"Error setting up repository: {e}")
-            # Try to return to original directory if possible
-            try:
-                os.chdir(str(original_dir))
-            except Exception as chdir_error:
-                print(f"Warning: Failed to return to original directory: {chdir_error}")
             return None
 
     def build_graph_for_repo(self, repo_path: str, repo_name: str, base_commit: str) -> Dict:
@@ -389,22 +387,19 @@ class GraphRAGCodeSWEAgent:
             List of changed file paths (RELATIVE to repo root)
         """
         try:
-            original_dir = os.getcwd()
-            os.chdir(repo_path)
-
             result = subprocess.run(
                 ["git", "diff", "--name-only", "HEAD"],
                 capture_output=True,
-                text=True
+                text=True,
+                cwd=repo_path
             )
             untracked_result = subprocess.run(
                 ["git", "ls-files", "--others", "--exclude-standard"],
                 capture_output=True,
-                text=True
+                text=True,
+                cwd=repo_path
             )
 
-            os.chdir(original_dir)
-
             if result.returncode == 0:
                 # Git diff returns paths RELATIVE to repo root - keep them as-is!
                 changed_files_raw = [line.strip() for line in result.stdout.splitlines() if line.strip()]
@@ -454,7 +449,6 @@ class GraphRAGCodeSWEAgent:
         print(f"Commit: {base_commit[:8]}")
         print(f"{'='*60}")
 
-        original_dir = os.getcwd()
         graphrag_metadata = {
             "use_graphrag": self.use_graphrag,
             "graph_built": False,
@@ -627,9 +621,8 @@ class GraphRAGCodeSWEAgent:
             # Step 2: Format prompt and execute
             prompt = self.prompt_formatter.format_for_cli(instance)
 
-            os.chdir(repo_path)
-            subprocess.run(["git", "add", "-A"], capture_output=True)
-            subprocess.run(["git", "stash"], capture_output=True)
+            subprocess.run(["git", "add", "-A"], capture_output=True, cwd=repo_path)
+            subprocess.run(["git", "stash"], capture_output=True, cwd=repo_path)
 
             model_info = f" with model {self.model_alias}" if self.model else ""
             graphrag_suffix = " + GraphRAG" if self.use_graphrag else ""
@@ -639,7 +632,6 @@ class GraphRAGCodeSWEAgent:
 
             if not result["success"]:
                 print(f"{self.backend.title()} Code execution failed: {result['stderr']}")
-                os.chdir(original_dir)
                 return {
                     "instance_id": instance_id,
                     "model": self.model_alias or f"{self.backend}-code-graphrag",
@@ -758,11 +750,6 @@ class GraphRAGCodeSWEAgent:
                 "graphrag_metadata": graphrag_metadata
             }
         finally:
-            try:
-                os.chdir(original_dir)
-            except Exception as e:
-                print(f"Warning: Could not restore directory: {e}")
-
             if repo_path and os.path.exists(repo_path):
                 shutil.rmtree(repo_path)
 
@@ -857,11 +844,28 @@ Make minimal changes to fix the tests while preserving your fix for the original
         return prompt
 
     def run_on_dataset(self, dataset_name: str, split: str = "test",
-                      limit: Optional[int] = None) -> List[Dict]:
-        """Run on a full dataset."""
+                      limit: Optional[int] = None,
+                      workers: int = 1) -> List[Dict]:
+        """
+        Run on a full dataset.
+
+        With workers > 1, instances are processed concurrently by a thread
+        pool; the heavy lifting per instance happens in backend
+        subprocesses, so threads are sufficient for overlap. Parallel
+        workers are only supported with GraphRAG disabled: the MCP server
+        holds a single graph per repo@commit identity and clears it when
+        the identity changes, so concurrent instances on a mixed-repo
+        dataset would rebuild the graph out from under each other between
+        one instance's build and its impact queries.
+        """
         print(f"Loading dataset: {dataset_name}")
         dataset = load_cached_dataset(dataset_name, split=split, limit=limit)
 
+        if workers > 1 and self.use_graphrag:
+            print("GraphRAG workers share one graph index; forcing workers=1 "
+                  "(use --no-graphrag to run instances in parallel)")
+            workers = 1
+
         # Clear Neo4j database for fresh experimental run
         if self.use_graphrag and self.mcp:
             print("\n" + "="*60)
@@ -885,12 +889,16 @@ Make minimal changes to fix the tests while preserving your fix for the original
 
         predictions: List[Dict] = []
 
-        for instance in tqdm(dataset, desc="Processing instances"):
-            prediction = self.process_instance(instance)
-            predictions.append(prediction)
+        # Single long-lived writer: each prediction lands on disk as soon as
+        # its instance completes, so a crash loses at most the in-flight
+        # instance and the evaluator can consume partial files safely.
+        self._pred_writer = jsonlines.open(self.pred_file, mode='w', flush=True)
 
-            # Save prediction incrementally
-            self._save_predictions(prediction)
+        try:
+            predictions = self._run_instances(dataset, workers)
+        finally:
+            self._pred_writer.close()
+            self._pred_writer = None
 
         # Calculate aggregate GraphRAG stats
         self._print_graphrag_summary(predictions)
@@ -901,6 +909,32 @@ Make minimal changes to fix the tests while preserving your fix for the original
         print(f"\nSaved predictions to {self.pred_file}")
         return predictions
 
+    def _run_instances(self, dataset, workers: int) -> List[Dict]:
+        """Process all instances, optionally in parallel, saving incrementally."""
+        predictions: List[Dict] = []
+
+        if workers > 1:
+            print(f"Processing {len(dataset)} instances with {workers} parallel workers")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self.process_instance, instance)
+                           for instance in dataset]
+                for future in tqdm(concurrent.futures.as_completed(futures),
+                                   total=len(futures), desc="Processing instances"):
+                    prediction = future.result()
+                    predictions.append(prediction)
+
+                    # Save prediction incrementally
+                    self._save_predictions(prediction)
+        else:
+            for instance in tqdm(dataset, desc="Processing instances"):
+                prediction = self.process_instance(instance)
+                predictions.append(prediction)
+
+                # Save prediction incrementally
+                self._save_predictions(prediction)
+
+        return predictions
+
     def run_on_instance(self, instance_id: str, dataset_name: str = "princeton-nlp/SWE-bench_Lite") -> Dict:
         """Run on a single instance by ID."""
         dataset = load_cached_dataset(dataset_name, split="test", instance_id=instance_id)
@@ -911,8 +945,13 @@ Make minimal changes to fix the tests while preserving your fix for the original
         if not self.pred_file:
             raise ValueError("Prediction timestamp not initialized. Call run_on_dataset first.")
 
-        with jsonlines.open(self.pred_file, mode='a') as writer:
-            writer.write(prediction)
+        with self._pred_lock:
+            if self._pred_writer is not None:
+                self._pred_writer.write(prediction)
+            else:
+                # Fallback for callers outside run_on_dataset (e.g. single-instance runs)
+                with jsonlines.open(self.pred_file, mode='a') as writer:
+                    writer.write(prediction)
 
     def _print_graphrag_summary(self, predictions: List[Dict]):
         """Print summary of GraphRAG performance."""
@@ -1013,6 +1052,10 @@ def main():
                        help="Extra retry budget for infra-unreliable strict TDD pytest checks")
     parser.add_argument("--indexed-signal-mode", type=str, choices=["attempted_query", "successful_query"],
                        help="How indexed-search usage is counted for graph guard")
+    parser.add_argument("--workers", type=int,
+                       default=min(8, os.cpu_count() or 1),
+                       help="Parallel instance workers; >1 only takes effect with "
+                            "--no-graphrag (default: min(8, cpu_count))")
 
     args = parser.parse_args()
 
@@ -1125,7 +1168,8 @@ def main():
             print(f"Prediction saved: {prediction}")
         else:
             print(f"Running on dataset: {args.dataset_name}")
-            predictions = agent.run_on_dataset(args.dataset_name, limit=args.limit)
+            predictions = agent.run_on_dataset(args.dataset_name, limit=args.limit,
+                                               workers=max(1, args.workers))
             print(f"Processed {len(predictions)} instances")
     finally:
         agent.cleanup()
@@ -155,7 +155,7 @@ class PredictionEvaluator:
         return "unknown"
     
     def evaluate_file(self, prediction_file: Path, dataset_name="princeton-nlp/SWE-bench_Lite",
-                      max_workers=2, update_log=True, force=False) -> Tuple[Optional[float], float, str, Optional[str]]:
+                      max_workers=None, update_log=True, force=False) -> Tuple[Optional[float], float, str, Optional[str]]:
         """Evaluate a single prediction file"""
         print(f"\n{'='*70}")
         print(f"Evaluating: {prediction_file.name}")
@@ -10,24 +10,58 @@ Provides utilities for:
 """
 
 import json
-import statistics
+import re
+import shutil
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-
-@dataclass
+from typing import Dict, List, Optional, TextIO, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Below this many patches the numpy array conversion costs more than the
+# vectorized reductions save; stick to the pure-Python path.
+_NUMPY_STATS_MIN = 500
+
+# Error classification: one compiled scan instead of a chain of substring
+# checks per errored prediction. The matching group name is the bucket.
+_ERROR_RE = re.compile(
+    r"(?P<RepositorySetup>Failed to set up repository)"
+    r"|(?P<ExecutionFailed>Execution failed)"
+)
+_ERROR_BUCKETS = {
+    "RepositorySetup": "Repository Setup",
+    "ExecutionFailed": "Execution Failed",
+}
+
+# YYYYMMDD_HHMMSS timestamp embedded in prediction filenames
+_TIMESTAMP_RE = re.compile(r"(\d{8}_\d{6})")
+
+
+@dataclass(slots=True)
 class ExperimentResults:
     """Results from a single experiment run"""
     name: str  # "Baseline", "TDD", "GraphRAG"
     dataset: str
     num_instances: int
     generation_rate: float  # % of instances with non-empty patches
-    predictions: List[Dict]
     prediction_file: Path
     timestamp: str
 
+    # Raw parsed records; only retained when parse_predictions is called with
+    # keep_predictions=True, since all downstream consumers read scalar metrics.
+    predictions: Optional[List[Dict]] = None
+
     # Execution metrics
     total_time: Optional[float] = None  # seconds
     avg_time_per_instance: Optional[float] = None
@@ -45,7 +79,7 @@ class ExperimentResults:
     graphrag_metadata: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonReport:
     """Comparison of multiple experiments"""
     experiments: List[ExperimentResults]
@@ -72,57 +106,116 @@ class ExperimentAnalyzer:
         self.predictions_dir = self.base_dir / "predictions"
         self.results_dir = self.base_dir / "results"
 
-    def parse_predictions(self, prediction_file: Path, experiment_name: str) -> ExperimentResults:
+    def parse_predictions(self, prediction_file: Path, experiment_name: str,
+                          keep_predictions: bool = False) -> ExperimentResults:
         """
         Parse a prediction JSONL file and extract metrics.
 
         Args:
             prediction_file: Path to predictions JSONL file
             experiment_name: Name of the experiment (Baseline, TDD, GraphRAG)
+            keep_predictions: Retain the raw prediction dicts on the result
+                (all metrics are precomputed, so this is off by default)
 
         Returns:
-            ExperimentResults with parsed data and calculated metrics
+            ExperimentResults with calculated metrics
         """
-        predictions = []
-
-        with open(prediction_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    predictions.append(json.loads(line))
-
-        # Calculate generation rate
-        non_empty_patches = sum(1 for p in predictions if p.get("prediction", "").strip())
-        generation_rate = (non_empty_patches / len(predictions) * 100) if predictions else 0
+        # Binary mode skips the text decoder; orjson (when available) decodes
+        # UTF-8 and parses in one step, which dominates on large JSONL files.
+        with open(prediction_file, 'rb') as f:
+            predictions = [_json_loads(line) for line in f if line.strip()]
+
+        # Single fused pass over predictions: generation rate, error
+        # categorization, patch sizes and GraphRAG accumulators all come from
+        # one traversal instead of one list walk per metric.
+        collect_graphrag = experiment_name == "GraphRAG"
+        non_empty_patches = 0
+        num_errors = 0
+        error_types = Counter()
+        # Pre-sized to the known upper bound (every prediction has a patch)
+        # so the loop writes by index instead of growing the list; trimmed
+        # to the actual count after the pass.
+        patch_sizes = [0] * len(predictions)
+        sum_patches = 0
+        max_patch_size = 0
+
+        # GraphRAG accumulators
+        meta_count = 0
+        graphs_built = 0
+        sum_build_time = 0.0
+        sum_impact_time = 0.0
+        sum_tests = 0
+        min_tests = None
+        max_tests = None
 
-        # Count errors
-        num_errors = sum(1 for p in predictions if p.get("error"))
-        error_types = {}
-        for p in predictions:
-            if p.get("error"):
-                error_msg = str(p["error"])
-                # Categorize errors
-                if "Failed to set up repository" in error_msg:
-                    error_types["Repository Setup"] = error_types.get("Repository Setup", 0) + 1
-                elif "Execution failed" in error_msg:
-                    error_types["Execution Failed"] = error_types.get("Execution Failed", 0) + 1
-                else:
-                    error_types["Other"] = error_types.get("Other", 0) + 1
-
-        # Calculate patch metrics
-        patch_sizes = []
         for p in predictions:
             patch = p.get("prediction", "")
-            if patch and patch.strip():
-                patch_sizes.append(len(patch))
+            # isspace() is the same non-blank test as strip() without
+            # allocating a stripped copy of a multi-KB patch.
+            if patch and not patch.isspace():
+                size = len(patch)
+                patch_sizes[non_empty_patches] = size
+                non_empty_patches += 1
+                sum_patches += size
+                if size > max_patch_size:
+                    max_patch_size = size
+
+            error = p.get("error")
+            if error:
+                num_errors += 1
+                m = _ERROR_RE.search(str(error))
+                bucket = _ERROR_BUCKETS[m.lastgroup] if m else "Other"
+                error_types[bucket] += 1
+
+            if collect_graphrag:
+                meta = p.get("graphrag_metadata")
+                if meta:
+                    meta_count += 1
+                    if meta.get("graph_built"):
+                        graphs_built += 1
+                        sum_build_time += meta.get("graph_build_time", 0)
+                    sum_impact_time += meta.get("impact_analysis_time", 0)
+                    tests_found = meta.get("impacted_tests_found", 0)
+                    sum_tests += tests_found
+                    if min_tests is None or tests_found < min_tests:
+                        min_tests = tests_found
+                    if max_tests is None or tests_found > max_tests:
+                        max_tests = tests_found
+
+        generation_rate = (non_empty_patches / len(predictions) * 100) if predictions else 0
 
-        avg_patch_size = int(statistics.mean(patch_sizes)) if patch_sizes else 0
-        median_patch_size = int(statistics.median(patch_sizes)) if patch_sizes else 0
-        max_patch_size = max(patch_sizes) if patch_sizes else 0
+        del patch_sizes[non_empty_patches:]
+
+        # Mean and max were accumulated in the loop; median needs one sort
+        # (or, for large runs, numpy's O(n) selection-based median).
+        n_patches = non_empty_patches
+        avg_patch_size = sum_patches // n_patches if n_patches else 0
+        if _np is not None and n_patches >= _NUMPY_STATS_MIN:
+            arr = _np.fromiter(patch_sizes, dtype=_np.int64, count=n_patches)
+            median_patch_size = int(_np.median(arr))
+        elif n_patches:
+            patch_sizes.sort()
+            mid = n_patches // 2
+            if n_patches % 2:
+                median_patch_size = patch_sizes[mid]
+            else:
+                median_patch_size = (patch_sizes[mid - 1] + patch_sizes[mid]) // 2
+        else:
+            median_patch_size = 0
 
-        # Extract GraphRAG metadata if present
+        # Assemble GraphRAG metadata from the accumulators
         graphrag_metadata = None
-        if experiment_name == "GraphRAG":
-            graphrag_metadata = self._extract_graphrag_metadata(predictions)
+        if collect_graphrag:
+            graphrag_metadata = {}
+            if meta_count:
+                graphrag_metadata = {
+                    "total_graphs_built": graphs_built,
+                    "avg_graph_build_time": sum_build_time / graphs_built if graphs_built else 0,
+                    "avg_impacted_tests_found": sum_tests / meta_count,
+                    "avg_impact_analysis_time": sum_impact_time / meta_count,
+                    "max_impacted_tests": max_tests if max_tests is not None else 0,
+                    "min_impacted_tests": min_tests if min_tests is not None else 0
+                }
 
         # Extract timestamp from filename
         timestamp = self._extract_timestamp(prediction_file)
@@ -138,50 +231,21 @@ class ExperimentAnalyzer:
             dataset=dataset,
             num_instances=len(predictions),
             generation_rate=generation_rate,
-            predictions=predictions,
+            predictions=predictions if keep_predictions else None,
             prediction_file=prediction_file,
             timestamp=timestamp,
             avg_patch_size=avg_patch_size,
             median_patch_size=median_patch_size,
             max_patch_size=max_patch_size,
             num_errors=num_errors,
-            error_types=error_types or {},
+            error_types=dict(error_types),
             graphrag_metadata=graphrag_metadata
         )
 
-    def _extract_graphrag_metadata(self, predictions: List[Dict]) -> Dict:
-        """Extract and aggregate GraphRAG metadata from predictions"""
-        metadata_list = [p.get("graphrag_metadata", {}) for p in predictions if p.get("graphrag_metadata")]
-
-        if not metadata_list:
-            return {}
-
-        # Calculate averages
-        graph_build_times = [m.get("graph_build_time", 0) for m in metadata_list if m.get("graph_built")]
-        impacted_tests = [m.get("impacted_tests_found", 0) for m in metadata_list]
-        impact_times = [m.get("impact_analysis_time", 0) for m in metadata_list]
-
-        return {
-            "total_graphs_built": sum(1 for m in metadata_list if m.get("graph_built")),
-            "avg_graph_build_time": statistics.mean(graph_build_times) if graph_build_times else 0,
-            "avg_impacted_tests_found": statistics.mean(impacted_tests) if impacted_tests else 0,
-            "avg_impact_analysis_time": statistics.mean(impact_times) if impact_times else 0,
-            "max_impacted_tests": max(impacted_tests) if impacted_tests else 0,
-            "min_impacted_tests": min(impacted_tests) if impacted_tests else 0
-        }
-
     def _extract_timestamp(self, filename: Path) -> str:
         """Extract timestamp from filename like predictions_YYYYMMDD_HHMMSS.jsonl"""
-        name = filename.stem
-        parts = name.split("_")
-
-        # Look for YYYYMMDD_HHMMSS pattern
-        for i, part in enumerate(parts):
-            if len(part) == 8 and part.isdigit():  # YYYYMMDD
-                if i + 1 < len(parts) and len(parts[i + 1]) == 6 and parts[i + 1].isdigit():  # HHMMSS
-                    return f"{part}_{parts[i + 1]}"
-
-        return "unknown"
+        m = _TIMESTAMP_RE.search(filename.stem)
+        return m.group(1) if m else "unknown"
 
     def compare_experiments(self, results: List[ExperimentResults]) -> ComparisonReport:
         """
@@ -196,21 +260,23 @@ class ExperimentAnalyzer:
         if not results:
             raise ValueError("No results to compare")
 
-        # Sort by generation rate to find best
-        sorted_by_gen = sorted(results, key=lambda r: r.generation_rate, reverse=True)
-        best_generation = sorted_by_gen[0].name
+        # Index experiments by name once; helpers look up instead of scanning
+        by_name = {r.name: r for r in results}
+
+        # Min/max scans instead of sorting: only the extremes are ever read
+        best_gen = max(results, key=lambda r: r.generation_rate)
+        worst_gen = min(results, key=lambda r: r.generation_rate)
+        best_generation = best_gen.name
 
-        # Sort by avg time (if available)
+        # Best avg time (if available)
         results_with_time = [r for r in results if r.avg_time_per_instance is not None]
         if results_with_time:
-            sorted_by_time = sorted(results_with_time, key=lambda r: r.avg_time_per_instance)
-            best_time = sorted_by_time[0].name
+            best_time = min(results_with_time, key=lambda r: r.avg_time_per_instance).name
         else:
             best_time = "N/A"
 
-        # Sort by patch quality (non-empty, reasonable size)
-        sorted_by_patch = sorted(results, key=lambda r: r.avg_patch_size if r.avg_patch_size else 0, reverse=True)
-        best_patch = sorted_by_patch[0].name
+        # Best patch quality (non-empty, reasonable size)
+        best_patch = max(results, key=lambda r: r.avg_patch_size if r.avg_patch_size else 0).name
 
         # Build comparison dictionaries
         gen_rate_comp = {r.name: r.generation_rate for r in results}
@@ -218,13 +284,13 @@ class ExperimentAnalyzer:
         patch_comp = {r.name: r.avg_patch_size for r in results if r.avg_patch_size}
 
         # Determine overall winner
-        winner = self._determine_winner(results, sorted_by_gen)
+        winner = self._determine_winner(by_name, best_gen)
 
         # Generate key findings
-        findings = self._generate_findings(results, sorted_by_gen)
+        findings = self._generate_findings(results, by_name, best_gen, worst_gen)
 
         # Generate recommendations
-        recommendations = self._generate_recommendations(results, winner)
+        recommendations = self._generate_recommendations(results, by_name, winner)
 
         return ComparisonReport(
             experiments=results,
@@ -239,28 +305,27 @@ class ExperimentAnalyzer:
             recommendations=recommendations
         )
 
-    def _determine_winner(self, results: List[ExperimentResults], sorted_by_gen: List[ExperimentResults]) -> str:
+    def _determine_winner(self, by_name: Dict[str, ExperimentResults], best_gen: ExperimentResults) -> str:
         """Determine overall winner based on multiple criteria"""
         # Primary criterion: Generation rate
         # Secondary: Patch quality (size)
         # Tertiary: Speed (if available)
 
-        best = sorted_by_gen[0]
-
         # If GraphRAG is present and has good generation rate, consider its efficiency
-        graphrag = next((r for r in results if r.name == "GraphRAG"), None)
-        if graphrag and graphrag.generation_rate >= best.generation_rate * 0.95:  # Within 5%
+        graphrag = by_name.get("GraphRAG")
+        if graphrag and graphrag.generation_rate >= best_gen.generation_rate * 0.95:  # Within 5%
             return "GraphRAG"
 
-        return best.name
+        return best_gen.name
 
-    def _generate_findings(self, results: List[ExperimentResults], sorted_by_gen: List[ExperimentResults]) -> List[str]:
+    def _generate_findings(self, results: List[ExperimentResults],
+                           by_name: Dict[str, ExperimentResults],
+                           best_gen: ExperimentResults,
+                           worst_gen: ExperimentResults) -> List[str]:
         """Generate key findings from comparison"""
         findings = []
 
         # Generation rate finding
-        best_gen = sorted_by_gen[0]
-        worst_gen = sorted_by_gen[-1]
         diff = best_gen.generation_rate - worst_gen.generation_rate
         findings.append(
             f"{best_gen.name} achieved the highest generation rate ({best_gen.generation_rate:.1f}%), "
@@ -268,23 +333,24 @@ class ExperimentAnalyzer:
         )
 
         # Patch size finding
-        sorted_by_patch = sorted(results, key=lambda r: r.avg_patch_size if r.avg_patch_size else 0, reverse=True)
-        if sorted_by_patch[0].avg_patch_size:
+        best_patch = max(results, key=lambda r: r.avg_patch_size if r.avg_patch_size else 0)
+        if best_patch.avg_patch_size:
             findings.append(
-                f"{sorted_by_patch[0].name} produced the largest patches on average "
-                f"({sorted_by_patch[0].avg_patch_size} chars), suggesting more comprehensive fixes"
+                f"{best_patch.name} produced the largest patches on average "
+                f"({best_patch.avg_patch_size} chars), suggesting more comprehensive fixes"
             )
 
         # Error finding
-        sorted_by_errors = sorted(results, key=lambda r: r.num_errors)
-        if sorted_by_errors[0].num_errors < sorted_by_errors[-1].num_errors:
+        fewest_errors = min(results, key=lambda r: r.num_errors)
+        most_errors = max(results, key=lambda r: r.num_errors)
+        if fewest_errors.num_errors < most_errors.num_errors:
             findings.append(
-                f"{sorted_by_errors[0].name} had the fewest errors ({sorted_by_errors[0].num_errors}), "
+                f"{fewest_errors.name} had the fewest errors ({fewest_errors.num_errors}), "
                 f"indicating better stability"
             )
 
         # GraphRAG-specific finding
-        graphrag = next((r for r in results if r.name == "GraphRAG" and r.graphrag_metadata), None)
+        graphrag = by_name.get("GraphRAG")
         if graphrag and graphrag.graphrag_metadata:
             meta = graphrag.graphrag_metadata
             findings.append(
@@ -294,7 +360,9 @@ class ExperimentAnalyzer:
 
         return findings
 
-    def _generate_recommendations(self, results: List[ExperimentResults], winner: str) -> List[str]:
+    def _generate_recommendations(self, results: List[ExperimentResults],
+                                  by_name: Dict[str, ExperimentResults],
+                                  winner: str) -> List[str]:
         """Generate recommendations based on results"""
         recommendations = []
 
@@ -303,14 +371,14 @@ class ExperimentAnalyzer:
         )
 
         # Find lowest performer
-        sorted_by_gen = sorted(results, key=lambda r: r.generation_rate)
-        if sorted_by_gen[0].generation_rate < 50:
+        worst_gen = min(results, key=lambda r: r.generation_rate)
+        if worst_gen.generation_rate < 50:
             recommendations.append(
-                f"Investigate why {sorted_by_gen[0].name} has low generation rate - may need prompt refinement"
+                f"Investigate why {worst_gen.name} has low generation rate - may need prompt refinement"
             )
 
         # GraphRAG-specific recommendations
-        graphrag = next((r for r in results if r.name == "GraphRAG"), None)
+        graphrag = by_name.get("GraphRAG")
         if graphrag:
             recommendations.append(
                 "Run Docker evaluation to measure actual resolution and regression rates for GraphRAG"
@@ -323,7 +391,7 @@ class ExperimentAnalyzer:
                     )
 
         # TDD-specific recommendations
-        tdd = next((r for r in results if r.name == "TDD"), None)
+        tdd = by_name.get("TDD")
         if tdd and tdd.generation_rate > 0:
             recommendations.append(
                 "Analyze TDD patches to verify they include test files as expected"
@@ -331,122 +399,101 @@ class ExperimentAnalyzer:
 
         return recommendations
 
-    def generate_markdown_report(self, comparison: ComparisonReport) -> str:
-        """Generate a detailed Markdown report from comparison results"""
-        report_lines = []
-
-        # Header
-        report_lines.append("## EXP-005: Full Three-Way Comparison (50 Instances Each)")
-        report_lines.append("")
-        report_lines.append("### Metadata")
-        report_lines.append(f"- **Date**: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        report_lines.append(f"- **Dataset**: SWE-bench_Verified")
-        report_lines.append(f"- **Sample Size**: {comparison.experiments[0].num_instances} instances per experiment")
-        report_lines.append(f"- **Experiments**: {', '.join([e.name for e in comparison.experiments])}")
-        report_lines.append("")
-
-        # Executive Summary
-        report_lines.append("### Executive Summary")
-        report_lines.append("")
-        report_lines.append(f"**Winner**: 🏆 **{comparison.winner}**")
-        report_lines.append("")
-        report_lines.append("**Key Findings:**")
-        for finding in comparison.key_findings:
-            report_lines.append(f"- {finding}")
-        report_lines.append("")
-
-        # Detailed Metrics Table
-        report_lines.append("### Detailed Metrics Comparison")
-        report_lines.append("")
-        report_lines.append("| Metric | Baseline | TDD | GraphRAG |")
-        report_lines.append("|--------|----------|-----|----------|")
-
-        # Generation Rate
-        gen_rates = {e.name: e.generation_rate for e in comparison.experiments}
-        report_lines.append(
-            f"| **Generation Rate** | "
-            f"{gen_rates.get('Baseline', 0):.1f}% | "
-            f"{gen_rates.get('TDD', 0):.1f}% | "
-            f"{gen_rates.get('GraphRAG', 0):.1f}% |"
-        )
+    def generate_markdown_report(self, comparison: ComparisonReport,
+                                 out: Optional[TextIO] = None) -> str:
+        """
+        Generate a detailed Markdown report from comparison results.
 
-        # Avg Patch Size
-        patch_sizes = {e.name: e.avg_patch_size for e in comparison.experiments}
-        report_lines.append(
-            f"| **Avg Patch Size** | "
-            f"{patch_sizes.get('Baseline', 0):,} chars | "
-            f"{patch_sizes.get('TDD', 0):,} chars | "
-            f"{patch_sizes.get('GraphRAG', 0):,} chars |"
-        )
+        When ``out`` is given the report is also written to it directly, so
+        callers saving to disk don't need a separate write step. The report
+        string is returned either way (append_to_experiments_md reuses it).
+        """
+        experiments = comparison.experiments
+        exp_by_name = {e.name: e for e in experiments}
 
-        # Median Patch Size
-        median_sizes = {e.name: e.median_patch_size for e in comparison.experiments}
-        report_lines.append(
-            f"| **Median Patch Size** | "
-            f"{median_sizes.get('Baseline', 0):,} chars | "
-            f"{median_sizes.get('TDD', 0):,} chars | "
-            f"{median_sizes.get('GraphRAG', 0):,} chars |"
-        )
+        def stat(name, attr, default=0):
+            exp = exp_by_name.get(name)
+            value = getattr(exp, attr) if exp else None
+            return value if value is not None else default
 
-        # Errors
-        errors = {e.name: e.num_errors for e in comparison.experiments}
-        report_lines.append(
-            f"| **Errors** | "
-            f"{errors.get('Baseline', 0)} | "
-            f"{errors.get('TDD', 0)} | "
-            f"{errors.get('GraphRAG', 0)} |"
+        findings = "\n".join(f"- {finding}" for finding in comparison.key_findings)
+        recommendations = "\n".join(
+            f"{i}. {rec}" for i, rec in enumerate(comparison.recommendations, 1)
         )
 
-        report_lines.append("")
-
         # GraphRAG-Specific Metrics
-        graphrag = next((e for e in comparison.experiments if e.name == "GraphRAG" and e.graphrag_metadata), None)
+        graphrag = exp_by_name.get("GraphRAG")
+        graphrag_section = ""
         if graphrag and graphrag.graphrag_metadata:
             meta = graphrag.graphrag_metadata
-            report_lines.append("### GraphRAG-Specific Metrics")
-            report_lines.append("")
-            report_lines.append(f"- **Total Graphs Built**: {meta['total_graphs_built']}")
-            report_lines.append(f"- **Avg Graph Build Time**: {meta['avg_graph_build_time']:.1f}s")
-            report_lines.append(f"- **Avg Impacted Tests Found**: {meta['avg_impacted_tests_found']:.1f} tests")
-            report_lines.append(f"- **Avg Impact Analysis Time**: {meta['avg_impact_analysis_time']:.2f}s")
-            report_lines.append(f"- **Test Range**: {meta['min_impacted_tests']} - {meta['max_impacted_tests']} tests")
-            report_lines.append("")
+            graphrag_section = f"""### GraphRAG-Specific Metrics
+
+- **Total Graphs Built**: {meta['total_graphs_built']}
+- **Avg Graph Build Time**: {meta['avg_graph_build_time']:.1f}s
+- **Avg Impacted Tests Found**: {meta['avg_impacted_tests_found']:.1f} tests
+- **Avg Impact Analysis Time**: {meta['avg_impact_analysis_time']:.2f}s
+- **Test Range**: {meta['min_impacted_tests']} - {meta['max_impacted_tests']} tests
+
+"""
 
         # Error Breakdown
-        report_lines.append("### Error Analysis")
-        report_lines.append("")
-        for exp in comparison.experiments:
-            if exp.error_types:
-                report_lines.append(f"**{exp.name} Errors:**")
-                for error_type, count in exp.error_types.items():
-                    report_lines.append(f"- {error_type}: {count}")
-                report_lines.append("")
-
-        # Recommendations
-        report_lines.append("### Recommendations")
-        report_lines.append("")
-        for i, rec in enumerate(comparison.recommendations, 1):
-            report_lines.append(f"{i}. {rec}")
-        report_lines.append("")
-
-        # Next Steps
-        report_lines.append("### Next Steps")
-        report_lines.append("")
-        report_lines.append("- [ ] Run Docker evaluation on all three prediction sets")
-        report_lines.append("- [ ] Calculate resolution rates from evaluation results")
-        report_lines.append("- [ ] Measure regression rates for each approach")
-        report_lines.append("- [ ] Compare actual test execution times")
-        report_lines.append("- [ ] Analyze specific instances where approaches differed")
-        report_lines.append("")
-
-        # Prediction Files
-        report_lines.append("### Prediction Files")
-        report_lines.append("")
-        for exp in comparison.experiments:
-            report_lines.append(f"- **{exp.name}**: `{exp.prediction_file.name}`")
-        report_lines.append("")
-
-        return "\n".join(report_lines)
+        error_sections = "".join(
+            f"**{exp.name} Errors:**\n"
+            + "\n".join(f"- {error_type}: {count}" for error_type, count in exp.error_types.items())
+            + "\n\n"
+            for exp in experiments if exp.error_types
+        )
+
+        prediction_files = "\n".join(
+            f"- **{exp.name}**: `{exp.prediction_file.name}`" for exp in experiments
+        )
+
+        report = f"""## EXP-005: Full Three-Way Comparison (50 Instances Each)
+
+### Metadata
+- **Date**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+- **Dataset**: SWE-bench_Verified
+- **Sample Size**: {experiments[0].num_instances} instances per experiment
+- **Experiments**: {', '.join(e.name for e in experiments)}
+
+### Executive Summary
+
+**Winner**: 🏆 **{comparison.winner}**
+
+**Key Findings:**
+{findings}
+
+### Detailed Metrics Comparison
+
+| Metric | Baseline | TDD | GraphRAG |
+|--------|----------|-----|----------|
+| **Generation Rate** | {stat('Baseline', 'generation_rate'):.1f}% | {stat('TDD', 'generation_rate'):.1f}% | {stat('GraphRAG', 'generation_rate'):.1f}% |
+| **Avg Patch Size** | {stat('Baseline', 'avg_patch_size'):,} chars | {stat('TDD', 'avg_patch_size'):,} chars | {stat('GraphRAG', 'avg_patch_size'):,} chars |
+| **Median Patch Size** | {stat('Baseline', 'median_patch_size'):,} chars | {stat('TDD', 'median_patch_size'):,} chars | {stat('GraphRAG', 'median_patch_size'):,} chars |
+| **Errors** | {stat('Baseline', 'num_errors')} | {stat('TDD', 'num_errors')} | {stat('GraphRAG', 'num_errors')} |
+
+{graphrag_section}### Error Analysis
+
+{error_sections}### Recommendations
+
+{recommendations}
+
+### Next Steps
+
+- [ ] Run Docker evaluation on all three prediction sets
+- [ ] Calculate resolution rates from evaluation results
+- [ ] Measure regression rates for each approach
+- [ ] Compare actual test execution times
+- [ ] Analyze specific instances where approaches differed
+
+### Prediction Files
+
+{prediction_files}
+"""
+
+        if out is not None:
+            out.write(report)
+        return report
 
     def append_to_experiments_md(self, report: str, experiments_md_path: Path = None):
         """
@@ -462,12 +509,9 @@ class ExperimentAnalyzer:
         if not experiments_md_path.exists():
             raise FileNotFoundError(f"EXPERIMENTS.md not found at {experiments_md_path}")
 
-        # Backup first
+        # Backup first (kernel-side copy, no read into Python memory)
         backup_path = experiments_md_path.with_suffix(".md.backup")
-        with open(experiments_md_path, 'r') as f:
-            backup_content = f.read()
-        with open(backup_path, 'w') as f:
-            f.write(backup_content)
+        shutil.copyfile(experiments_md_path, backup_path)
 
         # Append report
         with open(experiments_md_path, 'a') as f:
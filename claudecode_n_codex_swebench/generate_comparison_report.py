@@ -13,6 +13,7 @@ Usage:
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from experiment_analyzer import ExperimentAnalyzer
@@ -75,16 +76,20 @@ def main():
     # Initialize analyzer
     analyzer = ExperimentAnalyzer()
 
-    # Parse each experiment
+    # Parse the three experiments concurrently; each parse is independent and
+    # file-read/orjson-bound, so threads overlap the I/O.
     print("Parsing experiment results...")
 
-    baseline_results = analyzer.parse_predictions(baseline_file, "Baseline")
-    print(f"✓ Baseline: {baseline_results.num_instances} instances, {baseline_results.generation_rate:.1f}% generation rate")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        baseline_future = executor.submit(analyzer.parse_predictions, baseline_file, "Baseline")
+        tdd_future = executor.submit(analyzer.parse_predictions, tdd_file, "TDD")
+        graphrag_future = executor.submit(analyzer.parse_predictions, graphrag_file, "GraphRAG")
+        baseline_results = baseline_future.result()
+        tdd_results = tdd_future.result()
+        graphrag_results = graphrag_future.result()
 
-    tdd_results = analyzer.parse_predictions(tdd_file, "TDD")
+    print(f"✓ Baseline: {baseline_results.num_instances} instances, {baseline_results.generation_rate:.1f}% generation rate")
     print(f"✓ TDD: {tdd_results.num_instances} instances, {tdd_results.generation_rate:.1f}% generation rate")
-
-    graphrag_results = analyzer.parse_predictions(graphrag_file, "GraphRAG")
     print(f"✓ GraphRAG: {graphrag_results.num_instances} instances, {graphrag_results.generation_rate:.1f}% generation rate")
 
     if graphrag_results.graphrag_metadata:
@@ -97,9 +102,8 @@ def main():
     # Generate comparison
     print("Generating comparison report...")
     comparison = analyzer.compare_experiments([baseline_results, tdd_results, graphrag_results])
-    report = analyzer.generate_markdown_report(comparison)
 
-    # Save report
+    # Save report, streaming straight to the output file
     if args.output:
         output_file = Path(args.output)
     else:
@@ -108,7 +112,7 @@ def main():
         output_file = Path.cwd() / f"comparison_report_{timestamp}.md"
 
     with open(output_file, 'w') as f:
-        f.write(report)
+        report = analyzer.generate_markdown_report(comparison, out=f)
 
     print(f"✓ Comparison report saved to {output_file.name}")
 
@@ -17,6 +17,6 @@ __version__ = "0.1.0"
 __author__ = "Rafael Alonso"
 __description__ = "GraphRAG Test Impact Analysis for TDAD Thesis"
 
-from .config import config
+from .config import get_config
 
-__all__ = ["config"]
+__all__ = ["get_config"]
@@ -1,10 +1,11 @@
 """
 Configuration for GraphRAG Test Impact Analysis MCP Server
 """
+import functools
 import os
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ServerConfig(BaseModel):
@@ -21,6 +22,11 @@ class Neo4jConfig(BaseModel):
     user: str = "neo4j"
     password: str = "password"
     database: str = "neo4j"  # Community edition only supports default database
+    # Driver connection-pool tuning; defaults mirror the driver's own, but
+    # explicit values keep concurrent API load from stalling on acquisition.
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout_seconds: float = 30.0
+    max_connection_lifetime_seconds: float = 3600.0
     # For embedded mode
     use_embedded: bool = False  # Use standalone Neo4j container
     embedded_path: Optional[str] = None
@@ -44,9 +50,10 @@ class AnalysisConfig(BaseModel):
     max_function_lines: int = 1000  # Split very large functions
 
     # Test detection
-    test_file_patterns: list[str] = ["test_*.py", "*_test.py", "tests.py"]
-    test_function_patterns: list[str] = ["test_*"]
-    test_class_patterns: list[str] = ["Test*"]
+    test_file_patterns: list[str] = Field(
+        default_factory=lambda: ["test_*.py", "*_test.py", "tests.py"])
+    test_function_patterns: list[str] = Field(default_factory=lambda: ["test_*"])
+    test_class_patterns: list[str] = Field(default_factory=lambda: ["Test*"])
 
     # Coverage
     use_coverage: bool = False
@@ -59,6 +66,8 @@ class AnalysisConfig(BaseModel):
     coverage_test_sample_mode: str = "spread"  # "spread" or "head"
     coverage_pytest_extra_args: str = ""
     coverage_diff_max_tests: int = 200
+    # 0 => serial pytest; >0 passes -n <workers> when pytest-xdist is installed.
+    coverage_parallel_workers: int = 0
 
 
 class GraphIndexConfig(BaseModel):
@@ -69,9 +78,67 @@ class GraphIndexConfig(BaseModel):
     status_poll_interval_seconds: int = 2
 
 
+def _cast_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes")
+
+
+def _cast_sample_mode(value: str) -> Optional[str]:
+    mode = value.strip().lower()
+    return mode if mode in ("spread", "head") else None
+
+
 class Config:
     """Main configuration holder"""
 
+    # Environment variable -> (config section, attribute, cast). Casts that
+    # return None signal "ignore the value" (e.g. invalid sample mode).
+    _ENV_MAP = (
+        # Server
+        ("MCP_SERVER_HOST", "server", "host", str),
+        ("MCP_SERVER_PORT", "server", "port", int),
+        # Neo4j
+        ("NEO4J_URI", "neo4j", "uri", str),
+        ("NEO4J_USER", "neo4j", "user", str),
+        ("NEO4J_PASSWORD", "neo4j", "password", str),
+        ("NEO4J_EMBEDDED", "neo4j", "use_embedded", _cast_bool),
+        ("NEO4J_MAX_CONNECTION_POOL_SIZE", "neo4j", "max_connection_pool_size",
+         lambda v: max(1, int(v))),
+        ("NEO4J_CONNECTION_ACQUISITION_TIMEOUT_SEC", "neo4j",
+         "connection_acquisition_timeout_seconds", lambda v: max(1.0, float(v))),
+        ("NEO4J_MAX_CONNECTION_LIFETIME_SEC", "neo4j",
+         "max_connection_lifetime_seconds", lambda v: max(60.0, float(v))),
+        # Embeddings
+        ("ANTHROPIC_API_KEY", "embeddings", "anthropic_api_key", str),
+        ("EMBEDDINGS_PROVIDER", "embeddings", "provider", str),
+        ("EMBEDDINGS_MODEL", "embeddings", "model", str),
+        # Coverage
+        ("GRAPH_LINK_USE_COVERAGE", "analysis", "use_coverage", _cast_bool),
+        ("GRAPH_COVERAGE_THRESHOLD", "analysis", "coverage_threshold",
+         lambda v: max(0.0, min(1.0, float(v)))),
+        ("GRAPH_COVERAGE_TIMEOUT_SECONDS", "analysis", "coverage_timeout_seconds",
+         lambda v: max(30, int(v))),
+        ("GRAPH_COVERAGE_MAX_TEST_FILES", "analysis", "coverage_max_test_files",
+         lambda v: max(0, int(v))),
+        ("GRAPH_COVERAGE_MAX_LINK_ROWS", "analysis", "coverage_max_link_rows",
+         lambda v: max(0, int(v))),
+        ("GRAPH_COVERAGE_TEST_SAMPLE_MODE", "analysis", "coverage_test_sample_mode",
+         _cast_sample_mode),
+        ("GRAPH_COVERAGE_PYTEST_EXTRA_ARGS", "analysis", "coverage_pytest_extra_args",
+         str.strip),
+        ("GRAPH_COVERAGE_PARALLEL_WORKERS", "analysis", "coverage_parallel_workers",
+         lambda v: max(0, int(v))),
+        ("GRAPH_COVERAGE_DIFF_MAX_TESTS", "analysis", "coverage_diff_max_tests",
+         lambda v: max(1, int(v))),
+        # Graph index performance tuning
+        ("GRAPH_INDEX_WORKERS", "graph_index", "workers", lambda v: max(1, int(v))),
+        ("GRAPH_DB_BATCH_SIZE_NODES", "graph_index", "node_batch_size",
+         lambda v: max(100, int(v))),
+        ("GRAPH_DB_BATCH_SIZE_EDGES", "graph_index", "edge_batch_size",
+         lambda v: max(100, int(v))),
+        ("GRAPH_STATUS_POLL_INTERVAL_SEC", "graph_index", "status_poll_interval_seconds",
+         lambda v: max(1, int(v))),
+    )
+
     def __init__(self):
         self.server = ServerConfig()
         self.neo4j = Neo4jConfig()
@@ -89,59 +156,27 @@ class Config:
 
     def _load_from_env(self):
         """Load configuration from environment variables"""
-        # Server
-        if host := os.getenv("MCP_SERVER_HOST"):
-            self.server.host = host
-        if port := os.getenv("MCP_SERVER_PORT"):
-            self.server.port = int(port)
-
-        # Neo4j
-        if uri := os.getenv("NEO4J_URI"):
-            self.neo4j.uri = uri
-        if user := os.getenv("NEO4J_USER"):
-            self.neo4j.user = user
-        if password := os.getenv("NEO4J_PASSWORD"):
-            self.neo4j.password = password
-        if embedded := os.getenv("NEO4J_EMBEDDED"):
-            self.neo4j.use_embedded = embedded.lower() in ("true", "1", "yes")
-
-        # Embeddings
-        if api_key := os.getenv("ANTHROPIC_API_KEY"):
-            self.embeddings.anthropic_api_key = api_key
-        if provider := os.getenv("EMBEDDINGS_PROVIDER"):
-            self.embeddings.provider = provider
-        if model := os.getenv("EMBEDDINGS_MODEL"):
-            self.embeddings.model = model
-
-        if use_coverage := os.getenv("GRAPH_LINK_USE_COVERAGE"):
-            self.analysis.use_coverage = use_coverage.lower() in ("true", "1", "yes")
-        if coverage_threshold := os.getenv("GRAPH_COVERAGE_THRESHOLD"):
-            self.analysis.coverage_threshold = max(0.0, min(1.0, float(coverage_threshold)))
-        if coverage_timeout := os.getenv("GRAPH_COVERAGE_TIMEOUT_SECONDS"):
-            self.analysis.coverage_timeout_seconds = max(30, int(coverage_timeout))
-        if coverage_max_test_files := os.getenv("GRAPH_COVERAGE_MAX_TEST_FILES"):
-            self.analysis.coverage_max_test_files = max(0, int(coverage_max_test_files))
-        if coverage_max_link_rows := os.getenv("GRAPH_COVERAGE_MAX_LINK_ROWS"):
-            self.analysis.coverage_max_link_rows = max(0, int(coverage_max_link_rows))
-        if coverage_sample_mode := os.getenv("GRAPH_COVERAGE_TEST_SAMPLE_MODE"):
-            mode = coverage_sample_mode.strip().lower()
-            if mode in ("spread", "head"):
-                self.analysis.coverage_test_sample_mode = mode
-        if coverage_extra_args := os.getenv("GRAPH_COVERAGE_PYTEST_EXTRA_ARGS"):
-            self.analysis.coverage_pytest_extra_args = coverage_extra_args.strip()
-        if coverage_diff_max_tests := os.getenv("GRAPH_COVERAGE_DIFF_MAX_TESTS"):
-            self.analysis.coverage_diff_max_tests = max(1, int(coverage_diff_max_tests))
-
-        # Graph index performance tuning
-        if workers := os.getenv("GRAPH_INDEX_WORKERS"):
-            self.graph_index.workers = max(1, int(workers))
-        if node_batch := os.getenv("GRAPH_DB_BATCH_SIZE_NODES"):
-            self.graph_index.node_batch_size = max(100, int(node_batch))
-        if edge_batch := os.getenv("GRAPH_DB_BATCH_SIZE_EDGES"):
-            self.graph_index.edge_batch_size = max(100, int(edge_batch))
-        if poll_interval := os.getenv("GRAPH_STATUS_POLL_INTERVAL_SEC"):
-            self.graph_index.status_poll_interval_seconds = max(1, int(poll_interval))
-
-
-# Global config instance
-config = Config()
+        environ = os.environ
+        for env_key, section, attr, cast in self._ENV_MAP:
+            raw = environ.get(env_key)
+            if not raw:
+                continue
+            value = cast(raw)
+            if value is None:
+                continue
+            setattr(getattr(self, section), attr, value)
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, built (and env vars read) on first use."""
+    return Config()
+
+
+def __getattr__(name):
+    # Lazy `config` module attribute: legacy `from .config import config`
+    # keeps working, but importing this module alone no longer reads the
+    # environment or builds the pydantic models.
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
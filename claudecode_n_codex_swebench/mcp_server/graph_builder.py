@@ -5,9 +5,14 @@ Parses Python source code using AST, extracts structural information,
 and builds the code-test dependency graph in Neo4j.
 """
 import ast
+import functools
 import hashlib
 import logging
 import os
+import pickle
+import re
+import sqlite3
+import sys
 import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -19,11 +24,26 @@ import git
 
 from .config import config
 from .graph_db import get_db
+from .test_linker import _infer_target_names_cached
 
 logger = logging.getLogger(__name__)
 
+# Test-file paths, precomputed as a boolean node property at ingest so graph
+# queries can filter on an indexed flag instead of substring-scanning paths.
+_TEST_PATH_RE = re.compile(r"(^|/)tests?(/|$)|(^|/)test_[^/]*\.py$|_test\.py$")
 
-@dataclass
+
+def _docstring(node: ast.AST) -> Optional[str]:
+    """Inline ast.get_docstring without its cleaning/validation overhead."""
+    body = getattr(node, "body", None)
+    if body and type(body[0]) is ast.Expr:
+        value = body[0].value
+        if type(value) is ast.Constant and isinstance(value.value, str):
+            return value.value
+    return None
+
+
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function"""
     name: str
@@ -36,7 +56,7 @@ class FunctionInfo:
     is_test: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Information about a class"""
     name: str
@@ -48,7 +68,7 @@ class ClassInfo:
     bases: List[str]  # Parent class names
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a Python file"""
     path: str  # Absolute path
@@ -61,87 +81,86 @@ class FileInfo:
     is_test_file: bool
 
 
-class ASTAnalyzer(ast.NodeVisitor):
-    """AST visitor to extract code structure"""
+class ASTAnalyzer:
+    """Extracts code structure with an explicit iterative AST walk.
+
+    NodeVisitor's per-node getattr dispatch dominates on trees where most
+    nodes are uninteresting (Name/Load/Constant), so dispatch is a direct
+    type check on the handful of node types we care about.
+    """
 
     def __init__(
         self,
         file_path: str,
-        source_code: str,
+        source_code: str = "",
         test_function_patterns: Optional[List[str]] = None,
     ):
         self.file_path = file_path
         self.source_code = source_code
-        self.source_lines = source_code.splitlines()
         self.test_function_patterns = list(
             test_function_patterns or config.analysis.test_function_patterns
         )
+        self._test_pattern_key = tuple(self.test_function_patterns)
 
         self.imports: List[str] = []
         self.functions: List[FunctionInfo] = []
         self.classes: List[ClassInfo] = []
-        self.current_class: Optional[str] = None
-
-    def visit_Import(self, node: ast.Import):
-        """Handle 'import module' statements"""
-        for alias in node.names:
-            self.imports.append(alias.name)
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom):
-        """Handle 'from module import name' statements"""
-        if node.module:
-            self.imports.append(node.module)
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node: ast.ClassDef):
-        """Handle class definitions"""
-        class_name = node.name
-        docstring = ast.get_docstring(node)
-        bases = [self._get_name(base) for base in node.bases]
-
-        # Save current class context
-        prev_class = self.current_class
-        self.current_class = class_name
-
-        # Visit class body to collect methods
-        methods = []
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef) or isinstance(item, ast.AsyncFunctionDef):
-                method = self._extract_function(item, is_method=True)
-                methods.append(method)
-
-        class_info = ClassInfo(
-            name=class_name,
-            file_path=self.file_path,
-            start_line=node.lineno,
-            end_line=node.end_lineno or node.lineno,
-            docstring=docstring,
-            methods=methods,
-            bases=bases
-        )
-        self.classes.append(class_info)
-
-        # Restore previous class context
-        self.current_class = prev_class
-
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        """Handle function definitions"""
-        # Skip methods (handled in visit_ClassDef)
-        if self.current_class is None:
-            func_info = self._extract_function(node, is_method=False)
-            self.functions.append(func_info)
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        """Handle async function definitions"""
-        if self.current_class is None:
-            func_info = self._extract_function(node, is_method=False)
-            self.functions.append(func_info)
+        # Resolved-name memos keyed by node identity. The tree stays alive
+        # for the analyzer's lifetime, so id() reuse is not a hazard, and the
+        # same annotation/attribute sub-nodes are often resolved repeatedly.
+        self._name_cache: Dict[int, str] = {}
+        self._call_name_cache: Dict[int, Optional[str]] = {}
+
+    def analyze(self, tree: ast.AST) -> None:
+        """Walk the tree iteratively, collecting imports, classes and functions.
+
+        Class and function bodies are not descended into beyond their own
+        extraction, matching the previous visitor semantics.
+        """
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is ast.Import:
+                for alias in node.names:
+                    self.imports.append(alias.name)
+            elif node_type is ast.ImportFrom:
+                if node.module:
+                    self.imports.append(node.module)
+            elif node_type is ast.ClassDef:
+                self._extract_class(node)
+            elif node_type is ast.FunctionDef or node_type is ast.AsyncFunctionDef:
+                self.functions.append(self._extract_function(node, is_method=False))
+            else:
+                children = list(ast.iter_child_nodes(node))
+                children.reverse()
+                stack.extend(children)
+
+    def _extract_class(self, node: ast.ClassDef) -> None:
+        """Extract class information, including its direct methods."""
+        methods = [
+            self._extract_function(item, is_method=True)
+            for item in node.body
+            if type(item) is ast.FunctionDef or type(item) is ast.AsyncFunctionDef
+        ]
+        self.classes.append(
+            ClassInfo(
+                name=node.name,
+                file_path=self.file_path,
+                start_line=node.lineno,
+                end_line=node.end_lineno or node.lineno,
+                docstring=_docstring(node),
+                methods=methods,
+                bases=[self._get_name(base) for base in node.bases],
+            )
+        )
 
     def _extract_function(self, node: ast.FunctionDef, is_method: bool) -> FunctionInfo:
         """Extract function information from AST node"""
-        func_name = node.name
-        docstring = ast.get_docstring(node)
+        # Interned: the same name recurs as dict keys in the symbol maps
+        func_name = sys.intern(node.name)
+        docstring = _docstring(node)
 
         # Build signature
         args = []
@@ -173,67 +192,179 @@ class ASTAnalyzer(ast.NodeVisitor):
         )
 
     def _find_function_calls(self, node: ast.AST) -> List[str]:
-        """Find all function calls within a node"""
-        calls = []
+        """Find all function calls within a node.
 
-        class CallVisitor(ast.NodeVisitor):
-            def visit_Call(self, call_node: ast.Call):
-                func_name = self._get_call_name(call_node.func)
+        Iterative pre-order walk; avoids the NodeVisitor per-node method
+        dispatch and the visitor instantiation per function.
+        """
+        calls = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if type(current) is ast.Call:
+                func_name = self._get_call_name(current.func)
                 if func_name:
                     calls.append(func_name)
-                self.generic_visit(call_node)
-
-            def _get_call_name(self, func_node: ast.AST) -> Optional[str]:
-                if isinstance(func_node, ast.Name):
-                    return func_node.id
-                elif isinstance(func_node, ast.Attribute):
-                    prefix = self._get_call_name(func_node.value)
-                    return f"{prefix}.{func_node.attr}" if prefix else func_node.attr
-                return None
-
-        CallVisitor().visit(node)
+            children = list(ast.iter_child_nodes(current))
+            children.reverse()
+            stack.extend(children)
         return calls
 
+    def _get_call_name(self, func_node: ast.AST) -> Optional[str]:
+        """Resolve a Call's target expression to a dotted name, memoized."""
+        key = id(func_node)
+        cache = self._call_name_cache
+        if key in cache:
+            return cache[key]
+        if isinstance(func_node, ast.Name):
+            name = sys.intern(func_node.id)
+        elif isinstance(func_node, ast.Attribute):
+            prefix = self._get_call_name(func_node.value)
+            name = sys.intern(f"{prefix}.{func_node.attr}" if prefix else func_node.attr)
+        else:
+            name = None
+        cache[key] = name
+        return name
+
     def _get_name(self, node: ast.AST) -> str:
         """Get name from AST node"""
+        cache = self._name_cache
+        cached = cache.get(id(node))
+        if cached is not None:
+            return cached
         if isinstance(node, ast.Name):
-            return node.id
+            name = node.id
         elif isinstance(node, ast.Attribute):
             value = self._get_name(node.value)
-            return f"{value}.{node.attr}"
+            name = f"{value}.{node.attr}"
         elif isinstance(node, ast.Subscript):
             value = self._get_name(node.value)
-            return f"{value}[...]"
-        return str(node)
+            name = f"{value}[...]"
+        else:
+            name = str(node)
+        cache[id(node)] = name
+        return name
 
     def _is_test_function(self, func_name: str) -> bool:
         """Check if function name matches test patterns"""
-        for pattern in self.test_function_patterns:
-            if pattern.startswith("*"):
-                if func_name.endswith(pattern[1:]):
-                    return True
-            elif pattern.endswith("*"):
-                if func_name.startswith(pattern[:-1]):
-                    return True
-            elif func_name == pattern:
-                return True
-        return False
-
-
-def _matches_glob_pattern(name: str, pattern: str) -> bool:
-    """Simple wildcard matcher used for test file/function patterns."""
-    if pattern.startswith("*"):
-        return name.endswith(pattern[1:])
-    if pattern.endswith("*"):
-        return name.startswith(pattern[:-1])
-    return name == pattern
+        return _matches_patterns(func_name, self._test_pattern_key)
+
+
+def _content_hash(data: bytes) -> str:
+    """Fingerprint file contents for change detection (not a security hash)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Bump when the parsed FileInfo shape or the visitor's extraction logic
+# changes, so stale cache entries invalidate cleanly.
+_FILE_INFO_CACHE_VERSION = 4
+
+
+class _FileInfoCache:
+    """SQLite-backed cache of parsed FileInfo keyed on (path, content hash).
+
+    Unchanged files skip ast.parse and the visitor entirely on re-index.
+    Entries also carry a profile string (cache version + test patterns) so
+    pattern or schema changes invalidate old rows. All operations fail open:
+    a broken cache only costs a re-parse.
+    """
+
+    def __init__(self, repo_root: str):
+        # Keep the cache outside the analyzed repo: writing into the
+        # working tree would leave an untracked directory in the tree the
+        # agent is editing and change the repo fingerprint after the first
+        # build, defeating the rebuild short-circuit. Entries are keyed by
+        # relative path + content hash, so a per-root directory under the
+        # user cache dir is equivalent and invisible to git status.
+        cache_home = Path(
+            os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")
+        )
+        root_key = hashlib.blake2b(
+            str(Path(repo_root).resolve()).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        cache_dir = cache_home / "tdad" / "ast" / root_key
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(cache_dir / "ast.sqlite"), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS file_info_cache (
+                path TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                profile TEXT NOT NULL,
+                blob BLOB NOT NULL,
+                PRIMARY KEY (path, content_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def profile(test_file_patterns: List[str], test_function_patterns: List[str]) -> str:
+        return f"v{_FILE_INFO_CACHE_VERSION}:{sorted(test_file_patterns)}:{sorted(test_function_patterns)}"
+
+    def get(self, relative_path: str, content_hash: str, profile: str) -> Optional[FileInfo]:
+        row = self._conn.execute(
+            "SELECT blob FROM file_info_cache WHERE path=? AND content_hash=? AND profile=?",
+            (relative_path, content_hash, profile),
+        ).fetchone()
+        if not row:
+            return None
+        return pickle.loads(row[0])
+
+    def put(self, relative_path: str, content_hash: str, profile: str, file_info: FileInfo) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO file_info_cache (path, content_hash, profile, blob) VALUES (?, ?, ?, ?)",
+            (relative_path, content_hash, profile, pickle.dumps(file_info, protocol=pickle.HIGHEST_PROTOCOL)),
+        )
+        self._conn.commit()
+
+
+# One cache connection per (worker) process and repo root.
+_file_info_caches: Dict[str, Optional[_FileInfoCache]] = {}
+
+
+def _get_file_info_cache(repo_root: str) -> Optional[_FileInfoCache]:
+    if repo_root not in _file_info_caches:
+        try:
+            _file_info_caches[repo_root] = _FileInfoCache(repo_root)
+        except Exception as e:
+            logger.debug(f"FileInfo cache unavailable for {repo_root}: {e}")
+            _file_info_caches[repo_root] = None
+    return _file_info_caches[repo_root]
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[frozenset, Tuple[str, ...], Tuple[str, ...]]:
+    """Split wildcard patterns into exact names, prefixes and suffixes.
+
+    str.startswith/endswith accept a tuple, so matching a name against all
+    patterns is a set lookup plus at most two C-level calls rather than a
+    Python loop per name.
+    """
+    exact, prefixes, suffixes = set(), [], []
+    for pattern in patterns:
+        if pattern.startswith("*"):
+            suffixes.append(pattern[1:])
+        elif pattern.endswith("*"):
+            prefixes.append(pattern[:-1])
+        else:
+            exact.add(pattern)
+    return frozenset(exact), tuple(prefixes), tuple(suffixes)
+
+
+def _matches_patterns(name: str, patterns: Tuple[str, ...]) -> bool:
+    exact, prefixes, suffixes = _compile_patterns(patterns)
+    if name in exact:
+        return True
+    if prefixes and name.startswith(prefixes):
+        return True
+    return bool(suffixes) and name.endswith(suffixes)
 
 
 def _is_test_file_path(file_name: str, test_file_patterns: List[str]) -> bool:
-    for pattern in test_file_patterns:
-        if _matches_glob_pattern(file_name, pattern):
-            return True
-    return False
+    return _matches_patterns(file_name, tuple(test_file_patterns))
 
 
 def _parse_file_worker(
@@ -243,19 +374,31 @@ def _parse_file_worker(
     test_function_patterns: List[str],
 ) -> FileInfo:
     """Parse file in worker process for parallel indexing."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        source_code = f.read()
+    # One binary read feeds both the hash and ast.parse (which accepts
+    # bytes and handles the decode itself), skipping the text-mode decode
+    # plus the re-encode the old path paid per file.
+    source_bytes = Path(file_path).read_bytes()
 
-    content_hash = hashlib.md5(source_code.encode()).hexdigest()
+    content_hash = _content_hash(source_bytes)
     try:
         relative_path = str(Path(file_path).resolve().relative_to(Path(repo_root).resolve()))
     except ValueError:
         relative_path = str(Path(file_path).name)
     file_name = Path(file_path).name
 
+    cache = _get_file_info_cache(repo_root)
+    cache_profile = _FileInfoCache.profile(test_file_patterns, test_function_patterns)
+    if cache:
+        try:
+            cached = cache.get(relative_path, content_hash, cache_profile)
+        except Exception:
+            cached = None
+        if cached is not None:
+            return cached
+
     try:
-        tree = ast.parse(source_code, filename=file_path)
-    except SyntaxError:
+        tree = ast.parse(source_bytes, filename=file_path)
+    except (SyntaxError, ValueError):
         return FileInfo(
             path=file_path,
             relative_path=relative_path,
@@ -269,12 +412,11 @@ def _parse_file_worker(
 
     analyzer = ASTAnalyzer(
         file_path,
-        source_code,
         test_function_patterns=test_function_patterns,
     )
-    analyzer.visit(tree)
+    analyzer.analyze(tree)
 
-    return FileInfo(
+    file_info = FileInfo(
         path=file_path,
         relative_path=relative_path,
         name=file_name,
@@ -284,6 +426,12 @@ def _parse_file_worker(
         classes=analyzer.classes,
         is_test_file=_is_test_file_path(file_name, test_file_patterns),
     )
+    if cache:
+        try:
+            cache.put(relative_path, content_hash, cache_profile, file_info)
+        except Exception:
+            pass
+    return file_info
 
 
 class GraphBuilder:
@@ -292,6 +440,11 @@ class GraphBuilder:
     def __init__(self):
         self.db = get_db()
         self.repo_root: Optional[Path] = None
+        self._repo_root_prefix: Optional[str] = None
+        self._file_mtimes: Dict[str, float] = {}
+        # Set per build: True only when the DB was cleared this run, letting
+        # relationship writers use CREATE instead of MERGE (see build_graph).
+        self._bulk_create_edges = False
         self._build_warnings: int = 0
 
     def _emit_progress(
@@ -414,16 +567,28 @@ class GraphBuilder:
         }
         nodes_created = 0
         relationships_created = 0
+        naming_min_plain_len = max(
+            2, int(os.getenv("GRAPH_NAMING_MIN_PLAIN_TARGET_LEN", "3"))
+        )
 
         for file_info in file_infos:
-            module_name = self._module_name(file_info.relative_path)
+            # One interned copy of the path is shared by every record below
+            rel_path = sys.intern(file_info.relative_path)
+            module_name = self._module_name(rel_path)
+            in_test_file = bool(_TEST_PATH_RE.search(rel_path))
             try:
-                mtime = datetime.fromtimestamp(Path(file_info.path).stat().st_mtime).isoformat()
+                # mtime was captured from the DirEntry during the file walk;
+                # fall back to a fresh stat for paths that bypassed it (e.g.
+                # incremental updates).
+                mtime_ts = self._file_mtimes.get(file_info.path)
+                if mtime_ts is None:
+                    mtime_ts = Path(file_info.path).stat().st_mtime
+                mtime = datetime.fromtimestamp(mtime_ts).isoformat()
             except Exception:
                 mtime = None
             payloads["files"].append(
                 {
-                    "path": file_info.relative_path,
+                    "path": rel_path,
                     "name": file_info.name,
                     "content_hash": file_info.content_hash,
                     "repo_path": str(repo_path),
@@ -433,18 +598,20 @@ class GraphBuilder:
             nodes_created += 1
 
             for func in file_info.functions:
-                func_id = f"{file_info.relative_path}::{func.name}:{func.start_line}"
+                func_id = f"{rel_path}::{func.name}:{func.start_line}"
                 payloads["functions"].append(
                     {
                         "function_id": func_id,
                         "name": func.name,
-                        "file_path": file_info.relative_path,
+                        "short_name": func.name,
+                        "is_test": in_test_file,
+                        "file_path": rel_path,
                         "start_line": func.start_line,
                         "end_line": func.end_line,
                         "signature": func.signature,
                         "docstring": func.docstring,
                         "embedding": None,
-                        "symbol_key": self._function_symbol_key(file_info.relative_path, func.name),
+                        "symbol_key": self._function_symbol_key(rel_path, func.name),
                         "module_name": module_name,
                         "qualified_name": f"{module_name}.{func.name}",
                     }
@@ -452,7 +619,7 @@ class GraphBuilder:
                 payloads["contains"].append(
                     {
                         "parent_type": "File",
-                        "parent_id": file_info.relative_path,
+                        "parent_id": rel_path,
                         "node_id": func_id,
                         "node_type": "Function",
                     }
@@ -466,15 +633,20 @@ class GraphBuilder:
                         {
                             "test_id": test_id,
                             "name": func.name,
-                            "file_path": file_info.relative_path,
+                            "file_path": rel_path,
                             "function_name": func.name,
                             "test_type": "pytest",
+                            # Naming-convention targets inferred once at
+                            # ingest so the linker can skip re-inference.
+                            "candidate_targets": list(
+                                _infer_target_names_cached(func.name, naming_min_plain_len)
+                            ),
                         }
                     )
                     payloads["contains"].append(
                         {
                             "parent_type": "File",
-                            "parent_id": file_info.relative_path,
+                            "parent_id": rel_path,
                             "node_id": test_id,
                             "node_type": "Test",
                         }
@@ -483,17 +655,17 @@ class GraphBuilder:
                     relationships_created += 1
 
             for cls in file_info.classes:
-                class_id = f"{file_info.relative_path}::{cls.name}:{cls.start_line}"
+                class_id = f"{rel_path}::{cls.name}:{cls.start_line}"
                 payloads["classes"].append(
                     {
                         "class_id": class_id,
                         "name": cls.name,
-                        "file_path": file_info.relative_path,
+                        "file_path": rel_path,
                         "start_line": cls.start_line,
                         "end_line": cls.end_line,
                         "docstring": cls.docstring,
                         "embedding": None,
-                        "symbol_key": self._class_symbol_key(file_info.relative_path, cls.name),
+                        "symbol_key": self._class_symbol_key(rel_path, cls.name),
                         "module_name": module_name,
                         "qualified_name": f"{module_name}.{cls.name}",
                     }
@@ -501,7 +673,7 @@ class GraphBuilder:
                 payloads["contains"].append(
                     {
                         "parent_type": "File",
-                        "parent_id": file_info.relative_path,
+                        "parent_id": rel_path,
                         "node_id": class_id,
                         "node_type": "Class",
                     }
@@ -510,19 +682,21 @@ class GraphBuilder:
                 relationships_created += 1
 
                 for method in cls.methods:
-                    method_id = f"{file_info.relative_path}::{cls.name}.{method.name}:{method.start_line}"
+                    method_id = f"{rel_path}::{cls.name}.{method.name}:{method.start_line}"
                     payloads["functions"].append(
                         {
                             "function_id": method_id,
                             "name": f"{cls.name}.{method.name}",
-                            "file_path": file_info.relative_path,
+                            "short_name": method.name,
+                            "is_test": in_test_file,
+                            "file_path": rel_path,
                             "start_line": method.start_line,
                             "end_line": method.end_line,
                             "signature": method.signature,
                             "docstring": method.docstring,
                             "embedding": None,
                             "symbol_key": self._function_symbol_key(
-                                file_info.relative_path,
+                                rel_path,
                                 method.name,
                                 class_name=cls.name,
                             ),
@@ -544,12 +718,16 @@ class GraphBuilder:
         return payloads, nodes_created, relationships_created
 
     def _persist_node_payloads(self, payloads: Dict[str, List[Dict[str, Any]]]) -> None:
-        """Write node payloads with batched UNWIND queries."""
-        self.db.upsert_file_nodes_batch(payloads["files"])
-        self.db.upsert_function_nodes_batch(payloads["functions"])
-        self.db.upsert_class_nodes_batch(payloads["classes"])
-        self.db.upsert_test_nodes_batch(payloads["tests"])
-        self.db.create_contains_relationships_batch(payloads["contains"])
+        """Write node payloads with batched UNWIND queries over one session."""
+        assume_new = getattr(self, "_bulk_create_edges", False)
+        with self.db.bulk_session() as session:
+            self.db.upsert_file_nodes_batch(payloads["files"], session=session)
+            self.db.upsert_function_nodes_batch(payloads["functions"], session=session)
+            self.db.upsert_class_nodes_batch(payloads["classes"], session=session)
+            self.db.upsert_test_nodes_batch(payloads["tests"], session=session)
+            self.db.create_contains_relationships_batch(
+                payloads["contains"], session=session, assume_new=assume_new
+            )
 
     def _module_name(self, relative_path: str) -> str:
         """Convert repository-relative file path to dotted module path."""
@@ -599,6 +777,13 @@ class GraphBuilder:
         if not self.repo_root:
             return absolute_path
 
+        # Fast path: _find_python_files emits paths rooted at the already
+        # resolved repo_root, so a plain prefix strip avoids a realpath
+        # syscall per file.
+        prefix = getattr(self, "_repo_root_prefix", None)
+        if prefix and absolute_path.startswith(prefix):
+            return absolute_path[len(prefix):]
+
         try:
             abs_path = Path(absolute_path).resolve()
             rel_path = abs_path.relative_to(self.repo_root.resolve())
@@ -707,9 +892,15 @@ class GraphBuilder:
         return records
 
     def _build_symbol_maps_from_file_infos(
-        self, file_infos: List[FileInfo]
+        self,
+        file_infos: List[FileInfo],
+        records_by_file: Optional[Dict[str, List[Dict[str, Optional[str]]]]] = None,
     ) -> Tuple[Dict[str, Dict[str, List[str]]], Dict[str, Dict[str, List[str]]], Dict[str, str]]:
-        """Build function/class/file lookup maps from parsed file infos."""
+        """Build function/class/file lookup maps from parsed file infos.
+
+        Callers that also iterate the records (the relationship pass) can
+        pass them precomputed so each file's function ids are built once.
+        """
         function_maps: Dict[str, Dict[str, List[str]]] = {
             "by_symbol_key": {},
             "by_qualified_name": {},
@@ -727,7 +918,11 @@ class GraphBuilder:
             file_map[module_name] = file_info.relative_path
             file_map.setdefault(Path(file_info.relative_path).stem, file_info.relative_path)
 
-            for record in self._iter_function_records(file_info):
+            if records_by_file is not None:
+                records = records_by_file[file_info.relative_path]
+            else:
+                records = self._iter_function_records(file_info)
+            for record in records:
                 function_id = str(record["id"])
                 function_name = str(record["function_name"])
                 class_name = record["class_name"]
@@ -1006,6 +1201,7 @@ class GraphBuilder:
 
         # Set repo root for relative path computation
         self.repo_root = Path(repo_path).resolve()
+        self._repo_root_prefix = str(self.repo_root) + os.sep
         logger.info(f"Repository root: {self.repo_root}")
         self._emit_progress(
             progress_callback,
@@ -1023,6 +1219,7 @@ class GraphBuilder:
         )
         graph_identity = f"{resolved_repo_slug}@{resolved_commit_sha}"
 
+        database_cleared = False
         if not force_rebuild:
             try:
                 active_meta = self.db.get_index_metadata()
@@ -1030,6 +1227,43 @@ class GraphBuilder:
                 logger.debug(f"Unable to read active graph metadata before build: {e}")
                 active_meta = {}
             active_identity = str((active_meta or {}).get("graph_identity") or "")
+            active_fingerprint = str((active_meta or {}).get("repo_fingerprint") or "")
+            if (
+                active_identity
+                and active_identity == graph_identity
+                and resolved_repo_fingerprint
+                and not resolved_repo_fingerprint.endswith(":unknown")
+                and active_fingerprint == resolved_repo_fingerprint
+            ):
+                # Same identity and same fingerprint: the graph already
+                # reflects this exact working tree, so return cached counts
+                # instead of re-parsing and re-writing everything.
+                logger.info(
+                    "Graph already current for %s (fingerprint %s); skipping rebuild",
+                    graph_identity,
+                    resolved_repo_fingerprint,
+                )
+                try:
+                    stats = self.db.get_stats()
+                except Exception as e:
+                    logger.debug(f"Unable to read stats for skipped build: {e}")
+                    stats = {}
+                timings["total_sec"] = time.time() - build_start
+                self._emit_progress(
+                    progress_callback,
+                    stage="completed",
+                    progress_pct=100.0,
+                    message="Graph already current; rebuild skipped",
+                )
+                return {
+                    "nodes_created": int(stats.get("total_nodes") or 0),
+                    "relationships_created": int(stats.get("total_relationships") or 0),
+                    "files_processed": 0,
+                    "build_warnings_count": 0,
+                    "repo_fingerprint": resolved_repo_fingerprint,
+                    "index_timing": timings,
+                    "skipped": True,
+                }
             if active_identity and active_identity != graph_identity:
                 logger.warning(
                     "Graph identity changed (%s -> %s); clearing DB to avoid cross-identity contamination",
@@ -1039,12 +1273,19 @@ class GraphBuilder:
                 t0 = time.time()
                 self.db.clear_database()
                 timings["clear_database_sec"] = time.time() - t0
+                database_cleared = True
 
         if force_rebuild:
             logger.warning("Force rebuild: clearing existing graph")
             t0 = time.time()
             self.db.clear_database()
             timings["clear_database_sec"] = time.time() - t0
+            database_cleared = True
+
+        # When the database was cleared this build, relationship rows are
+        # known-unique (the builder deduplicates client-side), so the batch
+        # writers can use CREATE instead of per-pair MERGE lookups.
+        self._bulk_create_edges = database_cleared
 
         # Ensure schema exists
         t0 = time.time()
@@ -1170,6 +1411,9 @@ class GraphBuilder:
         """Incrementally update graph based on changed files"""
         logger.info(f"Incrementally updating graph for: {repo_path}")
         self.repo_root = Path(repo_path).resolve()
+        self._repo_root_prefix = str(self.repo_root) + os.sep
+        # Incremental updates merge into an existing graph: always MERGE.
+        self._bulk_create_edges = False
         update_start = time.time()
         timings: Dict[str, float] = {}
 
@@ -1322,93 +1566,6 @@ class GraphBuilder:
                     file_path=relative_path,
                 )
 
-    def _create_nodes_for_file(self, file_info: FileInfo, repo_path: Path) -> Tuple[int, int]:
-        """Create file/function/class/test nodes for a single parsed file."""
-        nodes_created = 0
-        relationships_created = 0
-        module_name = self._module_name(file_info.relative_path)
-
-        self.db.create_file_node(
-            path=file_info.relative_path,
-            name=file_info.name,
-            content_hash=file_info.content_hash,
-            repo_path=str(repo_path),
-            last_modified=datetime.fromtimestamp(Path(file_info.path).stat().st_mtime),
-        )
-        nodes_created += 1
-
-        for func in file_info.functions:
-            func_id = f"{file_info.relative_path}::{func.name}:{func.start_line}"
-            self.db.create_function_node(
-                function_id=func_id,
-                name=func.name,
-                file_path=file_info.relative_path,
-                start_line=func.start_line,
-                end_line=func.end_line,
-                signature=func.signature,
-                docstring=func.docstring,
-                symbol_key=self._function_symbol_key(file_info.relative_path, func.name),
-                module_name=module_name,
-                qualified_name=f"{module_name}.{func.name}",
-            )
-            nodes_created += 1
-
-            self.db.create_contains_relationship(file_info.relative_path, func_id, "Function")
-            relationships_created += 1
-
-            if func.is_test:
-                test_id = f"test::{func_id}"
-                self.db.create_test_node(
-                    test_id=test_id,
-                    name=func.name,
-                    file_path=file_info.relative_path,
-                    function_name=func.name,
-                )
-                nodes_created += 1
-                self.db.create_contains_relationship(file_info.relative_path, test_id, "Test")
-                relationships_created += 1
-
-        for cls in file_info.classes:
-            class_id = f"{file_info.relative_path}::{cls.name}:{cls.start_line}"
-            self.db.create_class_node(
-                class_id=class_id,
-                name=cls.name,
-                file_path=file_info.relative_path,
-                start_line=cls.start_line,
-                end_line=cls.end_line,
-                docstring=cls.docstring,
-                symbol_key=self._class_symbol_key(file_info.relative_path, cls.name),
-                module_name=module_name,
-                qualified_name=f"{module_name}.{cls.name}",
-            )
-            nodes_created += 1
-            self.db.create_contains_relationship(file_info.relative_path, class_id, "Class")
-            relationships_created += 1
-
-            for method in cls.methods:
-                method_id = f"{file_info.relative_path}::{cls.name}.{method.name}:{method.start_line}"
-                self.db.create_function_node(
-                    function_id=method_id,
-                    name=f"{cls.name}.{method.name}",
-                    file_path=file_info.relative_path,
-                    start_line=method.start_line,
-                    end_line=method.end_line,
-                    signature=method.signature,
-                    docstring=method.docstring,
-                    symbol_key=self._function_symbol_key(
-                        file_info.relative_path,
-                        method.name,
-                        class_name=cls.name,
-                    ),
-                    module_name=module_name,
-                    qualified_name=f"{module_name}.{cls.name}.{method.name}",
-                )
-                nodes_created += 1
-                self.db.create_contains_relationship(class_id, method_id, "Function")
-                relationships_created += 1
-
-        return nodes_created, relationships_created
-
     def _create_relationships_incremental(self, file_infos: List[FileInfo]) -> Tuple[int, int]:
         """Recreate import/call/inheritance relationships for changed files against current graph."""
         if not file_infos:
@@ -1526,39 +1683,84 @@ class GraphBuilder:
         ]
 
         rel_count = 0
-        rel_count += self.db.create_calls_relationships_batch(calls_rows)
-        rel_count += self.db.create_imports_relationships_batch(imports_rows)
-        rel_count += self.db.create_inherits_relationships_batch(inherits_rows)
+        with self.db.bulk_session() as session:
+            rel_count += self.db.create_calls_relationships_batch(calls_rows, session=session)
+            rel_count += self.db.create_imports_relationships_batch(imports_rows, session=session)
+            rel_count += self.db.create_inherits_relationships_batch(inherits_rows, session=session)
         return rel_count, warning_count
 
-    def _find_python_files(self, repo_path: Path) -> List[str]:
-        """Find all Python files in repository"""
-        python_files = []
+    # Directories never descended into during file discovery
+    _SKIP_DIRS = frozenset({"__pycache__", "venv", "env", "node_modules"})
 
-        for file_path in repo_path.rglob("*.py"):
-            # Skip common directories
-            if any(part.startswith('.') or part in ['__pycache__', 'venv', 'env', 'node_modules'] for part in file_path.parts):
+    def _find_python_files(self, repo_path: Path) -> List[str]:
+        """Find all Python files in repository.
+
+        Iterative os.scandir walk that prunes skipped directories before
+        descending, instead of rglob-ing everything (including venvs and
+        __pycache__) and filtering each file's ancestor parts afterwards.
+        DirEntry type checks reuse the dirent, so no extra stat per file.
+        Records each file's mtime from the DirEntry stat so the payload
+        build phase does not re-stat every file.
+        """
+        python_files: List[str] = []
+        self._file_mtimes = {}
+        file_mtimes = self._file_mtimes
+        stack = [str(repo_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory {directory}: {e}")
                 continue
-
-            python_files.append(str(file_path))
-
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in self._SKIP_DIRS:
+                                stack.append(entry.path)
+                        elif name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                            python_files.append(entry.path)
+                            file_mtimes[entry.path] = entry.stat(
+                                follow_symlinks=False
+                            ).st_mtime
+                    except OSError:
+                        continue
         return python_files
 
     def _parse_file(self, file_path: str, repo_path: Path) -> FileInfo:
         """Parse a Python file and extract structure"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
+        # Single binary read shared by the hash and ast.parse (see
+        # _parse_file_worker)
+        source_bytes = Path(file_path).read_bytes()
 
         # Calculate content hash
-        content_hash = hashlib.md5(source_code.encode()).hexdigest()
+        content_hash = _content_hash(source_bytes)
 
         # Compute relative path
         relative_path = self._to_relative_path(file_path)
 
+        # Unchanged files come straight from the on-disk cache
+        cache = _get_file_info_cache(str(self.repo_root)) if self.repo_root else None
+        cache_profile = _FileInfoCache.profile(
+            list(config.analysis.test_file_patterns),
+            list(config.analysis.test_function_patterns),
+        )
+        if cache:
+            try:
+                cached = cache.get(relative_path, content_hash, cache_profile)
+            except Exception:
+                cached = None
+            if cached is not None:
+                return cached
+
         # Parse AST
         try:
-            tree = ast.parse(source_code, filename=file_path)
-        except SyntaxError as e:
+            tree = ast.parse(source_bytes, filename=file_path)
+        except (SyntaxError, ValueError) as e:
             logger.warning(f"Syntax error in {file_path}: {e}")
             # Return minimal info for files with syntax errors
             return FileInfo(
@@ -1573,13 +1775,13 @@ class GraphBuilder:
             )
 
         # Analyze AST
-        analyzer = ASTAnalyzer(file_path, source_code)
-        analyzer.visit(tree)
+        analyzer = ASTAnalyzer(file_path)
+        analyzer.analyze(tree)
 
         # Check if this is a test file
         is_test_file = self._is_test_file(file_path)
 
-        return FileInfo(
+        file_info = FileInfo(
             path=file_path,
             relative_path=relative_path,
             name=Path(file_path).name,
@@ -1589,36 +1791,40 @@ class GraphBuilder:
             classes=analyzer.classes,
             is_test_file=is_test_file
         )
+        if cache:
+            try:
+                cache.put(relative_path, content_hash, cache_profile, file_info)
+            except Exception:
+                pass
+        return file_info
 
     def _is_test_file(self, file_path: str) -> bool:
         """Check if file is a test file based on name patterns"""
-        file_name = Path(file_path).name
-
-        for pattern in config.analysis.test_file_patterns:
-            if pattern.startswith("*"):
-                if file_name.endswith(pattern[1:]):
-                    return True
-            elif pattern.endswith("*"):
-                if file_name.startswith(pattern[:-1]):
-                    return True
-            elif file_name == pattern:
-                return True
-
-        return False
+        return _matches_patterns(
+            Path(file_path).name,
+            tuple(config.analysis.test_file_patterns),
+        )
 
     def _create_relationships(self, file_infos: List[FileInfo]) -> Tuple[int, int]:
         """Create relationships between nodes (second pass)."""
+        assume_new = getattr(self, "_bulk_create_edges", False)
         warning_count = 0
         calls_map: Dict[Tuple[str, str], Tuple[str, float]] = {}
         imports_set: Set[Tuple[str, str]] = set()
         inherits_map: Dict[Tuple[str, str], Tuple[str, float]] = {}
 
-        function_maps, class_maps, file_map = self._build_symbol_maps_from_file_infos(file_infos)
+        records_by_file = {
+            file_info.relative_path: self._iter_function_records(file_info)
+            for file_info in file_infos
+        }
+        function_maps, class_maps, file_map = self._build_symbol_maps_from_file_infos(
+            file_infos, records_by_file=records_by_file
+        )
 
         for file_info in file_infos:
             caller_module = self._module_name(file_info.relative_path)
 
-            for record in self._iter_function_records(file_info):
+            for record in records_by_file[file_info.relative_path]:
                 caller_id = str(record["id"])
                 caller_class = record["class_name"]
                 for called_name in list(record.get("calls") or []):
@@ -1690,9 +1896,16 @@ class GraphBuilder:
         ]
 
         rel_count = 0
-        rel_count += self.db.create_calls_relationships_batch(calls_rows)
-        rel_count += self.db.create_imports_relationships_batch(imports_rows)
-        rel_count += self.db.create_inherits_relationships_batch(inherits_rows)
+        with self.db.bulk_session() as session:
+            rel_count += self.db.create_calls_relationships_batch(
+                calls_rows, session=session, assume_new=assume_new
+            )
+            rel_count += self.db.create_imports_relationships_batch(
+                imports_rows, session=session, assume_new=assume_new
+            )
+            rel_count += self.db.create_inherits_relationships_batch(
+                inherits_rows, session=session, assume_new=assume_new
+            )
         return rel_count, warning_count
 
     def _get_changed_files(self, repo_path: Path, base_commit: str) -> List[str]:
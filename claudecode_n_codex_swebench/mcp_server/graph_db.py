@@ -6,11 +6,11 @@ the code-test dependency graph.
 """
 import logging
 import os
-from datetime import datetime
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from neo4j import GraphDatabase, Query
+from neo4j import GraphDatabase, Query, unit_of_work
 from neo4j.exceptions import ServiceUnavailable, AuthError
 
 from .config import config
@@ -18,6 +18,26 @@ from .config import config
 logger = logging.getLogger(__name__)
 
 
+def _contains_queries(rel_op: str) -> Dict[Tuple[str, str], str]:
+    """Build the closed table of CONTAINS queries for one relationship op.
+
+    Labels cannot be parameters in Cypher, and distinct query text defeats
+    Neo4j's plan cache — a fixed table gives plan-cache hits and keeps row
+    values out of the query string. ``rel_op`` is "MERGE" for idempotent
+    upserts or "CREATE" for the full-rebuild fast path.
+    """
+    return {
+        (parent_type, node_type): (
+            "UNWIND $rows AS row\n"
+            f"MATCH (p:{parent_type} {{{'path' if parent_type == 'File' else 'id'}: row.parent_id}})\n"
+            f"MATCH (n{':' + node_type if node_type else ''} {{id: row.node_id}})\n"
+            f"{rel_op} (p)-[:CONTAINS]->(n)\n"
+        )
+        for parent_type in ("File", "Class")
+        for node_type in ("Function", "Class", "Test", "")
+    }
+
+
 class GraphDB:
     """Neo4j Graph Database Manager"""
 
@@ -42,6 +62,17 @@ class GraphDB:
     def run_query(self, session, text: str, **params):
         return session.run(self._wrap_query(text), **params)
 
+    def _unit_of_work(self, fn):
+        """Attach the configured query timeout to a managed-transaction function.
+
+        Transactions reject Query objects, so the timeout that _wrap_query
+        sets for session.run has to travel via the unit_of_work decorator.
+        """
+        timeout = float(self.query_timeout_seconds or 0.0)
+        if timeout > 0:
+            return unit_of_work(timeout=timeout)(fn)
+        return fn
+
     def _connect(self):
         """Establish Neo4j connection"""
         try:
@@ -52,6 +83,9 @@ class GraphDB:
                 auth=(config.neo4j.user, config.neo4j.password),
                 connection_timeout=self.connect_timeout_seconds,
                 max_transaction_retry_time=self.query_timeout_seconds,
+                max_connection_pool_size=config.neo4j.max_connection_pool_size,
+                connection_acquisition_timeout=config.neo4j.connection_acquisition_timeout_seconds,
+                max_connection_lifetime=config.neo4j.max_connection_lifetime_seconds,
             )
 
             # Verify connection
@@ -109,11 +143,20 @@ class GraphDB:
                 "CREATE INDEX file_name IF NOT EXISTS FOR (f:File) ON (f.name)",
                 "CREATE INDEX function_name IF NOT EXISTS FOR (fn:Function) ON (fn.name)",
                 "CREATE INDEX function_symbol_key IF NOT EXISTS FOR (fn:Function) ON (fn.symbol_key)",
+                # Denormalized last name segment ("Class.method" -> "method") so
+                # name-tail lookups are indexed equality, not suffix scans.
+                "CREATE INDEX function_short_name IF NOT EXISTS FOR (fn:Function) ON (fn.short_name)",
+                "CREATE INDEX function_is_test IF NOT EXISTS FOR (fn:Function) ON (fn.is_test)",
                 "CREATE INDEX function_qualified_name IF NOT EXISTS FOR (fn:Function) ON (fn.qualified_name)",
                 "CREATE INDEX class_name IF NOT EXISTS FOR (c:Class) ON (c.name)",
                 "CREATE INDEX class_symbol_key IF NOT EXISTS FOR (c:Class) ON (c.symbol_key)",
                 "CREATE INDEX class_qualified_name IF NOT EXISTS FOR (c:Class) ON (c.qualified_name)",
                 "CREATE INDEX test_name IF NOT EXISTS FOR (t:Test) ON (t.name)",
+                # Impact queries filter on file_path; without these the
+                # planner falls back to label scans.
+                "CREATE INDEX function_file_path IF NOT EXISTS FOR (fn:Function) ON (fn.file_path)",
+                "CREATE INDEX class_file_path IF NOT EXISTS FOR (c:Class) ON (c.file_path)",
+                "CREATE INDEX test_file_path IF NOT EXISTS FOR (t:Test) ON (t.file_path)",
             ]
 
             for index in indexes:
@@ -181,267 +224,147 @@ class GraphDB:
         for i in range(0, len(rows), safe_size):
             yield rows[i:i + safe_size]
 
-    def create_file_node(
-        self,
-        path: str,
-        name: str,
-        content_hash: str,
-        repo_path: str,
-        last_modified: Optional[datetime] = None
-    ) -> str:
-        """Create or update a File node"""
-        with self.driver.session(database=config.neo4j.database) as session:
-            result = session.run(
-                """
-                MERGE (f:File {path: $path})
-                SET f.name = $name,
-                    f.content_hash = $content_hash,
-                    f.repo_path = $repo_path,
-                    f.last_modified = $last_modified,
-                    f.updated_at = datetime()
-                RETURN f.path as path
-                """,
-                path=path,
-                name=name,
-                content_hash=content_hash,
-                repo_path=repo_path,
-                last_modified=last_modified.isoformat() if last_modified else None
-            )
-            return result.single()["path"]
+    @contextmanager
+    def bulk_session(self):
+        """Open one session to share across several batched writes.
 
-    def create_function_node(
-        self,
-        function_id: str,
-        name: str,
-        file_path: str,
-        start_line: int,
-        end_line: int,
-        signature: str,
-        docstring: Optional[str] = None,
-        embedding: Optional[List[float]] = None,
-        symbol_key: Optional[str] = None,
-        module_name: Optional[str] = None,
-        qualified_name: Optional[str] = None,
-    ) -> str:
-        """Create or update a Function node"""
+        Pass the yielded session to the batch writers so a logical unit of
+        work (e.g. persisting all nodes and edges of a build) reuses one
+        pooled connection instead of opening a session per method call.
+        """
         with self.driver.session(database=config.neo4j.database) as session:
-            result = session.run(
-                """
-                MERGE (fn:Function {id: $function_id})
-                SET fn.name = $name,
-                    fn.file_path = $file_path,
-                    fn.start_line = $start_line,
-                    fn.end_line = $end_line,
-                    fn.signature = $signature,
-                    fn.docstring = $docstring,
-                    fn.embedding = $embedding,
-                    fn.symbol_key = $symbol_key,
-                    fn.module_name = $module_name,
-                    fn.qualified_name = $qualified_name,
-                    fn.updated_at = datetime()
-                RETURN fn.id as id
-                """,
-                function_id=function_id,
-                name=name,
-                file_path=file_path,
-                start_line=start_line,
-                end_line=end_line,
-                signature=signature,
-                docstring=docstring,
-                embedding=embedding,
-                symbol_key=symbol_key,
-                module_name=module_name,
-                qualified_name=qualified_name,
-            )
-            return result.single()["id"]
+            yield session
 
-    def create_class_node(
+    def _run_batched(
         self,
-        class_id: str,
-        name: str,
-        file_path: str,
-        start_line: int,
-        end_line: int,
-        docstring: Optional[str] = None,
-        embedding: Optional[List[float]] = None,
-        symbol_key: Optional[str] = None,
-        module_name: Optional[str] = None,
-        qualified_name: Optional[str] = None,
-    ) -> str:
-        """Create or update a Class node"""
-        with self.driver.session(database=config.neo4j.database) as session:
-            result = session.run(
-                """
-                MERGE (c:Class {id: $class_id})
-                SET c.name = $name,
-                    c.file_path = $file_path,
-                    c.start_line = $start_line,
-                    c.end_line = $end_line,
-                    c.docstring = $docstring,
-                    c.embedding = $embedding,
-                    c.symbol_key = $symbol_key,
-                    c.module_name = $module_name,
-                    c.qualified_name = $qualified_name,
-                    c.updated_at = datetime()
-                RETURN c.id as id
-                """,
-                class_id=class_id,
-                name=name,
-                file_path=file_path,
-                start_line=start_line,
-                end_line=end_line,
-                docstring=docstring,
-                embedding=embedding,
-                symbol_key=symbol_key,
-                module_name=module_name,
-                qualified_name=qualified_name,
-            )
-            return result.single()["id"]
+        query: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int,
+        session=None,
+    ) -> None:
+        """Run an UNWIND query over row chunks, reusing the caller's session if given.
 
-    def create_test_node(
-        self,
-        test_id: str,
-        name: str,
-        file_path: str,
-        function_name: str,
-        test_type: str = "pytest"
-    ) -> str:
-        """Create or update a Test node"""
-        with self.driver.session(database=config.neo4j.database) as session:
-            result = session.run(
-                """
-                MERGE (t:Test {id: $test_id})
-                SET t.name = $name,
-                    t.file_path = $file_path,
-                    t.function_name = $function_name,
-                    t.test_type = $test_type,
-                    t.updated_at = datetime()
-                RETURN t.id as id
-                """,
-                test_id=test_id,
-                name=name,
-                file_path=file_path,
-                function_name=function_name,
-                test_type=test_type
-            )
-            return result.single()["id"]
+        Each chunk runs in a managed write transaction: execute_write retries
+        transient failures (deadlocks, leader switches) automatically, so a
+        long indexing run survives them instead of restarting from scratch.
+        """
+        def _write_chunk(tx, chunk):
+            tx.run(query, rows=chunk).consume()
+
+        write_chunk = self._unit_of_work(_write_chunk)
+        if session is not None:
+            for chunk in self._iter_batches(rows, batch_size):
+                session.execute_write(write_chunk, chunk)
+            return
+        with self.driver.session(database=config.neo4j.database) as own_session:
+            for chunk in self._iter_batches(rows, batch_size):
+                own_session.execute_write(write_chunk, chunk)
 
-    def upsert_file_nodes_batch(self, rows: List[Dict[str, Any]]) -> int:
+    def upsert_file_nodes_batch(self, rows: List[Dict[str, Any]], session=None) -> int:
         """Bulk upsert File nodes using UNWIND."""
         if not rows:
             return 0
-        batch_size = config.graph_index.node_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
-                    UNWIND $rows AS row
-                    MERGE (f:File {path: row.path})
-                    SET f.name = row.name,
-                        f.content_hash = row.content_hash,
-                        f.repo_path = row.repo_path,
-                        f.last_modified = row.last_modified,
-                        f.updated_at = datetime()
-                    """,
-                    rows=chunk,
-                )
+        self._run_batched(
+            """
+            UNWIND $rows AS row
+            MERGE (f:File {path: row.path})
+            SET f.name = row.name,
+                f.content_hash = row.content_hash,
+                f.repo_path = row.repo_path,
+                f.last_modified = row.last_modified,
+                f.updated_at = datetime()
+            """,
+            rows,
+            config.graph_index.node_batch_size,
+            session=session,
+        )
         return len(rows)
 
-    def upsert_function_nodes_batch(self, rows: List[Dict[str, Any]]) -> int:
+    def upsert_function_nodes_batch(self, rows: List[Dict[str, Any]], session=None) -> int:
         """Bulk upsert Function nodes using UNWIND."""
         if not rows:
             return 0
-        batch_size = config.graph_index.node_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
-                    UNWIND $rows AS row
-                    MERGE (fn:Function {id: row.function_id})
-                    SET fn.name = row.name,
-                        fn.file_path = row.file_path,
-                        fn.start_line = row.start_line,
-                        fn.end_line = row.end_line,
-                        fn.signature = row.signature,
-                        fn.docstring = row.docstring,
-                        fn.embedding = row.embedding,
-                        fn.symbol_key = row.symbol_key,
-                        fn.module_name = row.module_name,
-                        fn.qualified_name = row.qualified_name,
-                        fn.updated_at = datetime()
-                    """,
-                    rows=chunk,
-                )
+        self._run_batched(
+            """
+            UNWIND $rows AS row
+            MERGE (fn:Function {id: row.function_id})
+            SET fn.name = row.name,
+                fn.short_name = row.short_name,
+                fn.is_test = row.is_test,
+                fn.file_path = row.file_path,
+                fn.start_line = row.start_line,
+                fn.end_line = row.end_line,
+                fn.signature = row.signature,
+                fn.docstring = row.docstring,
+                fn.embedding = row.embedding,
+                fn.symbol_key = row.symbol_key,
+                fn.module_name = row.module_name,
+                fn.qualified_name = row.qualified_name,
+                fn.updated_at = datetime()
+            """,
+            rows,
+            config.graph_index.node_batch_size,
+            session=session,
+        )
         return len(rows)
 
-    def upsert_class_nodes_batch(self, rows: List[Dict[str, Any]]) -> int:
+    def upsert_class_nodes_batch(self, rows: List[Dict[str, Any]], session=None) -> int:
         """Bulk upsert Class nodes using UNWIND."""
         if not rows:
             return 0
-        batch_size = config.graph_index.node_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
-                    UNWIND $rows AS row
-                    MERGE (c:Class {id: row.class_id})
-                    SET c.name = row.name,
-                        c.file_path = row.file_path,
-                        c.start_line = row.start_line,
-                        c.end_line = row.end_line,
-                        c.docstring = row.docstring,
-                        c.embedding = row.embedding,
-                        c.symbol_key = row.symbol_key,
-                        c.module_name = row.module_name,
-                        c.qualified_name = row.qualified_name,
-                        c.updated_at = datetime()
-                    """,
-                    rows=chunk,
-                )
+        self._run_batched(
+            """
+            UNWIND $rows AS row
+            MERGE (c:Class {id: row.class_id})
+            SET c.name = row.name,
+                c.file_path = row.file_path,
+                c.start_line = row.start_line,
+                c.end_line = row.end_line,
+                c.docstring = row.docstring,
+                c.embedding = row.embedding,
+                c.symbol_key = row.symbol_key,
+                c.module_name = row.module_name,
+                c.qualified_name = row.qualified_name,
+                c.updated_at = datetime()
+            """,
+            rows,
+            config.graph_index.node_batch_size,
+            session=session,
+        )
         return len(rows)
 
-    def upsert_test_nodes_batch(self, rows: List[Dict[str, Any]]) -> int:
+    def upsert_test_nodes_batch(self, rows: List[Dict[str, Any]], session=None) -> int:
         """Bulk upsert Test nodes using UNWIND."""
         if not rows:
             return 0
-        batch_size = config.graph_index.node_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
-                    UNWIND $rows AS row
-                    MERGE (t:Test {id: row.test_id})
-                    SET t.name = row.name,
-                        t.file_path = row.file_path,
-                        t.function_name = row.function_name,
-                        t.test_type = row.test_type,
-                        t.updated_at = datetime()
-                    """,
-                    rows=chunk,
-                )
+        self._run_batched(
+            """
+            UNWIND $rows AS row
+            MERGE (t:Test {id: row.test_id})
+            SET t.name = row.name,
+                t.file_path = row.file_path,
+                t.function_name = row.function_name,
+                t.test_type = row.test_type,
+                t.candidate_targets = row.candidate_targets,
+                t.updated_at = datetime()
+            """,
+            rows,
+            config.graph_index.node_batch_size,
+            session=session,
+        )
         return len(rows)
 
     # ========================================================================
     # Relationship Creation
     # ========================================================================
 
-    def create_contains_relationship(self, parent_id: str, node_id: str, node_type: str):
-        """Create CONTAINS relationship from File(path) or Class(id) to a target node."""
-        with self.driver.session(database=config.neo4j.database) as session:
-            session.run(
-                f"""
-                MATCH (n:{node_type} {{id: $node_id}})
-                OPTIONAL MATCH (f:File {{path: $parent_id}})
-                OPTIONAL MATCH (c:Class {{id: $parent_id}})
-                WITH n, coalesce(f, c) as parent
-                WHERE parent IS NOT NULL
-                MERGE (parent)-[:CONTAINS]->(n)
-                """,
-                parent_id=parent_id,
-                node_id=node_id
-            )
+    # Precomputed closed query tables; see _contains_queries for rationale.
+    _CONTAINS_QUERY_BY_GROUP = _contains_queries("MERGE")
+    _CONTAINS_CREATE_QUERY_BY_GROUP = _contains_queries("CREATE")
 
-    def create_contains_relationships_batch(self, rows: List[Dict[str, str]]) -> int:
+    def create_contains_relationships_batch(
+        self, rows: List[Dict[str, str]], session=None, assume_new: bool = False
+    ) -> int:
         """
         Bulk create CONTAINS relationships.
 
@@ -450,185 +373,120 @@ class GraphDB:
         - parent_id
         - node_id
         - node_type: "Function" | "Class" | "Test" (optional but recommended)
+
+        With ``assume_new=True`` (full rebuild into a freshly cleared
+        database, rows deduplicated by the caller) the per-pair MERGE
+        lookup-and-lock is skipped in favour of a plain CREATE.
         """
         if not rows:
             return 0
+        if session is None:
+            with self.bulk_session() as own_session:
+                return self.create_contains_relationships_batch(
+                    rows, session=own_session, assume_new=assume_new
+                )
 
-        parent_key_by_type = {"File": "path", "Class": "id"}
         grouped_rows: Dict[Tuple[str, str], List[Dict[str, str]]] = {}
         skipped_rows = 0
 
         for row in rows:
             parent_type = str(row.get("parent_type") or "")
-            if parent_type not in parent_key_by_type:
+            if parent_type not in ("File", "Class"):
                 skipped_rows += 1
                 continue
             node_type = str(row.get("node_type") or "").strip()
-            key = (parent_type, node_type)
-            grouped_rows.setdefault(key, []).append(row)
+            if node_type not in ("Function", "Class", "Test"):
+                node_type = ""
+            grouped_rows.setdefault((parent_type, node_type), []).append(row)
 
         if skipped_rows:
             logger.warning("Skipped %d CONTAINS rows with invalid parent_type", skipped_rows)
 
+        query_table = (
+            self._CONTAINS_CREATE_QUERY_BY_GROUP if assume_new else self._CONTAINS_QUERY_BY_GROUP
+        )
         batch_size = config.graph_index.edge_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for (parent_type, node_type), rows_for_group in grouped_rows.items():
-                parent_key = parent_key_by_type[parent_type]
-                node_label = ""
-                if node_type in {"Function", "Class", "Test"}:
-                    node_label = f":{node_type}"
-
-                query = (
-                    f"UNWIND $rows AS row\n"
-                    f"MATCH (p:{parent_type} {{{parent_key}: row.parent_id}})\n"
-                    f"MATCH (n{node_label} {{id: row.node_id}})\n"
-                    f"MERGE (p)-[:CONTAINS]->(n)\n"
-                )
-
-                for chunk in self._iter_batches(rows_for_group, batch_size):
-                    session.run(query, rows=chunk)
+        for group_key, rows_for_group in grouped_rows.items():
+            query = query_table[group_key]
+            self._run_batched(query, rows_for_group, batch_size, session=session)
         return len(rows)
 
-    def create_calls_relationship(
-        self,
-        caller_id: str,
-        callee_id: str,
-        resolution_method: str = "exact",
-        resolution_confidence: float = 1.0,
-    ):
-        """Create CALLS relationship between Functions"""
-        with self.driver.session(database=config.neo4j.database) as session:
-            session.run(
-                """
-                MATCH (caller:Function {id: $caller_id})
-                MATCH (callee:Function {id: $callee_id})
-                MERGE (caller)-[r:CALLS]->(callee)
-                SET r.resolution_method = CASE
-                        WHEN r.resolution_confidence IS NULL OR $resolution_confidence >= r.resolution_confidence
-                        THEN $resolution_method
-                        ELSE r.resolution_method
-                    END,
-                    r.resolution_confidence = CASE
-                        WHEN r.resolution_confidence IS NULL THEN $resolution_confidence
-                        WHEN $resolution_confidence > r.resolution_confidence THEN $resolution_confidence
-                        ELSE r.resolution_confidence
-                    END,
-                    r.updated_at = datetime()
-                """,
-                caller_id=caller_id,
-                callee_id=callee_id,
-                resolution_method=resolution_method,
-                resolution_confidence=resolution_confidence,
-            )
+    def create_calls_relationships_batch(
+        self, rows: List[Dict[str, Any]], session=None, assume_new: bool = False
+    ) -> int:
+        """Bulk create CALLS relationships with confidence-aware upserts.
 
-    def create_calls_relationships_batch(self, rows: List[Dict[str, Any]]) -> int:
-        """Bulk create CALLS relationships with confidence-aware upserts."""
+        ``assume_new=True`` switches MERGE to CREATE for full rebuilds into a
+        cleared database where the builder has already deduplicated pairs.
+        """
         if not rows:
             return 0
-        batch_size = config.graph_index.edge_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
-                    UNWIND $rows AS row
-                    MATCH (caller:Function {id: row.caller_id})
-                    MATCH (callee:Function {id: row.callee_id})
-                    MERGE (caller)-[r:CALLS]->(callee)
-                    SET r.resolution_method = CASE
-                            WHEN r.resolution_confidence IS NULL OR row.resolution_confidence >= r.resolution_confidence
-                            THEN row.resolution_method
-                            ELSE r.resolution_method
-                        END,
-                        r.resolution_confidence = CASE
-                            WHEN r.resolution_confidence IS NULL THEN row.resolution_confidence
-                            WHEN row.resolution_confidence > r.resolution_confidence THEN row.resolution_confidence
-                            ELSE r.resolution_confidence
-                        END,
-                        r.updated_at = datetime()
-                    """,
-                    rows=chunk,
-                )
-        return len(rows)
-
-    def create_imports_relationship(self, from_file: str, to_file: str):
-        """Create IMPORTS relationship between Files"""
-        with self.driver.session(database=config.neo4j.database) as session:
-            session.run(
+        if assume_new:
+            self._run_batched(
                 """
-                MATCH (f1:File {path: $from_file})
-                MATCH (f2:File {path: $to_file})
-                MERGE (f1)-[:IMPORTS]->(f2)
+                UNWIND $rows AS row
+                MATCH (caller:Function {id: row.caller_id})
+                MATCH (callee:Function {id: row.callee_id})
+                CREATE (caller)-[r:CALLS]->(callee)
+                SET r.resolution_method = row.resolution_method,
+                    r.resolution_confidence = row.resolution_confidence,
+                    r.updated_at = datetime()
                 """,
-                from_file=from_file,
-                to_file=to_file
+                rows,
+                config.graph_index.edge_batch_size,
+                session=session,
             )
+            return len(rows)
+        self._run_batched(
+            """
+            UNWIND $rows AS row
+            MATCH (caller:Function {id: row.caller_id})
+            MATCH (callee:Function {id: row.callee_id})
+            MERGE (caller)-[r:CALLS]->(callee)
+            SET r.resolution_method = CASE
+                    WHEN r.resolution_confidence IS NULL OR row.resolution_confidence >= r.resolution_confidence
+                    THEN row.resolution_method
+                    ELSE r.resolution_method
+                END,
+                r.resolution_confidence = CASE
+                    WHEN r.resolution_confidence IS NULL THEN row.resolution_confidence
+                    WHEN row.resolution_confidence > r.resolution_confidence THEN row.resolution_confidence
+                    ELSE r.resolution_confidence
+                END,
+                r.updated_at = datetime()
+            """,
+            rows,
+            config.graph_index.edge_batch_size,
+            session=session,
+        )
+        return len(rows)
 
-    def create_imports_relationships_batch(self, rows: List[Dict[str, str]]) -> int:
+    def create_imports_relationships_batch(
+        self, rows: List[Dict[str, str]], session=None, assume_new: bool = False
+    ) -> int:
         """Bulk create IMPORTS relationships between files."""
         if not rows:
             return 0
-        batch_size = config.graph_index.edge_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
-                    UNWIND $rows AS row
-                    MATCH (f1:File {path: row.from_file})
-                    MATCH (f2:File {path: row.to_file})
-                    MERGE (f1)-[:IMPORTS]->(f2)
-                    """,
-                    rows=chunk,
-                )
+        rel_op = "CREATE" if assume_new else "MERGE"
+        self._run_batched(
+            f"""
+            UNWIND $rows AS row
+            MATCH (f1:File {{path: row.from_file}})
+            MATCH (f2:File {{path: row.to_file}})
+            {rel_op} (f1)-[:IMPORTS]->(f2)
+            """,
+            rows,
+            config.graph_index.edge_batch_size,
+            session=session,
+        )
         return len(rows)
 
-    def create_tests_relationship(
-        self,
-        test_id: str,
-        target_id: str,
-        target_type: str,
-        coverage: float = 1.0,
-        link_source: str = "unknown",
-        link_confidence: Optional[float] = None,
-    ):
-        """Create TESTS relationship from Test to Function/Class"""
-        effective_confidence = coverage if link_confidence is None else link_confidence
-        with self.driver.session(database=config.neo4j.database) as session:
-            session.run(
-                f"""
-                MATCH (t:Test {{id: $test_id}})
-                MATCH (target:{target_type} {{id: $target_id}})
-                MERGE (t)-[r:TESTS]->(target)
-                SET r.coverage = CASE
-                        WHEN r.coverage IS NULL OR $coverage > r.coverage THEN $coverage
-                        ELSE r.coverage
-                    END,
-                    r.link_source = CASE
-                        WHEN r.link_confidence IS NULL OR $link_confidence >= r.link_confidence THEN $link_source
-                        ELSE r.link_source
-                    END,
-                    r.link_confidence = CASE
-                        WHEN r.link_confidence IS NULL THEN $link_confidence
-                        WHEN $link_confidence > r.link_confidence THEN $link_confidence
-                        ELSE r.link_confidence
-                    END,
-                    r.updated_at = datetime()
-                """,
-                test_id=test_id,
-                target_id=target_id,
-                coverage=coverage,
-                link_source=link_source,
-                link_confidence=effective_confidence,
-            )
-
-    def create_tests_relationships_batch(self, rows: List[Dict[str, Any]]) -> int:
+    def create_tests_relationships_batch(self, rows: List[Dict[str, Any]], session=None) -> int:
         """Bulk create TESTS relationships from Test to Function/Class."""
         if not rows:
             return 0
-        batch_size = config.graph_index.edge_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
+        self._run_batched(
+            """
                     UNWIND $rows AS row
                     MATCH (t:Test {id: row.test_id})
                     CALL (t, row) {
@@ -673,140 +531,91 @@ class GraphDB:
                         RETURN 1 AS created
                     }
                     RETURN sum(created) AS created_total
-                    """,
-                    rows=chunk,
-                )
+            """,
+            rows,
+            config.graph_index.edge_batch_size,
+            session=session,
+        )
         return len(rows)
 
-    def create_inherits_relationship(
-        self,
-        child_class_id: str,
-        parent_class_id: str,
-        resolution_method: str = "exact",
-        resolution_confidence: float = 1.0,
-    ):
-        """Create INHERITS relationship between Classes"""
-        with self.driver.session(database=config.neo4j.database) as session:
-            session.run(
-                """
-                MATCH (child:Class {id: $child_class_id})
-                MATCH (parent:Class {id: $parent_class_id})
-                MERGE (child)-[r:INHERITS]->(parent)
-                SET r.resolution_method = CASE
-                        WHEN r.resolution_confidence IS NULL OR $resolution_confidence >= r.resolution_confidence
-                        THEN $resolution_method
-                        ELSE r.resolution_method
-                    END,
-                    r.resolution_confidence = CASE
-                        WHEN r.resolution_confidence IS NULL THEN $resolution_confidence
-                        WHEN $resolution_confidence > r.resolution_confidence THEN $resolution_confidence
-                        ELSE r.resolution_confidence
-                    END,
-                    r.updated_at = datetime()
-                """,
-                child_class_id=child_class_id,
-                parent_class_id=parent_class_id,
-                resolution_method=resolution_method,
-                resolution_confidence=resolution_confidence,
-            )
+    def create_inherits_relationships_batch(
+        self, rows: List[Dict[str, Any]], session=None, assume_new: bool = False
+    ) -> int:
+        """Bulk create INHERITS relationships with confidence-aware upserts.
 
-    def create_inherits_relationships_batch(self, rows: List[Dict[str, Any]]) -> int:
-        """Bulk create INHERITS relationships with confidence-aware upserts."""
+        ``assume_new`` has the same semantics as on the CALLS writer.
+        """
         if not rows:
             return 0
-        batch_size = config.graph_index.edge_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
-                    UNWIND $rows AS row
-                    MATCH (child:Class {id: row.child_class_id})
-                    MATCH (parent:Class {id: row.parent_class_id})
-                    MERGE (child)-[r:INHERITS]->(parent)
-                    SET r.resolution_method = CASE
-                            WHEN r.resolution_confidence IS NULL OR row.resolution_confidence >= r.resolution_confidence
-                            THEN row.resolution_method
-                            ELSE r.resolution_method
-                        END,
-                        r.resolution_confidence = CASE
-                            WHEN r.resolution_confidence IS NULL THEN row.resolution_confidence
-                            WHEN row.resolution_confidence > r.resolution_confidence THEN row.resolution_confidence
-                            ELSE r.resolution_confidence
-                        END,
-                        r.updated_at = datetime()
-                    """,
-                    rows=chunk,
-                )
-        return len(rows)
-
-    def create_depends_on_relationship(
-        self,
-        test_id: str,
-        file_path: str,
-        coverage_pct: float,
-        link_source: str = "coverage",
-        link_confidence: Optional[float] = None,
-    ):
-        """Create DEPENDS_ON relationship from Test to File (from coverage data)"""
-        effective_confidence = coverage_pct if link_confidence is None else link_confidence
-        with self.driver.session(database=config.neo4j.database) as session:
-            session.run(
+        if assume_new:
+            self._run_batched(
                 """
-                MATCH (t:Test {id: $test_id})
-                MATCH (f:File {path: $file_path})
-                MERGE (t)-[r:DEPENDS_ON]->(f)
-                SET r.coverage_pct = CASE
-                        WHEN r.coverage_pct IS NULL OR $coverage_pct > r.coverage_pct THEN $coverage_pct
-                        ELSE r.coverage_pct
-                    END,
-                    r.link_source = CASE
-                        WHEN r.link_confidence IS NULL OR $link_confidence >= r.link_confidence THEN $link_source
-                        ELSE r.link_source
-                    END,
-                    r.link_confidence = CASE
-                        WHEN r.link_confidence IS NULL THEN $link_confidence
-                        WHEN $link_confidence > r.link_confidence THEN $link_confidence
-                        ELSE r.link_confidence
-                    END,
+                UNWIND $rows AS row
+                MATCH (child:Class {id: row.child_class_id})
+                MATCH (parent:Class {id: row.parent_class_id})
+                CREATE (child)-[r:INHERITS]->(parent)
+                SET r.resolution_method = row.resolution_method,
+                    r.resolution_confidence = row.resolution_confidence,
                     r.updated_at = datetime()
                 """,
-                test_id=test_id,
-                file_path=file_path,
-                coverage_pct=coverage_pct,
-                link_source=link_source,
-                link_confidence=effective_confidence,
+                rows,
+                config.graph_index.edge_batch_size,
+                session=session,
             )
+            return len(rows)
+        self._run_batched(
+            """
+            UNWIND $rows AS row
+            MATCH (child:Class {id: row.child_class_id})
+            MATCH (parent:Class {id: row.parent_class_id})
+            MERGE (child)-[r:INHERITS]->(parent)
+            SET r.resolution_method = CASE
+                    WHEN r.resolution_confidence IS NULL OR row.resolution_confidence >= r.resolution_confidence
+                    THEN row.resolution_method
+                    ELSE r.resolution_method
+                END,
+                r.resolution_confidence = CASE
+                    WHEN r.resolution_confidence IS NULL THEN row.resolution_confidence
+                    WHEN row.resolution_confidence > r.resolution_confidence THEN row.resolution_confidence
+                    ELSE r.resolution_confidence
+                END,
+                r.updated_at = datetime()
+            """,
+            rows,
+            config.graph_index.edge_batch_size,
+            session=session,
+        )
+        return len(rows)
 
-    def create_depends_on_relationships_batch(self, rows: List[Dict[str, Any]]) -> int:
+    def create_depends_on_relationships_batch(self, rows: List[Dict[str, Any]], session=None) -> int:
         """Bulk create DEPENDS_ON relationships from Test to File."""
         if not rows:
             return 0
-        batch_size = config.graph_index.edge_batch_size
-        with self.driver.session(database=config.neo4j.database) as session:
-            for chunk in self._iter_batches(rows, batch_size):
-                session.run(
-                    """
-                    UNWIND $rows AS row
-                    MATCH (t:Test {id: row.test_id})
-                    MATCH (f:File {path: row.file_path})
-                    MERGE (t)-[r:DEPENDS_ON]->(f)
-                    SET r.coverage_pct = CASE
-                            WHEN r.coverage_pct IS NULL OR row.coverage_pct > r.coverage_pct THEN row.coverage_pct
-                            ELSE r.coverage_pct
-                        END,
-                        r.link_source = CASE
-                            WHEN r.link_confidence IS NULL OR row.link_confidence >= r.link_confidence THEN row.link_source
-                            ELSE r.link_source
-                        END,
-                        r.link_confidence = CASE
-                            WHEN r.link_confidence IS NULL THEN row.link_confidence
-                            WHEN row.link_confidence > r.link_confidence THEN row.link_confidence
-                            ELSE r.link_confidence
-                        END,
-                        r.updated_at = datetime()
-                    """,
-                    rows=chunk,
-                )
+        self._run_batched(
+            """
+            UNWIND $rows AS row
+            MATCH (t:Test {id: row.test_id})
+            MATCH (f:File {path: row.file_path})
+            MERGE (t)-[r:DEPENDS_ON]->(f)
+            SET r.coverage_pct = CASE
+                    WHEN r.coverage_pct IS NULL OR row.coverage_pct > r.coverage_pct THEN row.coverage_pct
+                    ELSE r.coverage_pct
+                END,
+                r.link_source = CASE
+                    WHEN r.link_confidence IS NULL OR row.link_confidence >= r.link_confidence THEN row.link_source
+                    ELSE r.link_source
+                END,
+                r.link_confidence = CASE
+                    WHEN r.link_confidence IS NULL THEN row.link_confidence
+                    WHEN row.link_confidence > r.link_confidence THEN row.link_confidence
+                    ELSE r.link_confidence
+                END,
+                r.updated_at = datetime()
+            """,
+            rows,
+            config.graph_index.edge_batch_size,
+            session=session,
+        )
         return len(rows)
 
     # ========================================================================
@@ -815,28 +624,30 @@ class GraphDB:
 
     def get_stats(self) -> Dict:
         """Get graph statistics"""
+        counts_query = """
+            CALL () {
+                MATCH (f:File) RETURN count(f) AS files
+            }
+            CALL () {
+                MATCH (fn:Function) RETURN count(fn) AS functions
+            }
+            CALL () {
+                MATCH (c:Class) RETURN count(c) AS classes
+            }
+            CALL () {
+                MATCH (t:Test) RETURN count(t) AS tests
+            }
+            CALL () {
+                // Directed: the undirected pattern matches each
+                // relationship twice and doubles the count
+                MATCH ()-[r]->() RETURN count(r) AS rels
+            }
+            RETURN files, functions, classes, tests, rels
+        """
         with self.driver.session(database=config.neo4j.database) as session:
-            counts = self.run_query(
-                session,
-                """
-                CALL () {
-                    MATCH (f:File) RETURN count(f) AS files
-                }
-                CALL () {
-                    MATCH (fn:Function) RETURN count(fn) AS functions
-                }
-                CALL () {
-                    MATCH (c:Class) RETURN count(c) AS classes
-                }
-                CALL () {
-                    MATCH (t:Test) RETURN count(t) AS tests
-                }
-                CALL () {
-                    MATCH ()-[r]-() RETURN count(r) AS rels
-                }
-                RETURN files, functions, classes, tests, rels
-                """
-            ).single()
+            counts = session.execute_read(
+                self._unit_of_work(lambda tx: tx.run(counts_query).single())
+            )
 
             metadata = self.get_index_metadata()
             files = int((counts or {}).get("files", 0) or 0)
@@ -860,16 +671,16 @@ class GraphDB:
     def get_status_metadata(self) -> Dict:
         """Read lightweight metadata for freshness checks without global counts."""
         metadata = self.get_index_metadata()
+        has_node_query = """
+            MATCH (n)
+            WHERE n:File OR n:Function OR n:Class OR n:Test
+            RETURN 1 AS has_node
+            LIMIT 1
+        """
         with self.driver.session(database=config.neo4j.database) as session:
-            has_node = self.run_query(
-                session,
-                """
-                MATCH (n)
-                WHERE n:File OR n:Function OR n:Class OR n:Test
-                RETURN 1 AS has_node
-                LIMIT 1
-                """,
-            ).single()
+            has_node = session.execute_read(
+                self._unit_of_work(lambda tx: tx.run(has_node_query).single())
+            )
         return {
             "total_nodes": 1 if has_node else 0,
             "total_relationships": 0,
@@ -891,9 +702,9 @@ class GraphDB:
         build_warnings_count: int = 0,
     ) -> None:
         """Persist active graph index metadata used by cache validation."""
-        with self.driver.session(database=config.neo4j.database) as session:
-            self.run_query(
-                session,
+
+        def _write(tx):
+            tx.run(
                 """
                 MERGE (m:GraphIndexMetadata {id: 'active'})
                 SET m.last_indexed_repo = $repo_path,
@@ -918,13 +729,16 @@ class GraphDB:
                 graph_version=graph_version,
                 symbol_identity_scheme=symbol_identity_scheme,
                 build_warnings_count=build_warnings_count,
-            )
+            ).consume()
+
+        with self.driver.session(database=config.neo4j.database) as session:
+            session.execute_write(self._unit_of_work(_write))
 
     def get_index_metadata(self) -> Dict:
         """Read active graph index metadata."""
-        with self.driver.session(database=config.neo4j.database) as session:
-            record = self.run_query(
-                session,
+
+        def _read(tx):
+            return tx.run(
                 """
                 MATCH (m:GraphIndexMetadata {id: 'active'})
                 RETURN
@@ -942,6 +756,9 @@ class GraphDB:
                 """
             ).single()
 
+        with self.driver.session(database=config.neo4j.database) as session:
+            record = session.execute_read(self._unit_of_work(_read))
+
         if not record:
             return {
                 "last_indexed_repo": None,
@@ -979,8 +796,9 @@ class GraphDB:
 
     def find_impacted_tests(self, changed_files: List[str]) -> List[Dict]:
         """Find tests impacted by changed files"""
-        with self.driver.session(database=config.neo4j.database) as session:
-            result = session.run(
+
+        def _read(tx):
+            return tx.run(
                 """
                 // Find tests that directly test changed files
                 MATCH (t:Test)-[:TESTS]->(target)-[:CONTAINED_IN]->(f:File)
@@ -1021,9 +839,10 @@ class GraphDB:
                 RETURN DISTINCT t.id as test_id, t.name as test_name, t.file_path as test_file, 0.45 as impact_score
                 """,
                 changed_files=changed_files
-            )
+            ).data()
 
-            return result.data()
+        with self.driver.session(database=config.neo4j.database) as session:
+            return session.execute_read(self._unit_of_work(_read))
 
 
 # Global database instance
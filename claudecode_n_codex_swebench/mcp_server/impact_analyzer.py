@@ -7,6 +7,7 @@ Uses graph traversal to find:
 3. Tests with coverage dependencies on changed files
 """
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -18,6 +19,20 @@ from .graph_db import get_db
 
 logger = logging.getLogger(__name__)
 
+# Shared memoization. Production call sites (server.py, the local
+# interface) construct a fresh ImpactAnalyzer per request, so these caches
+# live at module scope — instance attributes would never hit on the paths
+# that matter.
+#
+# Opened repos by path, invalidated when .git/HEAD changes.
+_REPO_CACHE: Dict[str, Tuple[Optional[float], git.Repo]] = {}
+# Full (tests, diagnostics) results keyed by graph identity plus the
+# analysis inputs; interactive callers re-ask about the same change set
+# repeatedly, while the identity component makes a rebuild miss.
+_RESULT_CACHE: "OrderedDict[Tuple, Tuple[List[Dict], Dict[str, Any]]]" = OrderedDict()
+# Bound for the memoized full-analysis results (LRU eviction)
+_RESULT_CACHE_MAX = 32
+
 
 class ImpactAnalyzer:
     """Analyzes the impact of code changes on tests"""
@@ -28,11 +43,30 @@ class ImpactAnalyzer:
         self._active_changed_symbols: List[Dict[str, Any]] = []
         self._active_changed_symbol_ids: List[str] = []
         self._active_changed_symbol_file_fallbacks: List[str] = []
+        # (key, rows-by-source) from the latest combined impact query; lets
+        # the four _find_* views share one Neo4j round-trip per analysis.
+        self._impact_rows_cache: Optional[Tuple[Any, Dict[str, List[Dict]]]] = None
 
     def get_last_diagnostics(self) -> Dict[str, Any]:
         """Return diagnostics produced by the latest impact analysis call."""
         return dict(self._last_diagnostics)
 
+    def _graph_cache_key(self) -> Optional[Tuple[str, str]]:
+        """Identity + fingerprint of the active graph, or None if unknown."""
+        db = getattr(self, "db", None)
+        get_metadata = getattr(db, "get_index_metadata", None)
+        if not callable(get_metadata):
+            return None
+        try:
+            metadata = get_metadata() or {}
+        except Exception as e:
+            logger.debug(f"Failed to resolve graph identity for result cache: {e}")
+            return None
+        identity = str(metadata.get("graph_identity") or "")
+        if not identity:
+            return None
+        return identity, str(metadata.get("repo_fingerprint") or "")
+
     def _run_query(self, session, query: str, **params):
         run_query = getattr(self.db, "run_query", None)
         if callable(run_query):
@@ -110,8 +144,9 @@ class ImpactAnalyzer:
         """
         logger.info(f"Analyzing test impact for: {repo_path}")
 
+        precomputed_lines: Optional[Dict[str, Set[int]]] = None
         if changed_files is None:
-            changed_files = self._get_changed_files(repo_path, base_commit)
+            changed_files, precomputed_lines = self._collect_changes(repo_path, base_commit)
         changed_files = self._normalize_changed_files(repo_path, changed_files)
 
         weights = self._get_strategy_weights(strategy)
@@ -130,7 +165,45 @@ class ImpactAnalyzer:
             }
             return []
 
-        changed_lines = self._get_changed_lines(repo_path, changed_files, base_commit)
+        if precomputed_lines is not None:
+            changed_lines = {
+                path: lines
+                for path, lines in precomputed_lines.items()
+                if path in changed_files
+            }
+        else:
+            changed_lines = self._get_changed_lines(repo_path, changed_files, base_commit)
+
+        # Keyed on everything downstream depends on — same files, same
+        # changed lines, same scoring knobs — so dirty-worktree edits that
+        # shift lines miss the cache naturally. A graph rebuild between
+        # identical calls is not detected; callers that reindex should use a
+        # fresh analyzer.
+        # Results are only valid for the graph they were computed against,
+        # so the cache is keyed by the active graph identity; when the
+        # identity cannot be resolved, skip caching entirely.
+        graph_key = self._graph_cache_key()
+        cache_key: Optional[Tuple] = None
+        if graph_key is not None:
+            cache_key = (
+                graph_key,
+                str(repo_path),
+                base_commit,
+                selected_strategy,
+                float(impact_threshold),
+                tuple(changed_files),
+                tuple(sorted(
+                    (path, tuple(sorted(lines))) for path, lines in changed_lines.items()
+                )),
+            )
+            cached = _RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(cache_key)
+                cached_tests, cached_diagnostics = cached
+                self._last_diagnostics = dict(cached_diagnostics)
+                logger.info(f"Returning {len(cached_tests)} impacted tests from result cache")
+                return [dict(test) for test in cached_tests]
+
         changed_symbols, symbol_fallback_files = self._resolve_changed_symbols(
             changed_files=changed_files,
             changed_lines=changed_lines,
@@ -142,6 +215,8 @@ class ImpactAnalyzer:
             if symbol.get("target_id")
         ]
         self._active_changed_symbol_file_fallbacks = list(symbol_fallback_files)
+        # Per-analysis cache only: the graph may change between calls
+        self._impact_rows_cache = None
         impacted_tests: Dict[str, Dict[str, Any]] = {}
         strategy_results = {
             "direct": self._find_directly_tested_functions(changed_files),
@@ -202,14 +277,16 @@ class ImpactAnalyzer:
             ):
                 impacted_tests[test_id] = candidate
 
-        for test in strategy_results["direct"]:
-            maybe_update(test, "direct", "Directly tests changed code")
-        for test in strategy_results["transitive"]:
-            maybe_update(test, "transitive", "Transitive call dependency from changed code")
-        for test in strategy_results["coverage"]:
-            maybe_update(test, "coverage", "Coverage dependency on changed file")
-        for test in strategy_results["imports"]:
-            maybe_update(test, "imports", "Imports changed file")
+        # One keyed-max fold over all candidate rows; maybe_update keeps the
+        # best-scoring entry per test_id.
+        for source, reason in (
+            ("direct", "Directly tests changed code"),
+            ("transitive", "Transitive call dependency from changed code"),
+            ("coverage", "Coverage dependency on changed file"),
+            ("imports", "Imports changed file"),
+        ):
+            for test in strategy_results[source]:
+                maybe_update(test, source, reason)
 
         filtered_tests = [
             test for test in impacted_tests.values() if test.get("impact_score", 0.0) >= impact_threshold
@@ -241,6 +318,14 @@ class ImpactAnalyzer:
             "empty_reason": "" if filtered_tests else "no_candidates_above_threshold",
         }
 
+        if cache_key is not None:
+            _RESULT_CACHE[cache_key] = (
+                [dict(test) for test in filtered_tests],
+                dict(self._last_diagnostics),
+            )
+            if len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+                _RESULT_CACHE.popitem(last=False)
+
         logger.info(f"Found {len(filtered_tests)} impacted tests (threshold: {impact_threshold})")
         return filtered_tests
 
@@ -271,23 +356,64 @@ class ImpactAnalyzer:
 
         return normalized
 
-    def _get_changed_files(self, repo_path: Path, base_commit: str) -> List[str]:
-        """Get list of changed files using git diff plus untracked files."""
+    def _repo(self, repo_path: Path) -> git.Repo:
+        """Return a cached git.Repo for the path, reopened if HEAD moved.
+
+        git.Repo construction re-reads .git/config and refs; one analysis
+        touches the repository several times, so keep the handle around and
+        use the mtime of .git/HEAD as a cheap staleness signal.
+        """
+        key = str(repo_path)
+        try:
+            head_mtime: Optional[float] = (Path(repo_path) / ".git" / "HEAD").stat().st_mtime
+        except OSError:
+            head_mtime = None
+        cached = _REPO_CACHE.get(key)
+        if cached is not None and cached[0] == head_mtime:
+            return cached[1]
+        repo = git.Repo(repo_path)
+        _REPO_CACHE[key] = (head_mtime, repo)
+        return repo
+
+    def _collect_changes(
+        self,
+        repo_path: Path,
+        base_commit: str,
+    ) -> Tuple[List[str], Dict[str, Set[int]]]:
+        """Get changed files and their changed lines from one git diff run.
+
+        A single `git diff -U0` yields both the file list and the per-file
+        line numbers, so change discovery costs one git invocation instead of
+        a --name-only pass followed by a -U0 pass. Untracked files are
+        appended from git status with no line data.
+        """
+        files: List[str] = []
+        changed_lines: Dict[str, Set[int]] = {}
+        seen: Set[str] = set()
         try:
-            repo = git.Repo(repo_path)
-            diff = repo.git.diff('--name-only', base_commit)
-            changed_files = [line.strip() for line in diff.splitlines() if line.strip()]
-            untracked_files = [path for path in repo.untracked_files if path]
-            merged: List[str] = []
-            seen: Set[str] = set()
-            for path in changed_files + untracked_files:
-                if path not in seen:
+            repo = self._repo(repo_path)
+            diff_text = repo.git.diff('-U0', base_commit)
+
+            for patched_file in PatchSet(diff_text):
+                file_path = patched_file.path
+                if file_path not in seen:
+                    seen.add(file_path)
+                    files.append(file_path)
+                if patched_file.is_added_file or patched_file.is_modified_file:
+                    lines = set()
+                    for hunk in patched_file:
+                        for line in hunk:
+                            if line.is_added or line.is_removed:
+                                lines.add(line.target_line_no or line.source_line_no)
+                    changed_lines[file_path] = lines
+
+            for path in repo.untracked_files:
+                if path and path not in seen:
                     seen.add(path)
-                    merged.append(path)
-            return [f for f in merged if f.endswith('.py')]
+                    files.append(path)
         except Exception as e:
-            logger.error(f"Error getting changed files from git: {e}")
-            return []
+            logger.error(f"Error collecting changes from git: {e}")
+        return [f for f in files if f.endswith('.py')], changed_lines
 
     def _get_changed_lines(
         self,
@@ -304,7 +430,7 @@ class ImpactAnalyzer:
         changed_lines = {}
 
         try:
-            repo = git.Repo(repo_path)
+            repo = self._repo(repo_path)
             diff_text = repo.git.diff('-U0', base_commit)  # No context lines
 
             # Parse unified diff
@@ -354,7 +480,11 @@ class ImpactAnalyzer:
             else:
                 fallback_files.append(file_path)
 
-        resolved: List[Dict[str, Any]] = []
+        # Stream records instead of buffering result.data(): dedup and file
+        # matching are single-pass, so no intermediate row list is needed.
+        deduped_symbols: List[Dict[str, Any]] = []
+        seen_ids: Set[str] = set()
+        matched_files: Set[str] = set()
         with self.db.driver.session(database=config.neo4j.database) as session:
             if file_rows:
                 result = self._run_query(
@@ -381,154 +511,197 @@ class ImpactAnalyzer:
                     """,
                     rows=file_rows,
                 )
-                resolved.extend(result.data())
+                for record in result:
+                    symbol = record.data()
+                    target_file = str(symbol.get("target_file") or "")
+                    if target_file:
+                        matched_files.add(target_file)
+                    target_id = str(symbol.get("target_id") or "")
+                    if not target_id or target_id in seen_ids:
+                        continue
+                    seen_ids.add(target_id)
+                    deduped_symbols.append(symbol)
 
-        matched_files = {
-            str(symbol.get("target_file") or "")
-            for symbol in resolved
-            if symbol.get("target_file")
-        }
         for file_path in changed_files:
             if file_path not in matched_files and file_path not in fallback_files:
                 fallback_files.append(file_path)
 
-        deduped_symbols: List[Dict[str, Any]] = []
-        seen_ids: Set[str] = set()
-        for symbol in resolved:
-            target_id = str(symbol.get("target_id") or "")
-            if not target_id or target_id in seen_ids:
-                continue
-            seen_ids.add(target_id)
-            deduped_symbols.append(symbol)
-
         deduped_fallbacks = list(dict.fromkeys(path for path in fallback_files if path))
         return deduped_symbols, deduped_fallbacks
 
-    def _find_directly_tested_functions(self, changed_files: List[str]) -> List[Dict]:
-        """Find tests that directly test functions in changed files"""
+    # All four impact sources in one round-trip. UNION requires identical
+    # columns per branch, so each branch returns the superset and nulls the
+    # fields that do not apply to it; nulls are stripped client-side.
+    _ALL_IMPACTS_QUERY = """
+        MATCH (t:Test)-[r:TESTS]->(target)
+        WHERE (target:Function OR target:Class)
+          AND (
+            (size($symbol_ids) > 0 AND target.id IN $symbol_ids)
+            OR target.file_path IN $fallback_files
+            OR (size($symbol_ids) = 0 AND size($fallback_files) = 0 AND target.file_path IN $changed_files)
+          )
+        RETURN DISTINCT
+            'direct' as source,
+            t.id as test_id,
+            t.name as test_name,
+            t.file_path as test_file,
+            target.name as target_function,
+            target.file_path as target_file,
+            target.id as target_id,
+            labels(target)[0] as target_type,
+            null as calling_function,
+            null as called_function,
+            null as traversal_depth,
+            null as coverage_pct,
+            null as covered_file,
+            null as imported_file,
+            coalesce(r.link_confidence, r.coverage, 1.0) as link_confidence,
+            [target.id] as traversal_path
+
+        UNION
+
+        MATCH (t:Test)-[r1:TESTS]->(fn1:Function)
+        MATCH path = (fn1)-[:CALLS*1..3]->(fn2:Function)
+        WHERE (
+            (size($symbol_ids) > 0 AND fn2.id IN $symbol_ids)
+            OR fn2.file_path IN $fallback_files
+            OR (size($symbol_ids) = 0 AND size($fallback_files) = 0 AND fn2.file_path IN $changed_files)
+        )
+        WITH t, r1, fn1, fn2, path,
+            length(path) as traversal_depth,
+            reduce(
+                call_conf = 1.0,
+                rel IN relationships(path) |
+                    call_conf * coalesce(rel.resolution_confidence, 0.7)
+            ) as path_confidence
+        ORDER BY t.id, fn2.id, traversal_depth ASC, path_confidence DESC
+        WITH t, r1, fn1, fn2, collect(
+            {
+                traversal_depth: traversal_depth,
+                path_confidence: path_confidence,
+                traversal_path: [node IN nodes(path) | node.id]
+            }
+        )[0] as best_path
+        RETURN DISTINCT
+            'transitive' as source,
+            t.id as test_id,
+            t.name as test_name,
+            t.file_path as test_file,
+            null as target_function,
+            fn2.file_path as target_file,
+            fn2.id as target_id,
+            null as target_type,
+            fn1.name as calling_function,
+            fn2.name as called_function,
+            best_path.traversal_depth as traversal_depth,
+            null as coverage_pct,
+            null as covered_file,
+            null as imported_file,
+            (
+                coalesce(r1.link_confidence, r1.coverage, 0.8)
+                * best_path.path_confidence
+                * (1.0 / toFloat(best_path.traversal_depth))
+            ) as link_confidence,
+            best_path.traversal_path as traversal_path
+
+        UNION
+
+        MATCH (t:Test)-[r]->(f:File)
+        WHERE type(r) = 'DEPENDS_ON' AND f.path IN $changed_files
+        RETURN DISTINCT
+            'coverage' as source,
+            t.id as test_id,
+            t.name as test_name,
+            t.file_path as test_file,
+            null as target_function,
+            null as target_file,
+            null as target_id,
+            null as target_type,
+            null as calling_function,
+            null as called_function,
+            null as traversal_depth,
+            toFloat(coalesce(r.link_confidence, 0.0)) as coverage_pct,
+            f.path as covered_file,
+            null as imported_file,
+            coalesce(r.link_confidence, 0.5) as link_confidence,
+            [f.path] as traversal_path
+
+        UNION
+
+        MATCH (test_file:File)-[:IMPORTS]->(changed_file:File)
+        WHERE changed_file.path IN $changed_files
+        MATCH (test_file)-[:CONTAINS]->(t:Test)
+        RETURN DISTINCT
+            'imports' as source,
+            t.id as test_id,
+            t.name as test_name,
+            t.file_path as test_file,
+            null as target_function,
+            null as target_file,
+            null as target_id,
+            null as target_type,
+            null as calling_function,
+            null as called_function,
+            null as traversal_depth,
+            null as coverage_pct,
+            null as covered_file,
+            changed_file.path as imported_file,
+            0.45 as link_confidence,
+            [test_file.path, changed_file.path] as traversal_path
+    """
+
+    def _find_all_impacts(self, changed_files: List[str]) -> Dict[str, List[Dict]]:
+        """Run all impact sources as one UNION query, grouped by source tag.
+
+        The grouped rows are cached per (changed files, symbol state) so the
+        four per-source views issue a single Neo4j round-trip between them.
+        """
         symbol_ids = list(self._active_changed_symbol_ids or [])
         fallback_files = list(self._active_changed_symbol_file_fallbacks or [])
+        cache_key = (tuple(changed_files), tuple(symbol_ids), tuple(fallback_files))
+        cached = self._impact_rows_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        rows_by_source: Dict[str, List[Dict]] = {
+            "direct": [],
+            "transitive": [],
+            "coverage": [],
+            "imports": [],
+        }
         with self.db.driver.session(database=config.neo4j.database) as session:
             result = self._run_query(
                 session,
-                """
-                MATCH (t:Test)-[r:TESTS]->(target)
-                WHERE (target:Function OR target:Class)
-                  AND (
-                    (size($symbol_ids) > 0 AND target.id IN $symbol_ids)
-                    OR target.file_path IN $fallback_files
-                    OR (size($symbol_ids) = 0 AND size($fallback_files) = 0 AND target.file_path IN $changed_files)
-                  )
-                RETURN DISTINCT
-                    t.id as test_id,
-                    t.name as test_name,
-                    t.file_path as test_file,
-                    target.name as target_function,
-                    target.file_path as target_file,
-                    target.id as target_id,
-                    labels(target)[0] as target_type,
-                    coalesce(r.link_confidence, r.coverage, 1.0) as link_confidence,
-                    [target.id] as traversal_path
-                """,
+                self._ALL_IMPACTS_QUERY,
                 changed_files=changed_files,
                 symbol_ids=symbol_ids,
                 fallback_files=fallback_files,
             )
-            return result.data()
+            for record in result:
+                data = record.data()
+                source = data.pop("source")
+                rows_by_source[source].append(
+                    {key: value for key, value in data.items() if value is not None}
+                )
+
+        self._impact_rows_cache = (cache_key, rows_by_source)
+        return rows_by_source
+
+    def _find_directly_tested_functions(self, changed_files: List[str]) -> List[Dict]:
+        """Find tests that directly test functions in changed files"""
+        return self._find_all_impacts(changed_files)["direct"]
 
     def _find_transitive_dependencies(self, changed_files: List[str]) -> List[Dict]:
         """Find tests that test functions calling changed functions"""
-        symbol_ids = list(self._active_changed_symbol_ids or [])
-        fallback_files = list(self._active_changed_symbol_file_fallbacks or [])
-        with self.db.driver.session(database=config.neo4j.database) as session:
-            result = self._run_query(
-                session,
-                """
-                MATCH (t:Test)-[r1:TESTS]->(fn1:Function)
-                MATCH path = (fn1)-[:CALLS*1..3]->(fn2:Function)
-                WHERE (
-                    (size($symbol_ids) > 0 AND fn2.id IN $symbol_ids)
-                    OR fn2.file_path IN $fallback_files
-                    OR (size($symbol_ids) = 0 AND size($fallback_files) = 0 AND fn2.file_path IN $changed_files)
-                )
-                WITH t, r1, fn1, fn2, path,
-                    length(path) as traversal_depth,
-                    reduce(
-                        call_conf = 1.0,
-                        rel IN relationships(path) |
-                            call_conf * coalesce(rel.resolution_confidence, 0.7)
-                    ) as path_confidence
-                ORDER BY t.id, fn2.id, traversal_depth ASC, path_confidence DESC
-                WITH t, r1, fn1, fn2, collect(
-                    {
-                        traversal_depth: traversal_depth,
-                        path_confidence: path_confidence,
-                        traversal_path: [node IN nodes(path) | node.id]
-                    }
-                )[0] as best_path
-                RETURN DISTINCT
-                    t.id as test_id,
-                    t.name as test_name,
-                    t.file_path as test_file,
-                    fn1.name as calling_function,
-                    fn2.name as called_function,
-                    fn2.file_path as target_file,
-                    fn2.id as target_id,
-                    best_path.traversal_depth as traversal_depth,
-                    (
-                        coalesce(r1.link_confidence, r1.coverage, 0.8)
-                        * best_path.path_confidence
-                        * (1.0 / toFloat(best_path.traversal_depth))
-                    ) as link_confidence,
-                    best_path.traversal_path as traversal_path
-                """,
-                changed_files=changed_files,
-                symbol_ids=symbol_ids,
-                fallback_files=fallback_files,
-            )
-            return result.data()
+        return self._find_all_impacts(changed_files)["transitive"]
 
     def _find_coverage_dependencies(self, changed_files: List[str]) -> List[Dict]:
         """Find tests with coverage dependencies on changed files"""
-        with self.db.driver.session(database=config.neo4j.database) as session:
-            result = self._run_query(
-                session,
-                """
-                MATCH (t:Test)-[r]->(f:File)
-                WHERE type(r) = 'DEPENDS_ON' AND f.path IN $changed_files
-                RETURN DISTINCT
-                    t.id as test_id,
-                    t.name as test_name,
-                    t.file_path as test_file,
-                    toFloat(coalesce(r.link_confidence, 0.0)) as coverage_pct,
-                    f.path as covered_file,
-                    coalesce(r.link_confidence, 0.5) as link_confidence,
-                    [f.path] as traversal_path
-                """,
-                changed_files=changed_files
-            )
-            return result.data()
+        return self._find_all_impacts(changed_files)["coverage"]
 
     def _find_import_dependencies(self, changed_files: List[str]) -> List[Dict]:
         """Find tests in files that import changed files"""
-        with self.db.driver.session(database=config.neo4j.database) as session:
-            result = self._run_query(
-                session,
-                """
-                MATCH (test_file:File)-[:IMPORTS]->(changed_file:File)
-                WHERE changed_file.path IN $changed_files
-                MATCH (test_file)-[:CONTAINS]->(t:Test)
-                RETURN DISTINCT
-                    t.id as test_id,
-                    t.name as test_name,
-                    t.file_path as test_file,
-                    changed_file.path as imported_file,
-                    0.45 as link_confidence,
-                    [test_file.path, changed_file.path] as traversal_path
-                """,
-                changed_files=changed_files
-            )
-            return result.data()
+        return self._find_all_impacts(changed_files)["imports"]
 
     def get_impact_summary(self, repo_path: Path, changed_files: List[str]) -> Dict:
         """Get a summary of impact analysis"""
@@ -566,14 +739,19 @@ class ImpactAnalyzer:
         self,
         repo_path: Path,
         changed_files: List[str],
-        max_tests: int = 50
+        max_tests: int = 50,
+        impacted_tests: Optional[List[Dict]] = None,
     ) -> List[str]:
         """
         Get minimal set of tests to run for maximum coverage
 
+        Callers that already ran get_impacted_tests can pass its result via
+        impacted_tests to skip re-querying the graph.
+
         Returns list of test identifiers (file::test_name)
         """
-        impacted_tests = self.get_impacted_tests(repo_path, changed_files)
+        if impacted_tests is None:
+            impacted_tests = self.get_impacted_tests(repo_path, changed_files)
 
         top_tests = self._select_tiered_tests(impacted_tests, max_tests=max_tests)
 
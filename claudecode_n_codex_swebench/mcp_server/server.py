@@ -18,9 +18,16 @@ from typing import Any, Callable, Dict, List, Optional
 from uuid import uuid4
 
 from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from .config import config
+from .graph_builder import GraphBuilder
+from .graph_db import close_db, get_db
+from .impact_analyzer import ImpactAnalyzer
+from .test_linker import TestLinker, TestRunner
 
 # Setup logging
 logging.basicConfig(
@@ -229,7 +236,6 @@ async def lifespan(app: FastAPI):
 
     # Initialize Neo4j connection
     try:
-        from .graph_db import get_db, close_db
         db = get_db()
 
         # Verify connection by running a simple query
@@ -252,7 +258,6 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down GraphRAG MCP Server...")
     try:
-        from .graph_db import close_db
         close_db()
         logger.info("Neo4j connection closed")
     except Exception as e:
@@ -267,9 +272,16 @@ app = FastAPI(
     title="TDAD GraphRAG MCP Server",
     description="Test Impact Analysis with GraphRAG for TDAD Thesis",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the large test/impact payloads several times faster
+    # than stdlib json.
+    default_response_class=ORJSONResponse,
 )
 
+# Impacted-test and test-result payloads are repetitive JSON that compresses
+# 5-10x; small responses skip compression entirely.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # ============================================================================
 # In-memory job and cache state
@@ -336,7 +348,6 @@ def _get_stats_cached(force_refresh: bool = False) -> Dict[str, Any]:
         if not force_refresh and _stats_cache.get("data") is not None and now < float(_stats_cache.get("expires_at", 0.0) or 0.0):
             return dict(_stats_cache["data"])
 
-    from .graph_db import get_db
 
     db = get_db()
     stats = db.get_stats()
@@ -398,8 +409,6 @@ async def _run_build_graph_job(job_id: str, request: BuildGraphRequest, job_key:
 
     repo_path = Path(request.repo_path)
     try:
-        from .graph_builder import GraphBuilder
-        from .test_linker import TestLinker
 
         progress_callback = _progress_callback_for_job(job_id)
         builder = GraphBuilder()
@@ -418,7 +427,7 @@ async def _run_build_graph_job(job_id: str, request: BuildGraphRequest, job_key:
         if build_warnings > 0:
             warnings.append(f"Graph build completed with {build_warnings} ambiguous symbol resolutions")
 
-        if request.include_tests:
+        if request.include_tests and not result.get("skipped"):
             progress_callback(
                 {
                     "stage": "link_tests",
@@ -499,13 +508,15 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint"""
-    from .graph_db import get_db
+
+    def _probe() -> bool:
+        return get_db().check_connection()
 
     neo4j_connected = False
     error: Optional[str] = None
     try:
-        db = get_db()
-        neo4j_connected = db.check_connection()
+        # get_db() may block on the initial connection; keep it off the loop
+        neo4j_connected = await asyncio.to_thread(_probe)
     except Exception as e:
         error = str(e)
 
@@ -522,18 +533,22 @@ async def health():
 @app.get("/ready")
 async def ready():
     """Readiness check endpoint (strict DB + schema availability)."""
-    from .graph_db import get_db
 
-    try:
+    def _probe_and_schema() -> bool:
         db = get_db()
         if not db.check_connection():
+            return False
+        db.create_schema()
+        return True
+
+    try:
+        if not await asyncio.to_thread(_probe_and_schema):
             return {
                 "ready": False,
                 "status": "not_ready",
                 "reason": "neo4j_disconnected",
                 "timestamp": datetime.now().isoformat(),
             }
-        db.create_schema()
         return {
             "ready": True,
             "status": "ready",
@@ -552,7 +567,7 @@ async def ready():
 async def get_stats():
     """Get graph statistics"""
     try:
-        stats = _get_stats_cached()
+        stats = await asyncio.to_thread(_get_stats_cached)
         by_type = stats.get("by_type", {})
         active_job = _current_active_job_view() or {}
 
@@ -628,7 +643,7 @@ async def get_stats():
 async def get_graph_meta():
     """Expose graph metadata for identity/freshness checks."""
     try:
-        stats = _get_stats_cached()
+        stats = await asyncio.to_thread(_get_stats_cached)
         active_job = _current_active_job_view() or {}
         return GraphMetaResponse(
             success=True,
@@ -682,7 +697,7 @@ async def build_code_graph(request: BuildGraphRequest):
     3. Identifies test files and links them to code
     4. Stores everything in Neo4j graph database
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     request_id = str(uuid4())
 
     try:
@@ -749,12 +764,12 @@ async def build_code_graph(request: BuildGraphRequest):
                 message="accepted",
             )
 
-        # Import and use graph builder
-        from .graph_builder import GraphBuilder
-        from .test_linker import TestLinker
-
+        # The synchronous branch still must not block the event loop: a
+        # full build can take minutes and would stall every other request
+        # and health check, so run it on a worker thread like the job path.
         builder = GraphBuilder()
-        result = builder.build_graph(
+        result = await asyncio.to_thread(
+            builder.build_graph,
             repo_path,
             request.force_rebuild,
             repo_slug=request.repo_slug,
@@ -768,13 +783,15 @@ async def build_code_graph(request: BuildGraphRequest):
         build_warnings = int(result.get("build_warnings_count", 0) or 0)
         if build_warnings > 0:
             warnings.append(f"Graph build completed with {build_warnings} ambiguous symbol resolutions")
-        if request.include_tests:
+        # A skipped build means the graph (including test links) already
+        # reflects this repo fingerprint, so re-linking would be a no-op.
+        if request.include_tests and not result.get("skipped"):
             linker = TestLinker()
-            test_links = linker.link_tests(repo_path)
+            test_links = await asyncio.to_thread(linker.link_tests, repo_path)
             logger.info(f"Created {test_links['total_links']} test-code links")
             warnings.extend(test_links.get("warnings", []))
 
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
 
         return BuildGraphResponse(
             request_id=request_id,
@@ -784,11 +801,15 @@ async def build_code_graph(request: BuildGraphRequest):
             relationships_created=result["relationships_created"],
             duration_seconds=duration,
             warnings=warnings,
-            message=f"Graph built successfully: {result['files_processed']} files processed"
+            message=(
+                "Graph already current; rebuild skipped"
+                if result.get("skipped")
+                else f"Graph built successfully: {result['files_processed']} files processed"
+            ),
         )
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         logger.error(f"Error building graph: {e}")
         return BuildGraphResponse(
             request_id=request_id,
@@ -825,7 +846,7 @@ async def incremental_update(request: IncrementalUpdateRequest):
 
     Uses git diff to identify changes and updates only affected nodes/edges
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     request_id = str(uuid4())
 
     try:
@@ -835,12 +856,9 @@ async def incremental_update(request: IncrementalUpdateRequest):
 
         logger.info(f"Incrementally updating graph for: {request.repo_path}")
 
-        # Import and use graph builder
-        from .graph_builder import GraphBuilder
-        from .test_linker import TestLinker
-
         builder = GraphBuilder()
-        result = builder.incremental_update(
+        result = await asyncio.to_thread(
+            builder.incremental_update,
             repo_path,
             request.changed_files,
             request.base_commit,
@@ -853,11 +871,11 @@ async def incremental_update(request: IncrementalUpdateRequest):
 
         if request.include_tests:
             linker = TestLinker()
-            test_links = linker.link_tests(repo_path)
+            test_links = await asyncio.to_thread(linker.link_tests, repo_path)
             logger.info(f"Incremental relink created {test_links.get('total_links', 0)} test-code links")
             warnings.extend(test_links.get("warnings", []))
 
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
 
         return IncrementalUpdateResponse(
             request_id=request_id,
@@ -874,7 +892,7 @@ async def incremental_update(request: IncrementalUpdateRequest):
         )
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         logger.error(f"Error updating graph: {e}")
         return IncrementalUpdateResponse(
             request_id=request_id,
@@ -910,10 +928,10 @@ async def get_impacted_tests(request: GetImpactedTestsRequest):
 
         strategy = str(request.strategy or "balanced").strip().lower()
         if strategy == "coverage_diff":
-            from .test_linker import TestLinker
 
             linker = TestLinker()
-            tests = linker.get_impacted_tests_by_coverage(
+            tests = await asyncio.to_thread(
+                linker.get_impacted_tests_by_coverage,
                 repo_path=repo_path,
                 changed_files=request.changed_files,
                 impact_threshold=request.impact_threshold,
@@ -932,8 +950,6 @@ async def get_impacted_tests(request: GetImpactedTestsRequest):
                 "warnings": warnings,
             }
         elif strategy == "hybrid":
-            from .impact_analyzer import ImpactAnalyzer
-            from .test_linker import TestLinker
 
             graph_tests: List[Dict[str, Any]] = []
             coverage_tests: List[Dict[str, Any]] = []
@@ -948,7 +964,8 @@ async def get_impacted_tests(request: GetImpactedTestsRequest):
 
             analyzer = ImpactAnalyzer()
             try:
-                graph_tests = analyzer.get_impacted_tests(
+                graph_tests = await asyncio.to_thread(
+                    analyzer.get_impacted_tests,
                     repo_path,
                     request.changed_files,
                     impact_threshold=request.impact_threshold,
@@ -962,7 +979,8 @@ async def get_impacted_tests(request: GetImpactedTestsRequest):
 
             linker = TestLinker()
             try:
-                coverage_tests = linker.get_impacted_tests_by_coverage(
+                coverage_tests = await asyncio.to_thread(
+                    linker.get_impacted_tests_by_coverage,
                     repo_path=repo_path,
                     changed_files=request.changed_files,
                     impact_threshold=request.impact_threshold,
@@ -1008,10 +1026,10 @@ async def get_impacted_tests(request: GetImpactedTestsRequest):
             )
         else:
             # Graph-based impact analysis (default path)
-            from .impact_analyzer import ImpactAnalyzer
 
             analyzer = ImpactAnalyzer()
-            tests = analyzer.get_impacted_tests(
+            tests = await asyncio.to_thread(
+                analyzer.get_impacted_tests,
                 repo_path,
                 request.changed_files,
                 impact_threshold=request.impact_threshold,
@@ -1019,8 +1037,7 @@ async def get_impacted_tests(request: GetImpactedTestsRequest):
             )
             diagnostics = analyzer.get_last_diagnostics()
             warnings = list(diagnostics.get("warnings", []))
-        from .graph_db import get_db
-        graph_stats = get_db().get_stats()
+        graph_stats = await asyncio.to_thread(lambda: get_db().get_stats())
 
         return GetImpactedTestsResponse(
             request_id=request_id,
@@ -1167,7 +1184,10 @@ def _merge_impacted_tests(
     return merged_rows
 
 
-@app.post("/tools/run_tests", response_model=RunTestsResponse)
+# Documented via `responses` instead of response_model: test_results can hold
+# thousands of rows and Pydantic validation/serialization would walk each one
+# on the hot path, so the handler returns a plain-dict ORJSONResponse.
+@app.post("/tools/run_tests", responses={200: {"model": RunTestsResponse}})
 async def run_tests(request: RunTestsRequest):
     """
     Run tests and track results
@@ -1177,7 +1197,7 @@ async def run_tests(request: RunTestsRequest):
     2. Identifies regressions (PASS_TO_FAIL)
     3. Updates graph with test outcomes
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     request_id = str(uuid4())
 
     try:
@@ -1188,43 +1208,73 @@ async def run_tests(request: RunTestsRequest):
         test_spec = f"{len(request.tests)} specific tests" if request.tests else "all tests"
         logger.info(f"Running {test_spec} for: {request.repo_path}")
 
-        # Import and use test runner
-        from .test_linker import TestRunner
-
         runner = TestRunner()
-        results = runner.run_tests(repo_path, request.tests, request.pytest_args)
-
-        duration = (datetime.now() - start_time).total_seconds()
+        results = await asyncio.to_thread(
+            runner.run_tests, repo_path, request.tests, request.pytest_args
+        )
 
-        return RunTestsResponse(
-            request_id=request_id,
-            success=results["success"],
-            passed=results["passed"],
-            failed=results["failed"],
-            skipped=results["skipped"],
-            regressions=results["regressions"],
-            duration_seconds=duration,
-            test_results=results["test_results"],
-            warnings=[],
+        duration = time.perf_counter() - start_time
+
+        return ORJSONResponse(
+            {
+                "request_id": request_id,
+                "success": results["success"],
+                "passed": results["passed"],
+                "failed": results["failed"],
+                "skipped": results["skipped"],
+                "regressions": results["regressions"],
+                "duration_seconds": duration,
+                "test_results": results["test_results"],
+                "warnings": [],
+                "error": None,
+            }
         )
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         logger.error(f"Error running tests: {e}")
-        return RunTestsResponse(
-            request_id=request_id,
-            success=False,
-            passed=0,
-            failed=0,
-            skipped=0,
-            regressions=0,
-            duration_seconds=duration,
-            test_results=[],
-            warnings=[],
-            error=str(e)
+        return ORJSONResponse(
+            {
+                "request_id": request_id,
+                "success": False,
+                "passed": 0,
+                "failed": 0,
+                "skipped": 0,
+                "regressions": 0,
+                "duration_seconds": duration,
+                "test_results": [],
+                "warnings": [],
+                "error": str(e),
+            }
         )
 
 
+@app.post("/tools/run_tests_stream")
+async def run_tests_stream(request: RunTestsRequest):
+    """
+    Run tests and stream per-test results as NDJSON.
+
+    Streaming variant of /tools/run_tests: each line is a JSON object of
+    type "test" (emitted as pytest reports it), followed by a final
+    "summary" line. First-byte latency drops from suite duration to the
+    first test's duration and server memory stays O(1); the one-shot
+    endpoint keeps its aggregate contract for existing callers.
+    """
+    repo_path = Path(request.repo_path)
+    if not repo_path.exists():
+        raise HTTPException(status_code=404, detail=f"Repository not found: {request.repo_path}")
+
+    runner = TestRunner()
+
+    def ndjson_lines():
+        for row in runner.stream_tests(repo_path, request.tests, request.pytest_args):
+            yield orjson.dumps(row) + b"\n"
+
+    # Starlette iterates sync generators in its threadpool, keeping the
+    # event loop free while pytest runs.
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @app.post("/tools/clear_database", response_model=ClearDatabaseResponse)
 async def clear_database():
     """
@@ -1236,10 +1286,9 @@ async def clear_database():
     try:
         logger.info("Clearing Neo4j database...")
 
-        from .graph_db import get_db
 
         db = get_db()
-        db.clear_database()
+        await asyncio.to_thread(db.clear_database)
         _invalidate_stats_cache()
 
         logger.info("Database cleared successfully")
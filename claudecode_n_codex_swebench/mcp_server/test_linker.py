@@ -6,15 +6,20 @@ Uses multiple strategies:
 2. Coverage data (coverage.py results)
 3. Static analysis (imports and calls from test files)
 """
+import concurrent.futures
+import importlib.util
+import json
 import logging
 import os
 import re
 import shlex
 import subprocess
 import sys
+import threading
 import time
 from collections import defaultdict
 from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -25,6 +30,59 @@ from .graph_db import get_db
 
 logger = logging.getLogger(__name__)
 
+# Matches verbose pytest result lines like
+# "tests/test_foo.py::test_bar PASSED"; compiled once at import instead of
+# per line inside the parse loop.
+_PYTEST_LINE_RE = re.compile(r"^(.+?)::(test_\S+)\s+(PASSED|FAILED|SKIPPED)")
+
+# pytest-json-report gives structured per-test outcomes; fall back to regex
+# parsing of the verbose output when the plugin is not installed.
+_HAS_JSON_REPORT = importlib.util.find_spec("pytest_jsonreport") is not None
+
+
+@lru_cache(maxsize=4096)
+def _infer_target_names_cached(test_name: str, min_plain_len: int) -> Tuple[str, ...]:
+    """Pure inference of target function names from a normalized test name.
+
+    Memoized because parametrized test IDs collapse to the same base name
+    after suffix stripping, making repeat lookups common in the hot loop.
+    """
+    target_names = []
+
+    # Pattern 1: test_function_name -> function_name
+    if test_name.startswith("test_"):
+        target_name = test_name[5:]  # Remove "test_" prefix
+        target_names.append(target_name)
+
+        # Pattern 2: test_class_method -> method. Emit each underscore tail
+        # by slicing from the found separator rather than split + join, which
+        # rebuilt every tail from its parts.
+        sep = test_name.find("_", 5)
+        while sep != -1:
+            target_names.append(test_name[sep + 1:])
+            sep = test_name.find("_", sep + 1)
+
+    # Pattern 3: TestClass.test_method -> method
+    if "." in test_name:
+        parts = test_name.split(".")
+        if len(parts) == 2:
+            method_name = parts[1]
+            if method_name.startswith("test_"):
+                target_names.append(method_name[5:])
+
+    filtered: List[str] = []
+    seen: Set[str] = set()
+    for name in target_names:
+        if not name or name in seen:
+            continue
+        # Drop very short single-token targets (e.g., "at", "_") that explode candidate sets.
+        if "." not in name and "_" not in name and len(name) < min_plain_len:
+            continue
+        seen.add(name)
+        filtered.append(name)
+
+    return tuple(filtered)
+
 
 class TestLinker:
     """Links tests to source code using multiple strategies"""
@@ -55,30 +113,48 @@ class TestLinker:
 
         total_links = 0
 
-        # Strategy 1: Naming conventions
-        naming_links = self._link_by_naming_convention(repo_path)
-        total_links += naming_links
-        logger.info(f"Created {naming_links} links via naming conventions")
-
-        # Strategy 2: Coverage data
-        coverage_links = 0
+        # Coverage is dominated by the pytest subprocess, so run it on a
+        # worker thread while the DB-bound naming and static passes proceed
+        # here. Each strategy opens its own Bolt session, so the only shared
+        # state is the warnings list.
+        coverage_future = None
+        executor = None
         if config.analysis.use_coverage:
-            try:
-                coverage_links = self._link_by_coverage(repo_path)
-                total_links += coverage_links
-                logger.info(f"Created {coverage_links} links via coverage data")
-            except Exception as e:
-                msg = f"Coverage linking failed: {e}"
-                self._warn(msg)
-                if not getattr(config.analysis, "coverage_fail_open", True):
-                    raise
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            coverage_future = executor.submit(self._link_by_coverage, repo_path)
         else:
             self._warn("Coverage linking disabled for fast indexing (set GRAPH_LINK_USE_COVERAGE=1 to enable)")
 
-        # Strategy 3: Static analysis
-        static_links = self._link_by_static_analysis(repo_path)
-        total_links += static_links
-        logger.info(f"Created {static_links} links via static analysis")
+        try:
+            # One session serves both DB-bound strategies so the pool
+            # connection is checked out once. The coverage thread must not
+            # share it: Bolt sessions are not thread-safe.
+            with self.db.driver.session(database=config.neo4j.database) as session:
+                # Strategy 1: Naming conventions
+                naming_links = self._link_by_naming_convention(repo_path, session=session)
+                total_links += naming_links
+                logger.info(f"Created {naming_links} links via naming conventions")
+
+                # Strategy 3: Static analysis
+                static_links = self._link_by_static_analysis(repo_path, session=session)
+                total_links += static_links
+                logger.info(f"Created {static_links} links via static analysis")
+
+            # Strategy 2: Coverage data (joined last; see above)
+            coverage_links = 0
+            if coverage_future is not None:
+                try:
+                    coverage_links = coverage_future.result()
+                    total_links += coverage_links
+                    logger.info(f"Created {coverage_links} links via coverage data")
+                except Exception as e:
+                    msg = f"Coverage linking failed: {e}"
+                    self._warn(msg)
+                    if not getattr(config.analysis, "coverage_fail_open", True):
+                        raise
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         return {
             "total_links": total_links,
@@ -88,13 +164,13 @@ class TestLinker:
             "warnings": list(self._warnings),
         }
 
-    def _link_by_naming_convention(self, repo_path: Path) -> int:
+    def _link_by_naming_convention(self, repo_path: Path, session=None) -> int:
         """Link tests to functions based on naming conventions"""
         link_rows: List[Dict[str, object]] = []
         linked_pairs: Set[Tuple[str, str]] = set()
 
-        tests = self._get_test_nodes()
-        function_rows = self._get_function_nodes_for_naming()
+        tests = self._get_test_nodes(session=session)
+        function_rows = self._get_function_nodes_for_naming(session=session)
         candidate_index = self._build_function_candidate_index(function_rows)
         candidate_cache: Dict[str, List[Dict[str, str]]] = {}
         max_candidates = max(
@@ -124,7 +200,13 @@ class TestLinker:
             # test_class_method -> Class.method
             # TestClass.test_method -> Class.method
 
-            target_names = self._infer_target_names(test_name)
+            # Targets persisted at ingest skip re-inference entirely; fall
+            # back to inference for graphs built before the property existed.
+            persisted_targets = test.get("candidate_targets")
+            if persisted_targets is not None:
+                target_names = list(persisted_targets)
+            else:
+                target_names = self._infer_target_names(test_name)
 
             for target_name in target_names:
                 if target_name not in candidate_cache:
@@ -174,62 +256,32 @@ class TestLinker:
                     len(candidate_cache),
                 )
 
-        self.db.create_tests_relationships_batch(link_rows)
+        self.db.create_tests_relationships_batch(link_rows, session=session)
         return len(link_rows)
 
     def _infer_target_names(self, test_name: str) -> List[str]:
         """Infer possible target function names from test name"""
-        target_names = []
-
-        # Pattern 1: test_function_name -> function_name
-        if test_name.startswith("test_"):
-            target_name = test_name[5:]  # Remove "test_" prefix
-            target_names.append(target_name)
-
-        # Pattern 2: test_class_method -> method
-        parts = test_name.split("_")
-        if len(parts) > 2 and parts[0] == "test":
-            # Try each part as potential method name
-            for i in range(1, len(parts)):
-                target_names.append("_".join(parts[i:]))
-
-        # Pattern 3: TestClass.test_method -> method
-        if "." in test_name:
-            parts = test_name.split(".")
-            if len(parts) == 2:
-                method_name = parts[1]
-                if method_name.startswith("test_"):
-                    target_names.append(method_name[5:])
-
+        # Parametrized IDs (test_foo[case1], test_foo[case2]) normalize to the
+        # same base name, so strip the suffix before memoizing.
+        base_name = test_name.split("[", 1)[0]
         min_plain_len = max(2, int(os.getenv("GRAPH_NAMING_MIN_PLAIN_TARGET_LEN", "3")))
-        filtered: List[str] = []
-        seen: Set[str] = set()
-        for name in target_names:
-            if not name or name in seen:
-                continue
-            # Drop very short single-token targets (e.g., "at", "_") that explode candidate sets.
-            if "." not in name and "_" not in name and len(name) < min_plain_len:
-                continue
-            seen.add(name)
-            filtered.append(name)
+        return list(_infer_target_names_cached(base_name, min_plain_len))
 
-        return filtered
-
-    def _get_function_nodes_for_naming(self) -> List[Dict[str, str]]:
+    def _get_function_nodes_for_naming(self, session=None) -> List[Dict[str, str]]:
         """Fetch function nodes needed for naming-based linking."""
+        query = """
+            MATCH (fn:Function)
+            RETURN
+                fn.id as function_id,
+                fn.name as function_name,
+                fn.short_name as short_name,
+                fn.file_path as function_file,
+                fn.qualified_name as qualified_name
+            """
+        if session is not None:
+            return self._run_query(session, query).data()
         with self.db.driver.session(database=config.neo4j.database) as session:
-            result = self._run_query(
-                session,
-                """
-                MATCH (fn:Function)
-                RETURN
-                    fn.id as function_id,
-                    fn.name as function_name,
-                    fn.file_path as function_file,
-                    fn.qualified_name as qualified_name
-                """
-            )
-            return result.data()
+            return self._run_query(session, query).data()
 
     def _build_function_candidate_index(
         self,
@@ -248,7 +300,10 @@ class TestLinker:
                 continue
 
             by_exact_name[function_name].append(row)
-            by_name_tail[function_name.rsplit(".", 1)[-1]].append(row)
+            # Prefer the short_name denormalized at ingest; fall back to
+            # splitting for graphs built before the property existed.
+            short_name = str(row.get("short_name") or "") or function_name.rsplit(".", 1)[-1]
+            by_name_tail[short_name].append(row)
 
             if qualified_name:
                 by_qualified_tail[qualified_name.rsplit(".", 1)[-1]].append(row)
@@ -826,6 +881,104 @@ class TestLinker:
 
         return coverage_by_test
 
+    # Directories never descended into by the freshness scan
+    _COVERAGE_SCAN_SKIP_DIRS = frozenset(
+        {"__pycache__", "venv", "env", "node_modules", "site-packages"}
+    )
+    # Sidecar recording what scope produced .coverage; lives under .git/ so
+    # it never dirties the working tree being analyzed.
+    _COVERAGE_SCOPE_MARKER = "tdad_coverage_scope.json"
+
+    def _coverage_scope_marker_path(self, repo_path: Path) -> Optional[Path]:
+        """Path of the coverage-scope sidecar, or None outside a git repo."""
+        git_dir = repo_path / ".git"
+        if git_dir.is_dir():
+            return git_dir / self._COVERAGE_SCOPE_MARKER
+        return None
+
+    def _record_full_suite_coverage(self, repo_path: Path, coverage_file: Path) -> None:
+        """Mark .coverage as full-suite data eligible for later reuse."""
+        marker = self._coverage_scope_marker_path(repo_path)
+        if marker is None:
+            return
+        try:
+            stat = coverage_file.stat()
+            marker.write_text(json.dumps({
+                "scope": "full",
+                "coverage_mtime": stat.st_mtime,
+                "coverage_size": stat.st_size,
+            }))
+        except OSError as e:
+            logger.debug(f"Failed to record coverage scope marker: {e}")
+
+    def _discard_partial_coverage(self, repo_path: Path, coverage_file: Path) -> None:
+        """Drop .coverage written by a targeted run so it cannot be reused."""
+        try:
+            if coverage_file.exists():
+                coverage_file.unlink()
+        except OSError:
+            pass
+        marker = self._coverage_scope_marker_path(repo_path)
+        if marker is not None:
+            try:
+                if marker.exists():
+                    marker.unlink()
+            except OSError:
+                pass
+
+    def _coverage_data_is_fresh(self, repo_path: Path, coverage_file: Path) -> bool:
+        """Return True when .coverage holds reusable full-suite data.
+
+        The scope marker guards against silently reusing partial data: a
+        .coverage written by a targeted run (or left behind by the repo
+        under analysis) has no matching marker and is never reused. The
+        source scan prunes virtualenvs and caches the same way graph
+        building does instead of rglob-ing the whole tree.
+        """
+        try:
+            if not coverage_file.is_file():
+                return False
+            marker = self._coverage_scope_marker_path(repo_path)
+            if marker is None or not marker.is_file():
+                return False
+            try:
+                scope_meta = json.loads(marker.read_text())
+            except (OSError, ValueError):
+                return False
+            stat = coverage_file.stat()
+            if (
+                scope_meta.get("scope") != "full"
+                or scope_meta.get("coverage_mtime") != stat.st_mtime
+                or scope_meta.get("coverage_size") != stat.st_size
+            ):
+                return False
+            coverage_mtime = stat.st_mtime
+            stack = [str(repo_path)]
+            while stack:
+                directory = stack.pop()
+                try:
+                    entries = os.scandir(directory)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith("."):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if name not in self._COVERAGE_SCAN_SKIP_DIRS:
+                                    stack.append(entry.path)
+                            elif name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                                if entry.stat().st_mtime > coverage_mtime:
+                                    return False
+                        except OSError:
+                            continue
+            return True
+        except Exception as e:
+            logger.debug(f"Coverage freshness check failed: {e}")
+            return False
+
     def _run_coverage(
         self,
         repo_path: Path,
@@ -845,10 +998,22 @@ class TestLinker:
         extra_args = str(getattr(config.analysis, "coverage_pytest_extra_args", "") or "")
 
         try:
+            normalized_selected_tests = self._normalize_selected_tests(selected_tests or [])
+
+            # Full-suite runs can reuse an existing .coverage file when no
+            # source changed since it was written; targeted runs always
+            # re-execute because their scope differs per call.
+            if not normalized_selected_tests and self._coverage_data_is_fresh(
+                repo_path, coverage_file
+            ):
+                logger.info("Reusing fresh .coverage data; skipping pytest run")
+                cov_data = CoverageData(basename=str(coverage_file))
+                cov_data.read()
+                return self._extract_per_test_coverage(repo_path, cov_data)
+
             if coverage_file.exists():
                 coverage_file.unlink()
 
-            normalized_selected_tests = self._normalize_selected_tests(selected_tests or [])
             selected_scope: List[str] = []
             if normalized_selected_tests:
                 selected_scope = normalized_selected_tests
@@ -882,6 +1047,17 @@ class TestLinker:
                 "--cov-report=",
                 "-q",
             ]
+            parallel_workers = max(
+                0, int(getattr(config.analysis, "coverage_parallel_workers", 0))
+            )
+            if parallel_workers > 0:
+                if importlib.util.find_spec("xdist") is not None:
+                    base_cmd.extend(["-n", str(parallel_workers)])
+                else:
+                    self._warn(
+                        "GRAPH_COVERAGE_PARALLEL_WORKERS set but pytest-xdist "
+                        "is not installed; running coverage serially"
+                    )
             if extra_args:
                 base_cmd.extend(shlex.split(extra_args))
             base_cmd.extend(selected_scope)
@@ -965,8 +1141,16 @@ class TestLinker:
 
             cov_data = CoverageData(basename=str(coverage_file))
             cov_data.read()
+            per_test_coverage = self._extract_per_test_coverage(repo_path, cov_data)
 
-            return self._extract_per_test_coverage(repo_path, cov_data)
+            if normalized_selected_tests:
+                # Partial-scope data must never satisfy a later full-suite
+                # freshness check.
+                self._discard_partial_coverage(repo_path, coverage_file)
+            else:
+                self._record_full_suite_coverage(repo_path, coverage_file)
+
+            return per_test_coverage
 
         except subprocess.TimeoutExpired:
             self._warn(f"Coverage run timed out after {effective_timeout}s")
@@ -1168,17 +1352,20 @@ class TestLinker:
 
         return test_coverage
 
-    def _get_test_nodes(self) -> List[Dict]:
+    def _get_test_nodes(self, session=None) -> List[Dict]:
         """Fetch test nodes from graph."""
+        query = """
+            MATCH (t:Test)
+            RETURN
+                t.id as test_id,
+                t.name as test_name,
+                t.file_path as test_file,
+                t.candidate_targets as candidate_targets
+            """
+        if session is not None:
+            return self._run_query(session, query).data()
         with self.db.driver.session(database=config.neo4j.database) as session:
-            result = self._run_query(
-                session,
-                """
-                MATCH (t:Test)
-                RETURN t.id as test_id, t.name as test_name, t.file_path as test_file
-                """
-            )
-            return result.data()
+            return self._run_query(session, query).data()
 
     def _build_test_nodeid_index(self, test_nodes: List[Dict]) -> Dict[str, str]:
         """Build lookup from pytest nodeid to graph test id."""
@@ -1276,45 +1463,52 @@ class TestLinker:
         """Strip pytest parametrization suffix from nodeid."""
         return re.sub(r"\[[^\]]+\]$", "", nodeid)
 
-    def _link_by_static_analysis(self, repo_path: Path) -> int:
+    def _link_by_static_analysis(self, repo_path: Path, session=None) -> int:
         """Link tests to code by analyzing function calls from test files.
 
         Strategy: Find Test functions that CALL production Functions.
         Since Test nodes are created alongside Function nodes for test functions,
         we match them by name/file_path and trace CALLS relationships.
         """
-        link_rows: List[Dict[str, object]] = []
-
-        with self.db.driver.session(database=config.neo4j.database) as session:
-            # Find Test functions that CALL production Functions
-            # Test nodes share function_name and file_path with their Function nodes
-            result = self._run_query(
-                session,
-                """
-                MATCH (t:Test)
-                MATCH (tf:Function)
-                WHERE tf.name = t.function_name AND tf.file_path = t.file_path
-                MATCH (tf)-[:CALLS]->(pf:Function)
-                WHERE NOT pf.file_path CONTAINS 'test'
-                RETURN DISTINCT t.id as test_id, pf.id as function_id, pf.name as function_name
-                """
-            )
+        # Find Test functions that CALL production Functions. Test nodes share
+        # function_name and file_path with their Function nodes. The whole
+        # pass runs server-side: candidate edges never cross the wire just to
+        # be written straight back, and the confidence-aware SET mirrors
+        # create_tests_relationships_batch.
+        query = """
+            MATCH (t:Test)
+            MATCH (tf:Function)
+            WHERE tf.name = t.function_name AND tf.file_path = t.file_path
+            MATCH (tf)-[:CALLS]->(pf:Function)
+            // Indexed boolean set at ingest; the CONTAINS fallback keeps
+            // graphs built before the flag existed behaving the same.
+            WHERE NOT coalesce(pf.is_test, pf.file_path CONTAINS 'test')
+            WITH DISTINCT t, pf
+            MERGE (t)-[r:TESTS]->(pf)
+            SET r.coverage = CASE
+                    WHEN r.coverage IS NULL OR 0.8 > r.coverage THEN 0.8
+                    ELSE r.coverage
+                END,
+                r.link_source = CASE
+                    WHEN r.link_confidence IS NULL OR 0.8 >= r.link_confidence THEN 'static'
+                    ELSE r.link_source
+                END,
+                r.link_confidence = CASE
+                    WHEN r.link_confidence IS NULL OR 0.8 > r.link_confidence THEN 0.8
+                    ELSE r.link_confidence
+                END,
+                r.updated_at = datetime()
+            RETURN count(r) AS links
+        """
 
-            for record in result:
-                link_rows.append(
-                    {
-                        "test_id": record["test_id"],
-                        "target_id": record["function_id"],
-                        "target_type": "Function",
-                        "coverage": 0.8,
-                        "link_source": "static",
-                        "link_confidence": 0.8,
-                    }
-                )
-                logger.debug(f"Static link: {record['test_id']} -> {record['function_name']}")
+        def _write(tx):
+            record = tx.run(query).single()
+            return int(record["links"] if record and record["links"] is not None else 0)
 
-        self.db.create_tests_relationships_batch(link_rows)
-        return len(link_rows)
+        if session is not None:
+            return session.execute_write(_write)
+        with self.db.driver.session(database=config.neo4j.database) as session:
+            return session.execute_write(_write)
 
 
 class TestRunner:
@@ -1337,6 +1531,15 @@ class TestRunner:
 
         # Build pytest command
         cmd = ["pytest", "-v", "--tb=short"]
+        report_file: Optional[Path] = None
+        if _HAS_JSON_REPORT:
+            report_file = repo_path / f".pytest_report_{os.getpid()}.json"
+            cmd.extend(["--json-report", f"--json-report-file={report_file}"])
+        # Surface failing tests first on reruns so regressions are reported
+        # sooner; skipped when the caller passes their own ordering flags.
+        ordering_flags = {"--ff", "--failed-first", "--lf", "--last-failed", "--nf", "--new-first"}
+        if not ordering_flags.intersection(pytest_args):
+            cmd.append("--ff")
         cmd.extend(pytest_args)
 
         if tests:
@@ -1356,8 +1559,12 @@ class TestRunner:
                 timeout=600
             )
 
-            # Parse results
-            test_results = self._parse_pytest_output(result.stdout)
+            # Parse results: structured report when available, regex fallback
+            test_results = None
+            if report_file is not None:
+                test_results = self._load_json_report(report_file)
+            if test_results is None:
+                test_results = self._parse_pytest_output(result.stdout)
 
             passed = sum(1 for t in test_results if t["status"] == "passed")
             failed = sum(1 for t in test_results if t["status"] == "failed")
@@ -1401,16 +1608,138 @@ class TestRunner:
                 "test_results": [],
                 "error": str(e)
             }
+        finally:
+            if report_file is not None:
+                try:
+                    report_file.unlink()
+                except OSError:
+                    pass
+
+    def stream_tests(
+        self,
+        repo_path: Path,
+        tests: Optional[List[str]] = None,
+        pytest_args: Optional[List[str]] = None,
+        timeout: int = 600,
+    ):
+        """Yield per-test result rows as pytest emits them, then a summary row.
+
+        Streaming counterpart to run_tests: results are parsed from the
+        verbose output line-by-line so callers see the first outcome after
+        the first test instead of after the whole suite, with O(1) memory.
+        """
+        logger.info(f"Streaming tests in: {repo_path}")
+
+        cmd = ["pytest", "-v", "--tb=short"]
+        cmd.extend(pytest_args or [])
+        if tests:
+            cmd.extend(tests)
+
+        passed = failed = skipped = 0
+        process = subprocess.Popen(
+            cmd,
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        # Enforce the deadline independently of output: a hung pytest that
+        # emits nothing would otherwise block readline forever and the
+        # timeout error could never fire. The timer kills the process, which
+        # closes stdout and unblocks the read loop.
+        timed_out = threading.Event()
+
+        def _on_timeout():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(max(1, timeout), _on_timeout)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in process.stdout:
+                if timed_out.is_set():
+                    break
+                match = _PYTEST_LINE_RE.match(line)
+                if not match:
+                    continue
+                file_path, test_name, status = match.groups()
+                status = status.lower()
+                if status == "passed":
+                    passed += 1
+                elif status == "failed":
+                    failed += 1
+                else:
+                    skipped += 1
+                yield {
+                    "type": "test",
+                    "file": file_path,
+                    "name": test_name,
+                    "status": status,
+                    "full_name": f"{file_path}::{test_name}",
+                }
+            returncode = process.wait()
+            if timed_out.is_set():
+                yield {"type": "error", "error": f"Timeout after {timeout}s"}
+                return
+            yield {
+                "type": "summary",
+                "success": returncode == 0,
+                "passed": passed,
+                "failed": failed,
+                "skipped": skipped,
+                "regressions": failed,
+            }
+        except Exception as e:
+            logger.error(f"Error streaming tests: {e}")
+            yield {"type": "error", "error": str(e)}
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+
+    # pytest-json-report outcomes beyond the plain three are folded into them.
+    _JSON_OUTCOME_MAP = {
+        "passed": "passed",
+        "failed": "failed",
+        "skipped": "skipped",
+        "xfailed": "skipped",
+        "xpassed": "passed",
+        "error": "failed",
+    }
+
+    def _load_json_report(self, report_file: Path) -> Optional[List[Dict]]:
+        """Parse a pytest-json-report file into result rows; None on failure."""
+        try:
+            with open(report_file, "r", encoding="utf-8") as handle:
+                report = json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+        test_results = []
+        for entry in report.get("tests", []):
+            nodeid = str(entry.get("nodeid") or "")
+            outcome = str(entry.get("outcome") or "").lower()
+            status = self._JSON_OUTCOME_MAP.get(outcome)
+            if not nodeid or status is None:
+                continue
+            test_file, _, test_name = nodeid.partition("::")
+            test_results.append({
+                "file": test_file,
+                "name": test_name,
+                "status": status,
+                "full_name": nodeid,
+            })
+        return test_results
 
     def _parse_pytest_output(self, output: str) -> List[Dict]:
         """Parse pytest output to extract test results"""
         test_results = []
 
         # Simple regex parsing (could be improved with pytest-json-report plugin)
-        lines = output.splitlines()
-        for line in lines:
+        for line in output.splitlines():
             # Match lines like: "tests/test_foo.py::test_bar PASSED"
-            match = re.match(r"^(.+?)::(test_\S+)\s+(PASSED|FAILED|SKIPPED)", line)
+            match = _PYTEST_LINE_RE.match(line)
             if match:
                 test_file, test_name, status = match.groups()
                 test_results.append({
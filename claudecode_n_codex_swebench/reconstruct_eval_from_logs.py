@@ -11,18 +11,131 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _json_loads(payload):
+    """Parse JSON with orjson when available (raises ValueError on bad input)."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _json_dump(obj: Dict[str, object], f) -> None:
+    """Write indented JSON with a trailing newline, via orjson when available."""
+    if orjson is not None:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    else:
+        json.dump(obj, f, indent=2)
+    f.write("\n")
+
 
 RESULT_RE_TEMPLATE = r"Result for {instance_id}: resolved: (True|False)"
 BOOL_RE = r"(True|False)"
 
+# All four log markers fused into one alternation, compiled once: a single
+# finditer pass over the log replaces four full scans of the same bytes.
+# The instance id is captured instead of interpolated so one pattern serves
+# every instance.
+# Bytes pattern: logs are scanned undecoded (and via mmap on the fallback
+# path), skipping a full UTF-8 decode and the duplicate str heap copy.
+COMBINED_MARKER_RE = re.compile(
+    rb"Result for (?P<iid>[^:\s]+): resolved: (?P<res>True|False)"
+    rb"|'patch_successfully_applied':\s*(?P<pa>True|False)"
+    rb"|'patch_exists':\s*(?P<pe>True|False)"
+    rb"|'patch_is_None':\s*(?P<pn>True|False)"
+)
+
+# Only the last occurrence of each marker matters, and markers cluster near
+# the end of the log; scan this much of the tail before reading everything.
+LOG_TAIL_BYTES = 64 * 1024
+
 
-@dataclass
+_BOOL_TOKEN_WS = b" \t\r\n"
+
+
+def _last_bool_after(data, literal: bytes) -> Optional[bool]:
+    """Parse the True/False token after the last occurrence of a fixed literal.
+
+    bytes.rfind runs at memchr speed, so this skips the regex engine for the
+    common well-formed case; returns None when the literal or token is absent.
+    """
+    idx = data.rfind(literal)
+    if idx == -1:
+        return None
+    pos = idx + len(literal)
+    end = len(data)
+    while pos < end and data[pos:pos + 1] in _BOOL_TOKEN_WS:
+        pos += 1
+    if data[pos:pos + 4] == b"True":
+        return True
+    if data[pos:pos + 5] == b"False":
+        return False
+    return None
+
+
+def _scan_markers(
+    data, instance_id_bytes: bytes
+) -> tuple[Optional[bool], Optional[bool], Optional[bool], Optional[bool]]:
+    """Extract the last occurrence of each log marker from a bytes buffer.
+
+    Fast path: reverse literal searches for the fixed marker prefixes. The
+    combined-regex pass remains as a fallback for logs where the expected
+    signals are not found verbatim.
+    """
+    resolved = _last_bool_after(
+        data, b"Result for " + instance_id_bytes + b": resolved: "
+    )
+    patch_applied = _last_bool_after(data, b"'patch_successfully_applied':")
+    patch_exists = _last_bool_after(data, b"'patch_exists':")
+    patch_is_none = _last_bool_after(data, b"'patch_is_None':")
+
+    if not (
+        resolved is None
+        or patch_applied is None
+        or (patch_exists is None and patch_is_none is None)
+    ):
+        return resolved, patch_applied, patch_exists, patch_is_none
+    return _scan_markers_regex(data, instance_id_bytes)
+
+
+def _scan_markers_regex(
+    data, instance_id_bytes: bytes
+) -> tuple[Optional[bool], Optional[bool], Optional[bool], Optional[bool]]:
+    """Single regex pass keeping the last occurrence of each log marker.
+
+    ``data`` is any bytes-like buffer (bytes or mmap).
+    """
+    resolved = patch_applied = patch_exists = patch_is_none = None
+    for match in COMBINED_MARKER_RE.finditer(data):
+        if match.group("res") is not None:
+            if match.group("iid") == instance_id_bytes:
+                resolved = parse_bool_token(match.group("res"))
+        elif match.group("pa") is not None:
+            patch_applied = parse_bool_token(match.group("pa"))
+        elif match.group("pe") is not None:
+            patch_exists = parse_bool_token(match.group("pe"))
+        else:
+            patch_is_none = parse_bool_token(match.group("pn"))
+    return resolved, patch_applied, patch_exists, patch_is_none
+
+
+# slots: thousands of these are built per reconstruction; dropping the
+# per-instance __dict__ shrinks them and speeds attribute access.
+@dataclass(slots=True)
 class InstanceResult:
     instance_id: str
     resolved: Optional[bool]
@@ -44,8 +157,8 @@ class InstanceResult:
         }
 
 
-def parse_bool_token(token: str) -> bool:
-    return token == "True"
+def parse_bool_token(token) -> bool:
+    return token in ("True", b"True")
 
 
 def read_predictions(predictions_path: Path) -> List[Dict[str, object]]:
@@ -59,8 +172,8 @@ def read_predictions(predictions_path: Path) -> List[Dict[str, object]]:
             if not line:
                 continue
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError as exc:
+                obj = _json_loads(line)
+            except ValueError as exc:
                 raise ValueError(
                     f"Invalid JSON on line {i} in {predictions_path}: {exc}"
                 ) from exc
@@ -75,9 +188,8 @@ def parse_instance_from_report_json(
         return None
 
     try:
-        with report_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
+        data = _json_loads(report_path.read_bytes())
+    except (OSError, ValueError):
         return InstanceResult(
             instance_id=instance_id,
             resolved=None,
@@ -125,28 +237,33 @@ def parse_instance_from_run_log(
             source_report=None,
         )
 
-    text = run_log_path.read_text(encoding="utf-8", errors="ignore")
-
-    resolved_matches = re.findall(
-        RESULT_RE_TEMPLATE.format(instance_id=re.escape(instance_id)), text
-    )
-    resolved = parse_bool_token(resolved_matches[-1]) if resolved_matches else None
-
-    patch_applied_matches = re.findall(
-        rf"'patch_successfully_applied':\s*{BOOL_RE}", text
-    )
-    patch_applied = (
-        parse_bool_token(patch_applied_matches[-1]) if patch_applied_matches else None
+    # The markers sit near EOF in practice, so scan only the file tail first
+    # and pay for a full scan only when something is missing from it. The
+    # fallback mmaps the file rather than reading it: the regex walks the
+    # mapped pages directly with no bytes copy and no decode.
+    instance_id_bytes = instance_id.encode("utf-8")
+    file_size = run_log_path.stat().st_size
+    with run_log_path.open("rb") as f:
+        if file_size > LOG_TAIL_BYTES:
+            f.seek(-LOG_TAIL_BYTES, os.SEEK_END)
+        tail = f.read()
+
+    resolved, patch_applied, patch_exists, patch_is_none = _scan_markers(
+        tail, instance_id_bytes
     )
+    if file_size > LOG_TAIL_BYTES and (
+        resolved is None
+        or patch_applied is None
+        or (patch_exists is None and patch_is_none is None)
+    ):
+        with run_log_path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                resolved, patch_applied, patch_exists, patch_is_none = _scan_markers(
+                    mm, instance_id_bytes
+                )
 
-    patch_exists_matches = re.findall(rf"'patch_exists':\s*{BOOL_RE}", text)
-    patch_exists = (
-        parse_bool_token(patch_exists_matches[-1]) if patch_exists_matches else None
-    )
-    if patch_exists is None:
-        patch_none_matches = re.findall(rf"'patch_is_None':\s*{BOOL_RE}", text)
-        if patch_none_matches:
-            patch_exists = not parse_bool_token(patch_none_matches[-1])
+    if patch_exists is None and patch_is_none is not None:
+        patch_exists = not patch_is_none
     if patch_exists is None:
         patch_exists = patch_from_prediction
 
@@ -162,63 +279,70 @@ def parse_instance_from_run_log(
     )
 
 
-def build_instance_results(
-    predictions_rows: List[Dict[str, object]],
-    eval_log_dir: Path,
-) -> List[InstanceResult]:
-    results: List[InstanceResult] = []
+def _process_prediction_row(
+    row: Dict[str, object], eval_log_dir: Path
+) -> Optional[InstanceResult]:
+    """Resolve one prediction row to an InstanceResult (None when id is missing)."""
+    instance_id = row.get("instance_id")
+    if not isinstance(instance_id, str) or not instance_id:
+        return None
 
-    for row in predictions_rows:
-        instance_id = row.get("instance_id")
-        if not isinstance(instance_id, str) or not instance_id:
-            continue
+    patch_text = row.get("prediction")
+    if patch_text is None:
+        patch_text = row.get("model_patch")
+    patch_exists_from_predictions = (
+        bool(patch_text.strip()) if isinstance(patch_text, str) else None
+    )
 
-        patch_text = row.get("prediction")
-        if patch_text is None:
-            patch_text = row.get("model_patch")
-        patch_exists_from_predictions = (
-            bool(patch_text.strip()) if isinstance(patch_text, str) else None
+    instance_dir = eval_log_dir / instance_id
+    if not instance_dir.exists():
+        return InstanceResult(
+            instance_id=instance_id,
+            resolved=None,
+            patch_exists=patch_exists_from_predictions,
+            patch_successfully_applied=None,
+            parse_status="missing_instance_dir",
+            source_log=None,
+            source_report=None,
         )
 
-        instance_dir = eval_log_dir / instance_id
-        if not instance_dir.exists():
-            results.append(
-                InstanceResult(
-                    instance_id=instance_id,
-                    resolved=None,
-                    patch_exists=patch_exists_from_predictions,
-                    patch_successfully_applied=None,
-                    parse_status="missing_instance_dir",
-                    source_log=None,
-                    source_report=None,
-                )
-            )
-            continue
+    report_result = parse_instance_from_report_json(
+        instance_dir / "report.json", instance_id
+    )
+    if report_result and report_result.parse_status == "ok_report_json":
+        if report_result.patch_exists is None:
+            report_result.patch_exists = patch_exists_from_predictions
+        if report_result.source_log is None:
+            run_log = instance_dir / "run_instance.log"
+            if run_log.exists():
+                report_result.source_log = str(run_log)
+        return report_result
+
+    log_result = parse_instance_from_run_log(
+        instance_dir / "run_instance.log", instance_id, patch_exists_from_predictions
+    )
+    if report_result and report_result.parse_status != "ok_report_json":
+        # Preserve report parsing issue if run log also fails.
+        if log_result.parse_status == "missing_resolution_marker":
+            log_result.parse_status = report_result.parse_status
+        log_result.source_report = report_result.source_report
+    return log_result
 
-        report_result = parse_instance_from_report_json(
-            instance_dir / "report.json", instance_id
-        )
-        if report_result and report_result.parse_status == "ok_report_json":
-            if report_result.patch_exists is None:
-                report_result.patch_exists = patch_exists_from_predictions
-            if report_result.source_log is None:
-                run_log = instance_dir / "run_instance.log"
-                if run_log.exists():
-                    report_result.source_log = str(run_log)
-            results.append(report_result)
-            continue
 
-        log_result = parse_instance_from_run_log(
-            instance_dir / "run_instance.log", instance_id, patch_exists_from_predictions
+def build_instance_results(
+    predictions_rows: List[Dict[str, object]],
+    eval_log_dir: Path,
+) -> List[InstanceResult]:
+    # Rows are independent (one directory stat + two file reads each), so fan
+    # them out across threads; map preserves prediction order. Threads beat a
+    # process pool here: the work is file I/O, not sustained CPU.
+    max_workers = min(32, max(1, len(predictions_rows)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        maybe_results = executor.map(
+            partial(_process_prediction_row, eval_log_dir=eval_log_dir),
+            predictions_rows,
         )
-        if report_result and report_result.parse_status != "ok_report_json":
-            # Preserve report parsing issue if run log also fails.
-            if log_result.parse_status == "missing_resolution_marker":
-                log_result.parse_status = report_result.parse_status
-            log_result.source_report = report_result.source_report
-        results.append(log_result)
-
-    return results
+        return [result for result in maybe_results if result is not None]
 
 
 def aggregate_results(
@@ -230,10 +354,28 @@ def aggregate_results(
     eval_log_dir: Path,
 ) -> Dict[str, object]:
     total_instances = len(results)
-    resolved_instances = sum(1 for r in results if r.resolved is True)
-    unresolved_instances = sum(1 for r in results if r.resolved is False)
+    # One walk over the results accumulates every counter, list and the
+    # per-instance dict instead of five separate passes.
+    resolved_instances = 0
+    unresolved_instances = 0
+    incomplete_instances: List[str] = []
+    instances: Dict[str, Dict[str, object]] = {}
+    for r in results:
+        if r.resolved is True:
+            resolved_instances += 1
+        elif r.resolved is False:
+            unresolved_instances += 1
+        else:
+            incomplete_instances.append(r.instance_id)
+        instances[r.instance_id] = {
+            "resolved": r.resolved,
+            "patch_exists": r.patch_exists,
+            "patch_successfully_applied": r.patch_successfully_applied,
+            "parse_status": r.parse_status,
+            "source_log": r.source_log,
+            "source_report": r.source_report,
+        }
     evaluated_instances = resolved_instances + unresolved_instances
-    incomplete_instances = [r.instance_id for r in results if r.resolved is None]
     resolution_rate = (resolved_instances / total_instances) if total_instances else 0.0
 
     return {
@@ -251,17 +393,7 @@ def aggregate_results(
         "unresolved_instances": unresolved_instances,
         "incomplete_instances": incomplete_instances,
         "resolution_rate": resolution_rate,
-        "instances": {
-            r.instance_id: {
-                "resolved": r.resolved,
-                "patch_exists": r.patch_exists,
-                "patch_successfully_applied": r.patch_successfully_applied,
-                "parse_status": r.parse_status,
-                "source_log": r.source_log,
-                "source_report": r.source_report,
-            }
-            for r in results
-        },
+        "instances": instances,
     }
 
 
@@ -286,8 +418,7 @@ def write_csv(results: List[InstanceResult], output_path: Path) -> None:
 def write_json(output: Dict[str, object], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2)
-        f.write("\n")
+        _json_dump(output, f)
 
 
 def write_reconstructed_report_json(eval_log_dir: Path, results: List[InstanceResult]) -> int:
@@ -298,8 +429,7 @@ def write_reconstructed_report_json(eval_log_dir: Path, results: List[InstanceRe
             continue
         report_path = instance_dir / "report.json"
         with report_path.open("w", encoding="utf-8") as f:
-            json.dump(r.as_report_dict(), f, indent=4)
-            f.write("\n")
+            _json_dump(r.as_report_dict(), f)
         written += 1
     return written
 
@@ -15,6 +15,8 @@ import logging
 import jsonlines
 from datasets import load_dataset
 
+from utils.eval_runtime import default_eval_worker_count
+
 class EnhancedBenchmarkRunner:
     def __init__(self, model=None, backend="claude"):
         self.base_dir = Path.cwd()
@@ -128,7 +130,7 @@ class EnhancedBenchmarkRunner:
         score = (generated / total) * 100
         return score, total
         
-    def run_evaluation(self, prediction_file, dataset_name, max_workers=2):
+    def run_evaluation(self, prediction_file, dataset_name, max_workers=None):
         """Run real SWE-bench evaluation using Docker"""
         print(f"\n🔬 Running real evaluation on {prediction_file}...")
         print("This will test if patches actually fix the issues (takes time)...")
@@ -154,7 +156,8 @@ class EnhancedBenchmarkRunner:
         # Run evaluation
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         run_id = f"{self.backend}_code_{timestamp}"
-        
+        max_workers = max(1, int(max_workers or default_eval_worker_count(instance_count=len(predictions))))
+
         cmd = [
             sys.executable, "-m", "swebench.harness.run_evaluation",
             "--predictions_path", eval_file,
@@ -251,8 +254,8 @@ def main():
                        help="Number of instances to test (default: 5)")
     parser.add_argument("--skip-eval", action="store_true",
                        help="Skip Docker evaluation (faster but no real scores)")
-    parser.add_argument("--max-workers", type=int, default=2,
-                       help="Max parallel Docker containers for evaluation (default: 2)")
+    parser.add_argument("--max-workers", type=int, default=None,
+                       help="Max parallel Docker containers (default: auto from Docker CPU/memory capacity)")
     parser.add_argument("--notes", default="",
                        help="Optional notes about this run")
     
@@ -372,7 +372,7 @@ Examples:
     run_parser.add_argument('--full', action='store_true', help='Full test (300 instances)')
     run_parser.add_argument('--no-eval', action='store_true', help='Skip Docker evaluation')
     run_parser.add_argument('--dataset', default='princeton-nlp/SWE-bench_Lite', help='Dataset to use')
-    run_parser.add_argument('--max-workers', type=int, default=2, help='Max parallel Docker containers')
+    run_parser.add_argument('--max-workers', type=int, default=None, help='Max parallel Docker containers (default: auto from Docker capacity)')
     run_parser.add_argument('--notes', default='', help='Optional notes about this run')
     run_parser.add_argument('--model', type=str, help='Model to use (e.g., opus-4.1, codex-4.2)')
     run_parser.add_argument('--backend', type=str, choices=['claude', 'codex'], help='Code model backend')
@@ -387,7 +387,7 @@ Examples:
     eval_group.add_argument('--pattern', type=str, help='Files matching pattern')
     eval_group.add_argument('--interactive', action='store_true', help='Interactive selection (default)')
     eval_parser.add_argument('--dataset', default='princeton-nlp/SWE-bench_Lite', help='Dataset name')
-    eval_parser.add_argument('--max-workers', type=int, default=2, help='Max parallel Docker containers')
+    eval_parser.add_argument('--max-workers', type=int, default=None, help='Max parallel Docker containers (default: auto from Docker capacity)')
     eval_parser.add_argument('--dry-run', action='store_true', help='Show what would be evaluated')
     eval_parser.add_argument('--no-update-log', action='store_true', help="Don't update log file")
     eval_parser.add_argument('--force', '--yes', action='store_true',
@@ -417,7 +417,7 @@ Examples:
         args.limit = 300
         args.no_eval = False
         args.dataset = 'princeton-nlp/SWE-bench_Lite'
-        args.max_workers = 2
+        args.max_workers = None
         args.notes = 'Full benchmark (default)'
         args.quick = False
         args.standard = False
@@ -439,7 +439,7 @@ Examples:
             limit = 10
             no_eval = False
             dataset = 'princeton-nlp/SWE-bench_Lite'
-            max_workers = 2
+            max_workers = None
             notes = 'Quick test'
             quick = True
             standard = False
@@ -452,7 +452,7 @@ Examples:
             limit = 300
             no_eval = False
             dataset = 'princeton-nlp/SWE-bench_Lite'
-            max_workers = 2
+            max_workers = None
             notes = 'Full benchmark'
             quick = False
             standard = False
@@ -8,7 +8,6 @@ Requires:
 - Ollama running with qwen3.5:35b (or configured model)
 """
 
-import os
 import subprocess
 from typing import Dict, List
 
@@ -44,12 +43,6 @@ class CCRCodeInterface:
             model: Optional model override (ignored, uses CCR config).
         """
         try:
-            # Save the current directory
-            original_cwd = os.getcwd()
-
-            # Change to the working directory
-            os.chdir(cwd)
-
             # Build command - CCR handles model routing via config
             # Use --print and pass prompt via stdin (required by CCR)
             cmd = ["ccr", "code", "--print"]
@@ -63,13 +56,16 @@ class CCRCodeInterface:
             print(f"Prompt preview (first 500 chars):\n{prompt[:500]}")
             print(f"{'='*60}\n")
 
-            # Execute CCR command with prompt via stdin
+            # Execute CCR command with prompt via stdin.
+            # Use cwd= rather than os.chdir: the working directory is
+            # process-wide and instances run on parallel worker threads.
             result = subprocess.run(
                 cmd,
                 input=prompt,  # Pass prompt via stdin
                 capture_output=True,
                 text=True,
                 timeout=600,  # 10 minute timeout
+                cwd=cwd,
             )
 
             # DEBUG: Log result
@@ -84,9 +80,6 @@ class CCRCodeInterface:
                 print(f"Stderr preview (first 500 chars):\n{result.stderr[:500]}")
             print(f"{'='*60}\n")
 
-            # Restore original directory
-            os.chdir(original_cwd)
-
             return {
                 "success": result.returncode == 0,
                 "stdout": result.stdout,
@@ -95,10 +88,6 @@ class CCRCodeInterface:
             }
 
         except subprocess.TimeoutExpired:
-            try:
-                os.chdir(original_cwd)
-            except Exception:
-                pass
             return {
                 "success": False,
                 "stdout": "",
@@ -106,10 +95,6 @@ class CCRCodeInterface:
                 "returncode": -1,
             }
         except Exception as e:
-            try:
-                os.chdir(original_cwd)
-            except Exception:
-                pass
             return {
                 "success": False,
                 "stdout": "",
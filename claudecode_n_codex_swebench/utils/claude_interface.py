@@ -1,4 +1,3 @@
-import os
 import json
 import subprocess
 from typing import Dict, List, Optional
@@ -34,12 +33,6 @@ class ClaudeCodeInterface:
             tdd_mode: Ignored for Claude (TDD mode only applies to Qwen).
         """
         try:
-            # Save the current directory
-            original_cwd = os.getcwd()
-
-            # Change to the working directory
-            os.chdir(cwd)
-
             # Build command with optional model parameter
             cmd = ["claude", "--dangerously-skip-permissions"]
             if model:
@@ -54,13 +47,16 @@ class ClaudeCodeInterface:
             print(f"Prompt preview (first 500 chars):\n{prompt[:500]}")
             print(f"{'='*60}\n")
 
-            # Execute claude command with the prompt via stdin
+            # Execute claude command with the prompt via stdin.
+            # Use cwd= rather than os.chdir: the working directory is
+            # process-wide and instances run on parallel worker threads.
             result = subprocess.run(
                 cmd,
                 input=prompt,
                 capture_output=True,
                 text=True,
                 timeout=600,  # 10 minute timeout
+                cwd=cwd,
             )
 
             # DEBUG: Log result
@@ -75,9 +71,6 @@ class ClaudeCodeInterface:
                 print(f"Stderr preview (first 500 chars):\n{result.stderr[:500]}")
             print(f"{'='*60}\n")
 
-            # Restore original directory
-            os.chdir(original_cwd)
-
             return {
                 "success": result.returncode == 0,
                 "stdout": result.stdout,
@@ -86,11 +79,6 @@ class ClaudeCodeInterface:
             }
 
         except subprocess.TimeoutExpired:
-            # Try to restore directory, but don't fail if it doesn't exist
-            try:
-                os.chdir(original_cwd)
-            except:
-                pass
             return {
                 "success": False,
                 "stdout": "",
@@ -98,11 +86,6 @@ class ClaudeCodeInterface:
                 "returncode": -1,
             }
         except Exception as e:
-            # Try to restore directory, but don't fail if it doesn't exist
-            try:
-                os.chdir(original_cwd)
-            except:
-                pass
             return {
                 "success": False,
                 "stdout": "",
@@ -29,9 +29,9 @@ class PatchExtractor:
                           These need to be staged with git add -N to appear in diff.
         """
         try:
-            # Change to repo directory
-            original_cwd = os.getcwd()
-            os.chdir(repo_path)
+            # Run all git commands with cwd=repo_path instead of os.chdir:
+            # the working directory is process-wide and instances run on
+            # parallel worker threads.
 
             # Stage created files so they appear in git diff
             # Use "git add -N" (intent to add) to make them show up as new files
@@ -41,7 +41,8 @@ class PatchExtractor:
                     add_result = subprocess.run(
                         ["git", "add", "-N", filepath],
                         capture_output=True,
-                        text=True
+                        text=True,
+                        cwd=repo_path
                     )
                     if add_result.returncode == 0:
                         print(f"    ✓ Staged: {filepath}")
@@ -52,7 +53,8 @@ class PatchExtractor:
             status_result = subprocess.run(
                 ["git", "status", "--short"],
                 capture_output=True,
-                text=True
+                text=True,
+                cwd=repo_path
             )
             print(f"\n{'='*60}")
             print(f"DEBUG: Git status before patch extraction:")
@@ -63,7 +65,8 @@ class PatchExtractor:
             result = subprocess.run(
                 ["git", "diff", "HEAD", "--no-color", "--no-ext-diff"],
                 capture_output=True,
-                text=True
+                text=True,
+                cwd=repo_path
             )
 
             # DEBUG: Log patch extraction result
@@ -77,8 +80,6 @@ class PatchExtractor:
                 print("WARNING: No patch generated (empty diff)")
             print(f"{'='*60}\n")
 
-            os.chdir(original_cwd)
-
             if result.returncode == 0:
                 return result.stdout
             else:
@@ -164,17 +165,14 @@ class PatchExtractor:
                 f.write(patch)
                 patch_file = f.name
                 
-            original_cwd = os.getcwd()
-            os.chdir(repo_path)
-            
             # Test patch application
             result = subprocess.run(
                 ["git", "apply", "--check", patch_file],
                 capture_output=True,
-                text=True
+                text=True,
+                cwd=repo_path
             )
-            
-            os.chdir(original_cwd)
+
             os.unlink(patch_file)
             
             if result.returncode == 0: